@@ -0,0 +1,70 @@
+"""
+변화 감지기 벤치마크
+
+유휴 프레임(변화 없음)과 변화 프레임에서 감지기별 호출 시간과
+호출당 메모리 할당 횟수를 측정한다. template이 기존 matchTemplate 방식이다.
+    
+    python benchmarks/bench_change_detector.py --width 400 --height 40
+"""
+
+import argparse
+import tracemalloc
+
+from common import measure, print_table, render_text
+
+from src.core.change_detector import DETECTORS
+
+def count_allocations(func, repeat: int = 50) -> float:
+    """호출당 평균 메모리 할당 블록 수"""
+    func()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(repeat):
+        func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    stats = after.compare_to(before, 'lineno')
+    return sum(max(stat.count_diff, 0) for stat in stats) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description="변화 감지기 벤치마크")
+    parser.add_argument("--width", type=int, default=400)
+    parser.add_argument("--height", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+    
+    size = (args.width, args.height)
+    idle_frame = render_text("[긴급] 서버 점검 안내 10:30", size)
+    changed_frame = render_text("[긴급] 서버 점검 안내 10:31", size)
+    
+    rows = {}
+    for name, detector_class in DETECTORS.items():
+        detector = detector_class()
+        detector.has_changed("region", idle_frame)
+        
+        idle = measure(lambda: detector.has_changed("region", idle_frame), repeat=args.repeat)
+        frames = [idle_frame, changed_frame]
+        state = {"i": 0}
+        
+        def toggle():
+            state["i"] ^= 1
+            return detector.has_changed("region", frames[state["i"]])
+        
+        changed = measure(toggle, repeat=args.repeat)
+        
+        # 1분 차이 시간 문자열을 변화로 잡는지 확인
+        detector.has_changed("region", idle_frame)
+        detected = detector.has_changed("region", changed_frame)
+        
+        rows[name] = {
+            "idle_us": idle["median_ms"] * 1000,
+            "changed_us": changed["median_ms"] * 1000,
+            "idle_allocs": count_allocations(lambda: detector.has_changed("region", idle_frame)),
+            "detects_diff": float(detected),
+        }
+    
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
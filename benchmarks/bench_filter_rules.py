@@ -0,0 +1,84 @@
+"""
+필터 규칙 벤치마크
+
+규칙 10개부터 1,000개까지, 규칙마다 본문을 따로 검사하는 방식(키워드 항목마다
+정규화 후 부분 문자열 검사, 정규식은 매번 컴파일)과 FilterRules(키워드 항목을
+매처 하나로 모아 본문을 한 번만 훑고 규칙은 사전 조회로 단락 평가)를 비교한다.
+두 방식의 일치 규칙이 같은지 확인한다.
+    
+    python benchmarks/bench_filter_rules.py --sizes 10 100 1000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from common import measure, print_table
+
+from src.core.filter_rules import AndNode, FilterRule, FilterRules, KeywordTerm, NotNode, RegexTerm
+from src.core.keyword_matcher import normalize_text
+from src.models.settings import FilterSettings
+
+from bench_keyword_matcher import SYLLABLES, TITLES
+
+def make_rules(count: int, seed: int = 0) -> list:
+    """무작위 키워드/정규식 규칙 (마지막에 실제로 일치하는 규칙 하나)"""
+    rng = random.Random(seed)
+    word = lambda: "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+    rules = []
+    for _ in range(count - 1):
+        shape = rng.random()
+        if shape < 0.4:
+            rules.append(f"({word()} OR {word()}) AND NOT {word()}")
+        elif shape < 0.8:
+            rules.append(f"{word()} {word()}")
+        else:
+            rules.append(f"{word()} /{word()}\\s*\\d+/")
+    rules.append("(긴급 OR urgent) AND NOT 광고")
+    return rules
+
+def naive_evaluate(node, text: str) -> bool:
+    """규칙 하나를 본문에 직접 평가 (키워드마다 정규화, 정규식 매번 컴파일)"""
+    if isinstance(node, KeywordTerm):
+        return normalize_text(node.keyword) in normalize_text(text)
+    if isinstance(node, RegexTerm):
+        return re.compile(node.regex.pattern, node.regex.flags).search(text) is not None
+    if isinstance(node, NotNode):
+        return not naive_evaluate(node.child, text)
+    results = [naive_evaluate(child, text) for child in node.children]
+    return all(results) if type(node) is AndNode else any(results)
+
+def main():
+    parser = argparse.ArgumentParser(description="필터 규칙 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    
+    rows = {}
+    for size in args.sizes:
+        rules = make_rules(size)
+        
+        started = time.perf_counter()
+        compiled = FilterRules(FilterSettings(rules=rules))
+        compile_ms = (time.perf_counter() - started) * 1000
+        
+        parsed = [FilterRule(rule) for rule in rules]
+        naive = lambda title: [rule.text for rule in parsed if naive_evaluate(rule.root, title)]
+        for title in TITLES:
+            assert compiled.find(title) == naive(title), title
+        
+        legacy = measure(lambda: [naive(title) for title in TITLES], repeat=args.repeat)
+        shared = measure(lambda: [compiled.find(title) for title in TITLES], repeat=args.repeat)
+        
+        rows[f"{size} rules"] = {
+            "compile_ms": compile_ms,
+            "per_rule_us": legacy["median_ms"] * 1000 / len(TITLES),
+            "compiled_us": shared["median_ms"] * 1000 / len(TITLES),
+            "speedup": legacy["median_ms"] / max(shared["median_ms"], 1e-9),
+        }
+    
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
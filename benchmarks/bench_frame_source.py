@@ -0,0 +1,73 @@
+"""
+캡처 백엔드 벤치마크
+
+백엔드별로 감시 영역 크기(제목+시간을 감싸는 영역)와 화면 전체 크기의 캡처를
+반복해 초당 캡처 수를 출력한다. 사용할 수 없는 백엔드(디스플레이 없음, mss 미설치
+등)는 이유를 출력하고 건너뛴다. file/video는 합성 프레임을 임시 폴더에 만들어 잰다.
+    
+    python benchmarks/bench_frame_source.py --backends imagegrab mss x11shm file video
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from common import measure, print_table
+
+from src.core.frame_source import create_frame_source
+
+AREAS = {
+    "region": (100, 100, 700, 180),
+    "screen": (0, 0, 1920, 1080),
+}
+
+def make_replay_files(directory: Path, count: int = 30) -> dict:
+    """file/video 백엔드용 합성 프레임 (폴더, 동영상)"""
+    rng = np.random.default_rng(0)
+    frames_dir = directory / "frames"
+    frames_dir.mkdir()
+    writer = cv2.VideoWriter(str(directory / "frames.avi"), cv2.VideoWriter_fourcc(*"MJPG"), 5, (1920, 1080))
+    for index in range(count):
+        frame = np.full((1080, 1920, 3), 255, np.uint8)
+        frame[100:180, 100:700] = rng.integers(0, 255, (80, 600, 3), dtype=np.uint8)
+        Image.fromarray(frame).save(frames_dir / f"{index:04d}.png")
+        writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+    writer.release()
+    return {"file": str(frames_dir), "video": str(directory / "frames.avi")}
+
+def main():
+    parser = argparse.ArgumentParser(description="캡처 백엔드 벤치마크")
+    parser.add_argument("--backends", nargs="+", default=["imagegrab", "mss", "x11shm", "file", "video"])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    
+    rows = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sources = make_replay_files(Path(temp_dir))
+        
+        for name in args.backends:
+            try:
+                frame_source = create_frame_source(name, sources.get(name, ""), loop=True)
+                if frame_source.name != name:
+                    raise RuntimeError(f"{frame_source.name}(으)로 대체됨")
+                frame_source.capture(AREAS["region"])
+            except Exception as e:
+                print(f"[{name}] 건너뜀: {e}")
+                continue
+            
+            row = {}
+            for area_name, area in AREAS.items():
+                result = measure(lambda: frame_source.capture(area), repeat=args.repeat)
+                row[f"{area_name}_ms"] = result["median_ms"]
+                row[f"{area_name}_fps"] = 1000 / max(result["median_ms"], 1e-9)
+            rows[name] = row
+            frame_source.close()
+    
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+시간 영역 글리프 템플릿 인식 벤치마크
+
+글꼴 크기별로 시간 문자열("오후 3:25", "15:25")을 그려, 처음 몇 개는 정답으로
+학습시키고(tesseract가 읽은 결과를 흉내) 나머지를 GlyphTimeRecognizer로 읽는다.
+확신하지 못한 이미지는 tesseract 대체로 세고 정답으로 다시 학습시킨다.
+인식 시간, 적중률(템플릿으로 읽은 비율), 오인식 수를 출력한다.
+한글 글꼴이 없으면 오전/오후가 같은 모양으로 그려져 항상 tesseract로 넘어간다.
+    
+    python benchmarks/bench_glyph_ocr.py --samples 500
+"""
+
+import argparse
+import random
+import time
+
+from common import find_font, print_table, render_text
+
+from src.core.glyph_ocr import GlyphTimeRecognizer
+
+FORMATS = {
+    "ampm": lambda: f"{random.choice(['오전', '오후'])} {random.randint(1, 12)}:{random.randint(0, 59):02d}",
+    "24h": lambda: f"{random.randint(0, 23)}:{random.randint(0, 59):02d}",
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="시간 영역 글리프 인식 벤치마크")
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--learn", type=int, default=5, help="처음에 정답으로 학습시킬 이미지 수")
+    parser.add_argument("--font-sizes", nargs="+", type=int, default=[11, 14, 18])
+    args = parser.parse_args()
+    
+    random.seed(0)
+    rows = {}
+    for font_size in args.font_sizes:
+        font = find_font(font_size)
+        size = (font_size * 8, font_size + 10)
+        for name, make_text in FORMATS.items():
+            recognizer = GlyphTimeRecognizer(min_reads=args.learn)
+            for _ in range(args.learn):
+                text = make_text()
+                recognizer.learn(render_text(text, size, font_size, font), text)
+            
+            wrong = 0
+            elapsed = 0.0
+            for _ in range(args.samples):
+                text = make_text()
+                image = render_text(text, size, font_size, font)
+                started = time.perf_counter()
+                result = recognizer.recognize(image)
+                elapsed += time.perf_counter() - started
+                if result is None:
+                    recognizer.learn(image, text)
+                elif result != text:
+                    wrong += 1
+            
+            stats = recognizer.stats()
+            rows[f"{name}_{font_size}px"] = {
+                "us_per_call": elapsed * 1e6 / args.samples,
+                "hit_rate": stats["hit_rate"],
+                "wrong": wrong,
+                "learned": stats["reads"],
+            }
+    
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+키워드 매처 벤치마크
+
+기존 키워드별 정규화/부분 문자열 검사 루프와 Aho-Corasick 매처를 키워드
+10개부터 10,000개까지 비교한다. 컴파일 시간과 제목 하나당 검사 시간을 출력하고,
+두 방식의 일치 여부가 같은지 확인한다. fuzzy_us는 오타 허용(편집 거리 1) 매처의
+제목 하나당 검사 시간이다.
+    
+    python benchmarks/bench_keyword_matcher.py --sizes 10 100 1000 10000
+"""
+
+import argparse
+import random
+import re
+import time
+
+from common import measure, print_table
+
+from src.core.keyword_matcher import FuzzyKeywordMatcher, KeywordMatcher
+
+SYLLABLES = "가나다라마바사아자차카타파하서버점검긴급장애보고회의결재요청안내"
+ASCII = "abcdefghijklmnopqrstuvwxyz"
+
+TITLES = [
+    "[긴급] 서버 점검 안내 (오늘 22:00)",
+    "RE: 결재 요청 - 3분기 예산안",
+    "주간 회의록 공유드립니다",
+    "[장애] 메일 서버 응답 지연 보고",
+    "Weekly Report: deployment status",
+]
+
+def legacy_normalize(text: str) -> str:
+    """기존 MonitorService._normalize_text"""
+    if not text:
+        return ""
+    normalized = text.lower()
+    normalized = re.sub(r'\s+', ' ', normalized)
+    return normalized.strip()
+
+def legacy_match(text: str, keywords, exact_match: bool = False, case_sensitive: bool = False) -> bool:
+    """기존 MonitorService._check_keyword_match"""
+    if not text or not keywords:
+        return False
+    
+    normalized_text = legacy_normalize(text)
+    for keyword in keywords:
+        normalized_keyword = legacy_normalize(keyword)
+        if exact_match:
+            if (keyword == text) if case_sensitive else (normalized_keyword == normalized_text):
+                return True
+        else:
+            if (keyword in text) if case_sensitive else (normalized_keyword in normalized_text):
+                return True
+    return False
+
+def make_keywords(count: int, seed: int = 0) -> list:
+    """일치하지 않는 키워드 위주의 무작위 키워드 (마지막에 실제 키워드 하나)"""
+    rng = random.Random(seed)
+    keywords = []
+    for _ in range(count - 1):
+        alphabet = SYLLABLES if rng.random() < 0.7 else ASCII
+        keywords.append("".join(rng.choice(alphabet) for _ in range(rng.randint(3, 8))))
+    keywords.append("Deployment")
+    return keywords
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 매처 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    
+    rows = {}
+    for size in args.sizes:
+        keywords = make_keywords(size)
+        
+        started = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        compile_ms = (time.perf_counter() - started) * 1000
+        fuzzy_matcher = FuzzyKeywordMatcher(keywords, max_distance=1)
+        
+        for title in TITLES:
+            assert matcher.matches(title) == legacy_match(title, keywords), title
+        
+        legacy = measure(lambda: [legacy_match(title, keywords) for title in TITLES], repeat=args.repeat)
+        compiled = measure(lambda: [matcher.find(title) for title in TITLES], repeat=args.repeat)
+        fuzzy = measure(lambda: [fuzzy_matcher.find_with_scores(title) for title in TITLES], repeat=args.repeat)
+        
+        rows[f"{size} keywords"] = {
+            "compile_ms": compile_ms,
+            "legacy_us": legacy["median_ms"] * 1000 / len(TITLES),
+            "matcher_us": compiled["median_ms"] * 1000 / len(TITLES),
+            "speedup": legacy["median_ms"] / max(compiled["median_ms"], 1e-9),
+            "fuzzy_us": fuzzy["median_ms"] * 1000 / len(TITLES),
+        }
+    
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+OCR 정확도/지연 시간 벤치마크
+
+corpus/의 라벨된 영역 이미지로 OCR 방식별 실행 시간과 전체 extract_text의
+실행 시간, 문자 단위 정확도를 측정한다. 네트워크 없이 동작하며 결과는
+JSON으로 저장해 커밋 간 비교할 수 있다. 말뭉치 이미지는 커밋하지 않고 실행하는
+곳의 글꼴로 그리므로 결과에 글꼴 경로를 남기고, 글꼴이 다른 결과끼리는 비교하지 않는다.
+    
+    # 측정 후 저장
+    python benchmarks/bench_ocr_accuracy.py --output bench_ocr.json
+    
+    # 이전 결과와 비교 (회귀 시 종료 코드 1)
+    python benchmarks/bench_ocr_accuracy.py --compare bench_ocr_base.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+from PIL import Image
+
+from common import ROOT_DIR, char_accuracy, find_font_path
+from make_corpus import CORPUS_DIR, load_labels, make_corpus
+
+from src.core.ocr_engine import OCREngine
+from src.models.settings import OCRSettings
+from src.utils.tesseract_checker import check_tesseract_installation
+
+def git_revision() -> str:
+    """현재 커밋 해시 (git이 없으면 빈 문자열)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+def summarize(latencies: list, accuracies: list) -> dict:
+    """지연 시간/정확도 요약"""
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "median_ms": statistics.median(latencies),
+        "p95_ms": sorted(latencies)[max(int(len(latencies) * 0.95) - 1, 0)],
+        "accuracy": statistics.mean(accuracies),
+        "exact": sum(1 for a in accuracies if a == 1.0) / len(accuracies),
+    }
+
+def run_benchmark(engine: OCREngine, samples: list, repeat: int) -> dict:
+    """말뭉치 전체 측정"""
+    strategy_latency = {}
+    strategy_accuracy = {}
+    full_latency = []
+    full_accuracy = []
+    sample_results = []
+    
+    for sample in samples:
+        image = np.array(Image.open(os.path.join(CORPUS_DIR, sample["file"])).convert("RGB"))
+        expected = engine._clean_text(sample["text"])
+        region = sample.get("region", "default")
+        
+        # 방식별 단독 실행
+        deadline = time.monotonic() + engine.settings.timeout
+        for method_name, method_func in engine._get_ocr_methods(deadline, region):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = engine._run_method(method_name, method_func, image)
+                strategy_latency.setdefault(method_name, []).append((time.perf_counter() - start) * 1000)
+            text = result.text if result is not None else ""
+            strategy_accuracy.setdefault(method_name, []).append(char_accuracy(text, expected))
+        
+        # 전체 extract_text
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = engine.extract_text(image, region=region)
+            full_latency.append((time.perf_counter() - start) * 1000)
+        accuracy = char_accuracy(text, expected)
+        full_accuracy.append(accuracy)
+        sample_results.append({"file": sample["file"], "expected": expected, "predicted": text, "accuracy": accuracy})
+    
+    return {
+        "strategies": {
+            name: summarize(strategy_latency[name], strategy_accuracy[name]) for name in strategy_latency
+        },
+        "extract_text": summarize(full_latency, full_accuracy),
+        "samples": sample_results,
+    }
+
+def compare(current: dict, baseline: dict, max_latency_regression: float, max_accuracy_drop: float) -> bool:
+    """기준 결과와 비교, 회귀가 없으면 True"""
+    ok = True
+    rows = [("extract_text", current["extract_text"], baseline.get("extract_text"))]
+    rows += [
+        (name, stats, baseline.get("strategies", {}).get(name))
+        for name, stats in current["strategies"].items()
+    ]
+    
+    print(f"\n{'':14}{'median_ms':>22}{'accuracy':>22}")
+    for name, stats, base in rows:
+        if base is None:
+            print(f"{name:14}(기준 없음)")
+            continue
+        
+        latency_change = stats["median_ms"] / base["median_ms"] - 1 if base["median_ms"] else 0.0
+        accuracy_change = stats["accuracy"] - base["accuracy"]
+        flags = []
+        if latency_change > max_latency_regression:
+            flags.append("지연 회귀")
+        if accuracy_change < -max_accuracy_drop:
+            flags.append("정확도 회귀")
+        ok = ok and not flags
+        
+        print(f"{name:14}{base['median_ms']:9.1f} -> {stats['median_ms']:7.1f} ({latency_change:+.0%})"
+              f"{base['accuracy']:9.3f} -> {stats['accuracy']:.3f}  {' '.join(flags)}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 정확도/지연 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=1, help="샘플당 반복 횟수")
+    parser.add_argument("--backend", default="auto")
+    parser.add_argument("--sequential", action="store_true", help="OCR 방식 순차 실행")
+    parser.add_argument("--threshold", type=float, default=OCRSettings.confidence_threshold,
+                        help="조기 종료 신뢰도 (0이면 항상 전체 실행)")
+    parser.add_argument("--region", help="이 영역 샘플만 측정 (title, time)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON")
+    parser.add_argument("--max-latency-regression", type=float, default=0.10)
+    parser.add_argument("--max-accuracy-drop", type=float, default=0.01)
+    args = parser.parse_args()
+    
+    if not check_tesseract_installation():
+        print("Tesseract(한글 언어팩 포함)를 사용할 수 없어 측정할 수 없습니다.")
+        sys.exit(1)
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        # 말뭉치를 다른 글꼴로 그렸으면 정확도와 지연 시간을 비교할 수 없음
+        baseline_font = baseline.get("meta", {}).get("font")
+        if baseline_font != find_font_path():
+            print(f"기준 결과의 말뭉치 글꼴({baseline_font})이 현재 글꼴({find_font_path()})과 달라 비교할 수 없습니다. "
+                  f"BENCH_FONT로 같은 글꼴을 지정하세요.")
+            sys.exit(1)
+    
+    make_corpus()
+    samples = [s for s in load_labels() if not args.region or s.get("region") == args.region]
+    
+    # 캐시와 학습된 순서는 측정을 흐리므로 끔
+    settings = OCRSettings(
+        parallel=not args.sequential, backend=args.backend, cache_size=0,
+        confidence_threshold=args.threshold, adaptive_order=False
+    )
+    engine = OCREngine(settings)
+    
+    result = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "backend": engine.backend.name,
+            "font": find_font_path(),
+            "settings": {
+                "parallel": settings.parallel,
+                "confidence_threshold": settings.confidence_threshold,
+                "max_workers": engine.max_workers,
+            },
+            "samples": len(samples),
+            "repeat": args.repeat,
+        }
+    }
+    result.update(run_benchmark(engine, samples, args.repeat))
+    engine.shutdown()
+    
+    print(f"{'':14}{'median_ms':>12}{'p95_ms':>12}{'accuracy':>12}{'exact':>10}")
+    for name, stats in [("extract_text", result["extract_text"])] + list(result["strategies"].items()):
+        print(f"{name:14}{stats['median_ms']:12.1f}{stats['p95_ms']:12.1f}{stats['accuracy']:12.3f}{stats['exact']:10.2f}")
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    
+    if baseline is not None:
+        if not compare(result, baseline, args.max_latency_regression, args.max_accuracy_drop):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+OCR 백엔드 마이크로벤치마크
+
+pytesseract(호출마다 프로세스 실행)와 tesserocr(프로세스 내 상주 API)를
+같은 영역 이미지로 비교한다.
+    
+    python benchmarks/bench_ocr_backend.py --repeat 30
+"""
+
+import argparse
+
+from common import measure, print_table, render_text
+
+from src.core.ocr_backend import PytesseractBackend, TesserocrBackend, tesserocr
+from src.utils.tesseract_checker import check_tesseract_installation
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 백엔드 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--text", default="[긴급] 서버 점검 안내 Server maintenance")
+    parser.add_argument("--lang", default="kor+eng")
+    args = parser.parse_args()
+    
+    check_tesseract_installation()
+    image = render_text(args.text)
+    
+    backends = [PytesseractBackend()]
+    if tesserocr is not None:
+        backends.append(TesserocrBackend())
+    else:
+        print("tesserocr 미설치 -> pytesseract만 측정합니다.")
+    
+    rows = {}
+    for backend in backends:
+        print(f"[{backend.name}] {backend.image_to_string(image, args.lang).strip()!r}")
+        rows[backend.name] = measure(lambda: backend.image_to_string(image, args.lang), repeat=args.repeat)
+        backend.close()
+    
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+전처리 파이프라인 벤치마크
+
+기존 PIL 기반 전처리(4배 이상 LANCZOS 확대 + 1x1 블러/모폴로지)와 '확대' 방식을
+numpy/OpenCV 파이프라인과 비교한다. 프레임당 시간과 최대 임시 할당량을 출력한다.
+    
+    python benchmarks/bench_preprocess.py --width 400 --height 24
+"""
+
+import argparse
+import tracemalloc
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from common import measure, print_table, render_text
+
+from src.core.preprocess import PreprocessPipeline
+
+def legacy_preprocess(image: np.ndarray) -> np.ndarray:
+    """기존 OCREngine.preprocess_image와 같은 처리"""
+    pil_image = Image.fromarray(image)
+    width, height = pil_image.size
+    scale_factor = max(4, 300 / width)
+    pil_image = pil_image.resize((int(width * scale_factor), int(height * scale_factor)), Image.LANCZOS)
+    gray_image = pil_image.convert('L')
+    img_array = np.array(gray_image)
+    blurred = cv2.GaussianBlur(img_array, (1, 1), 0)
+    adaptive_thresh = cv2.adaptiveThreshold(
+        blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+    )
+    kernel = np.ones((1, 1), np.uint8)
+    morphed = cv2.morphologyEx(adaptive_thresh, cv2.MORPH_CLOSE, kernel)
+    return np.asarray(Image.fromarray(morphed))
+
+def legacy_upscale(image: np.ndarray) -> np.ndarray:
+    """기존 '확대' 방식"""
+    pil_image = Image.fromarray(image)
+    return np.asarray(pil_image.resize((pil_image.width * 3, pil_image.height * 3), Image.LANCZOS))
+
+def peak_allocation_kb(func, repeat: int = 20) -> float:
+    """호출당 최대 추가 할당량(KB), 호출 사이에 해제되는 임시 배열 포함"""
+    func()
+    tracemalloc.start()
+    peaks = []
+    for _ in range(repeat):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - base)
+    tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description="전처리 파이프라인 벤치마크")
+    parser.add_argument("--width", type=int, default=400)
+    parser.add_argument("--height", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    
+    image = render_text("[긴급] 서버 점검 안내 10:30", (args.width, args.height))
+    pipeline = PreprocessPipeline()
+    
+    cases = {
+        "legacy_preprocess": lambda: legacy_preprocess(image),
+        "pipeline_preprocess": lambda: pipeline.preprocess(image, "title"),
+        "legacy_upscale": lambda: legacy_upscale(image),
+        "pipeline_upscale": lambda: pipeline.upscale(image, "title"),
+    }
+    
+    rows = {}
+    for name, func in cases.items():
+        timing = measure(func, repeat=args.repeat)
+        rows[name] = {"median_ms": timing["median_ms"], "peak_alloc_kb": peak_allocation_kb(func)}
+    
+    print_table(rows)
+    
+    # 결과 차이 (이진화 픽셀 불일치 비율)
+    mismatch = np.mean(legacy_preprocess(image) != pipeline.preprocess(image, "title"))
+    print(f"\n전처리 결과 픽셀 불일치: {mismatch:.2%}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
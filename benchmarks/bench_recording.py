@@ -0,0 +1,76 @@
+"""
+프레임 기록/재생 벤치마크
+
+메일 목록처럼 대부분 그대로이고 가끔 한 줄씩 바뀌는 합성 영역 프레임을 기록해
+기록 시간, 압축률, 재생(복원) 속도를 출력한다. 기록 시간이 길수록 실시간 대비
+몇 배 빠르게 같은 화면 흐름을 재현하는지 가늠할 수 있다.
+    
+    python benchmarks/bench_recording.py --frames 600 --interval 1.0
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from common import print_table
+
+from src.core.recording import FrameRecorder, FrameRecording
+
+AREA = (100, 100, 700, 420)
+
+def make_frames(count: int, change_every: int = 20):
+    """합성 영역 프레임 (change_every장마다 맨 윗줄에 새 메일)"""
+    rng = np.random.default_rng(0)
+    height, width = AREA[3] - AREA[1], AREA[2] - AREA[0]
+    frame = np.full((height, width, 3), 255, np.uint8)
+    for index in range(count):
+        if index % change_every == 0:
+            frame = frame.copy()
+            frame[20:height] = frame[0:height - 20]
+            frame[0:20] = rng.integers(0, 255, (20, width, 3), dtype=np.uint8)
+        yield frame
+
+def main():
+    parser = argparse.ArgumentParser(description="프레임 기록/재생 벤치마크")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--interval", type=float, default=1.0, help="기록 시 폴링 간격(초)")
+    args = parser.parse_args()
+    
+    rows = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "bench.emrec"
+        
+        recorder = FrameRecorder(file_path)
+        started = time.perf_counter()
+        raw_bytes = 0
+        for index, frame in enumerate(make_frames(args.frames)):
+            recorder.write(AREA, frame, timestamp=index * args.interval)
+            raw_bytes += frame.nbytes
+        recorder.close()
+        write_seconds = time.perf_counter() - started
+        file_bytes = file_path.stat().st_size
+        
+        recording = FrameRecording(file_path)
+        started = time.perf_counter()
+        for _ in recording:
+            pass
+        read_seconds = time.perf_counter() - started
+        duration = recording.duration
+        recording.close()
+    
+    for name, seconds in (("record", write_seconds), ("replay", read_seconds)):
+        rows[name] = {
+            "ms_per_frame": seconds * 1000 / args.frames,
+            "fps": args.frames / max(seconds, 1e-9),
+            "realtime_x": duration / max(seconds, 1e-9),
+        }
+    
+    print(f"프레임 {args.frames}장: 원본 {raw_bytes / 1e6:.1f}MB -> 기록 파일 {file_bytes / 1e6:.2f}MB "
+          f"(압축률 {raw_bytes / max(file_bytes, 1):.0f}배)")
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+창 이동 추적 벤치마크
+
+합성 바탕화면 위에 메일 창을 그리고 제목 영역의 템플릿을 만든 뒤,
+창이 그대로일 때 매 주기 드는 확인 비용과 창을 무작위 위치로 옮겼을 때
+화면 전체에서 영역을 다시 찾는 시간, 정확도(이동량이 맞은 비율)를 출력한다.
+    
+    python benchmarks/bench_region_tracker.py --moves 50 --screen 1920x1080
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from common import print_table
+
+from src.core.region_tracker import RegionTracker
+
+WINDOW_SIZE = (700, 500)
+WINDOW_POSITION = (200, 100)
+# 창 안에서의 제목 영역 위치
+TITLE = (380, 52, 680, 78)
+
+def make_window() -> np.ndarray:
+    """툴바, 폴더 목록, 메일 목록이 있는 합성 메일 창"""
+    width, height = WINDOW_SIZE
+    window = np.full((height, width, 3), 240, np.uint8)
+    cv2.rectangle(window, (0, 0), (width - 1, 40), (60, 90, 160), -1)
+    cv2.line(window, (170, 40), (170, height - 1), (100, 100, 100), 2)
+    for index in range(14):
+        cv2.putText(window, f"Folder {index}", (8, 70 + index * 30), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (20, 20, 20), 1)
+        cv2.putText(window, f"Mail subject {index}", (180, 70 + index * 30), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)
+    return window
+
+def main():
+    parser = argparse.ArgumentParser(description="창 이동 추적 벤치마크")
+    parser.add_argument("--moves", type=int, default=50)
+    parser.add_argument("--verifies", type=int, default=1000)
+    parser.add_argument("--screen", default="1920x1080")
+    args = parser.parse_args()
+    
+    screen_width, screen_height = map(int, args.screen.split("x"))
+    rng = np.random.default_rng(0)
+    random.seed(0)
+    desktop = rng.integers(0, 60, (screen_height // 8, screen_width // 8, 3), dtype=np.uint8).repeat(8, 0).repeat(8, 1)
+    window = make_window()
+    
+    def draw(position):
+        screen = desktop.copy()
+        x, y = position
+        screen[y:y + WINDOW_SIZE[1], x:x + WINDOW_SIZE[0]] = window
+        return screen
+    
+    screen = draw(WINDOW_POSITION)
+    title = (TITLE[0] + WINDOW_POSITION[0], TITLE[1] + WINDOW_POSITION[1],
+             TITLE[2] + WINDOW_POSITION[0], TITLE[3] + WINDOW_POSITION[1])
+    capture = lambda area: screen[area[1]:area[3], area[0]:area[2]]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tracker = RegionTracker("bench", temp_dir)
+        tracker.sync({'title': title}, capture)
+        
+        def capture_frame():
+            areas = {**tracker.shift({'title': title}), **tracker.anchor_areas()}
+            return {region: capture(area) for region, area in areas.items()}
+        
+        started = time.perf_counter()
+        for _ in range(args.verifies):
+            tracker.verify(capture_frame())
+        verify_seconds = time.perf_counter() - started
+        
+        correct = 0
+        relocate_seconds = 0.0
+        for _ in range(args.moves):
+            position = (random.randint(0, screen_width - WINDOW_SIZE[0]), random.randint(0, screen_height - WINDOW_SIZE[1]))
+            screen = draw(position)
+            for _ in range(tracker.LOST_FRAMES):
+                _, lost = tracker.verify(capture_frame())
+            
+            started = time.perf_counter()
+            offset = tracker.relocate(screen, (0, 0), lost).get('title')
+            relocate_seconds += time.perf_counter() - started
+            if offset == (position[0] - WINDOW_POSITION[0], position[1] - WINDOW_POSITION[1]):
+                correct += 1
+    
+    rows = {
+        "verify": {"ms_per_call": verify_seconds * 1000 / args.verifies},
+        "relocate": {"ms_per_call": relocate_seconds * 1000 / args.moves},
+    }
+    print(f"화면 {args.screen}, 창 이동 {args.moves}회: 이동량 정확히 찾음 {correct}회")
+    print_table(rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
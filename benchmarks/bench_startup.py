@@ -0,0 +1,152 @@
+"""
+시작 시간 벤치마크
+
+새 파이썬 프로세스에서 모듈을 프로그램이 불러오는 순서대로 하나씩 import하며
+모듈별 추가 시간(앞에서 이미 불러온 의존성 제외)과 단독으로 불러올 때의 시간을 재고,
+이어서 설정 로드, Tesseract 확인, OCR 엔진 생성, 첫 프레임 캡처까지의 초기화 시간을 잰다.
+화면 대신 합성 이미지 파일을 캡처하므로 디스플레이 없이도 돈다.
+Tesseract 확인은 확인 결과 캐시가 없을 때(cold)와 있을 때(warm)를 따로 잰다.
+    
+    python benchmarks/bench_startup.py --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from common import ROOT_DIR, print_table
+
+# 프로그램이 불러오는 순서 (tkinter와 src.app은 GUI 모드에서만)
+MODULES = [
+    "src.config",
+    "src.models.settings",
+    "src.utils.tesseract_checker",
+    "numpy",
+    "PIL.Image",
+    "cv2",
+    "pytesseract",
+    "src.core.frame_source",
+    "src.core.ocr_engine",
+    "src.core.monitor_service",
+    "src.services.notification_service",
+    "src.headless",
+    "requests",
+    "tkinter",
+    "src.app",
+]
+
+# 자식 프로세스에서 실행할 측정 코드 (결과는 JSON 한 줄로 출력)
+CHILD_SCRIPT = """
+import importlib, json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+timings = {{}}
+
+def step(name, func):
+    begin = time.perf_counter()
+    result = func()
+    timings[name] = (time.perf_counter() - begin) * 1000
+    return result
+
+for module in {modules!r}:
+    try:
+        step("import " + module, lambda: importlib.import_module(module))
+    except Exception:
+        pass
+
+if {init!r}:
+    from pathlib import Path
+    from src.config import Config
+    from src.models.settings import AppSettings, AreaSettings
+    from src.core.frame_source import create_frame_source
+    from src.core.ocr_engine import OCREngine
+    from src.core.monitor_service import MonitorService
+    from src.core.seen_store import SeenStore
+    from src.utils import tesseract_checker
+    
+    Config.TESSERACT_PROBE_FILE = Path({probe_file!r})
+    path = tesseract_checker.find_tesseract()
+    if path:
+        step("init tesseract probe", lambda: tesseract_checker.probe_tesseract(path))
+    
+    settings = step("init settings load", lambda: AppSettings.load(Path({settings_file!r})))
+    settings.title_area = AreaSettings.from_tuple((100, 100, 700, 140))
+    settings.time_area = AreaSettings.from_tuple((700, 100, 800, 140))
+    engine = step("init ocr engine", lambda: OCREngine(settings.ocr_settings, create_frame_source("file", {frame_file!r})))
+    service = step("init monitor service", lambda: MonitorService(settings, engine, SeenStore()))
+    step("init first frame", lambda: engine.capture_areas(
+        {{"title": settings.title_area.to_tuple(), "time": settings.time_area.to_tuple()}}))
+    timings["time to first frame"] = (time.perf_counter() - started) * 1000
+
+print(json.dumps(timings))
+"""
+
+def run_child(modules, init: bool, temp_dir: Path, probe_file: Path) -> dict:
+    """새 프로세스에서 측정 코드 실행"""
+    script = CHILD_SCRIPT.format(root=ROOT_DIR, modules=modules, init=init, probe_file=str(probe_file),
+                                 settings_file=str(temp_dir / "settings.json"),
+                                 frame_file=str(temp_dir / "frame.png"))
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            cwd=str(temp_dir), check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        probe_file = temp_dir / "tesseract_probe.json"
+        frame = np.full((1080, 1920, 3), 255, np.uint8)
+        Image.fromarray(frame).save(temp_dir / "frame.png")
+        
+        startup = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+            startup.append((time.perf_counter() - started) * 1000)
+        
+        ordered = [run_child(MODULES, True, temp_dir, probe_file) for _ in range(args.repeat)]
+        alone = {module: [run_child([module], False, temp_dir, probe_file).get(f"import {module}")
+                          for _ in range(args.repeat)] for module in MODULES}
+        
+        # 첫 실행에서만 확인 결과 캐시가 없음
+        cold_probe = ordered[0].pop("init tesseract probe", None)
+    
+    print(f"빈 파이썬 프로세스 실행: {statistics.median(startup):.1f}ms (아래 시간에는 포함하지 않음)")
+    rows = {}
+    for module in MODULES:
+        samples = [timings[f"import {module}"] for timings in ordered if f"import {module}" in timings]
+        alone_samples = [value for value in alone[module] if value is not None]
+        if not samples or not alone_samples:
+            print(f"{module}: 불러올 수 없음 (건너뜀)")
+            continue
+        rows[module] = {"ordered_ms": statistics.median(samples), "alone_ms": statistics.median(alone_samples)}
+    print_table(rows)
+    print()
+    
+    init_rows = {}
+    if cold_probe is not None:
+        init_rows["tesseract probe (cold)"] = {"ms": cold_probe}
+    else:
+        print("Tesseract를 찾을 수 없어 확인 시간은 건너뜀")
+    for name in ordered[-1]:
+        if name.startswith("init ") or name == "time to first frame":
+            samples = [timings[name] for timings in ordered if name in timings]
+            label = name[len("init "):] if name.startswith("init ") else name
+            if label == "tesseract probe":
+                label = "tesseract probe (warm)"
+            init_rows[label] = {"ms": statistics.median(samples)}
+    print_table(init_rows)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+벤치마크 공용 유틸리티
+"""
+
+import os
+import sys
+import time
+import statistics
+from typing import Callable, Dict, Optional
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# 프로젝트 루트를 Python path에 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# 한글 글꼴 후보 (Windows, macOS, Linux)
+FONT_CANDIDATES = [
+    r"C:\Windows\Fonts\malgun.ttf",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+]
+
+def find_font_path() -> Optional[str]:
+    """한글 글꼴 경로 (BENCH_FONT 환경 변수 우선)"""
+    font_path = os.environ.get("BENCH_FONT")
+    candidates = [font_path] if font_path else FONT_CANDIDATES
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+def find_font(size: int = 14) -> ImageFont.ImageFont:
+    """사용 가능한 글꼴 반환"""
+    font_path = find_font_path()
+    if font_path:
+        return ImageFont.truetype(font_path, size)
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1
+        return ImageFont.load_default()
+
+def render_text(text: str, size: tuple = (320, 24), font_size: int = 14,
+                font: Optional[ImageFont.ImageFont] = None) -> np.ndarray:
+    """메일 목록 행과 비슷한 RGB 영역 이미지 생성"""
+    image = Image.new("RGB", size, (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+    draw.text((4, (size[1] - font_size) // 2), text, fill=(20, 20, 20), font=font or find_font(font_size))
+    return np.array(image)
+
+def levenshtein(a: str, b: str) -> int:
+    """편집 거리"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+def char_accuracy(predicted: str, expected: str) -> float:
+    """문자 단위 정확도 (1 - 편집 거리 / 정답 길이)"""
+    if not expected:
+        return 1.0 if not predicted else 0.0
+    return max(0.0, 1.0 - levenshtein(predicted, expected) / len(expected))
+
+def measure(func: Callable[[], object], repeat: int = 20, warmup: int = 2) -> Dict[str, float]:
+    """함수 실행 시간 측정 (밀리초)"""
+    for _ in range(warmup):
+        func()
+    
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    
+    return {
+        "mean_ms": statistics.mean(samples),
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+    }
+
+def print_table(rows: Dict[str, Dict[str, float]]):
+    """측정 결과 표 출력"""
+    if not rows:
+        return
+    columns = list(next(iter(rows.values())).keys())
+    name_width = max(len(name) for name in rows) + 2
+    print("".ljust(name_width) + "".join(col.rjust(14) for col in columns))
+    for name, row in rows.items():
+        print(name.ljust(name_width) + "".join(f"{row[col]:14.4f}" for col in columns))
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+OCR 벤치마크 말뭉치 생성
+
+corpus/labels.json의 각 샘플 텍스트를 메일 목록 행과 비슷한 이미지로 그려
+corpus/ 폴더에 저장한다. 한글이 제대로 그려지려면 한글 글꼴이 필요하다
+(BENCH_FONT 환경 변수로 지정 가능). 실제 화면에서 캡처한 영역 이미지를
+같은 이름으로 넣어 두면 그 이미지를 그대로 사용한다.
+    
+    python benchmarks/make_corpus.py [--force]
+"""
+
+import argparse
+import json
+import os
+
+from PIL import Image
+
+from common import find_font_path, render_text
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+LABELS_FILE = os.path.join(CORPUS_DIR, "labels.json")
+
+def load_labels(labels_file: str = LABELS_FILE) -> list:
+    """라벨 목록 로드"""
+    with open(labels_file, "r", encoding="utf-8") as f:
+        return json.load(f)["samples"]
+
+def make_corpus(corpus_dir: str = CORPUS_DIR, force: bool = False) -> int:
+    """없는 샘플 이미지 생성, 생성한 개수 반환"""
+    if find_font_path() is None:
+        print("경고: 한글 글꼴을 찾지 못했습니다. BENCH_FONT로 글꼴 경로를 지정하세요.")
+    
+    created = 0
+    for sample in load_labels(os.path.join(corpus_dir, "labels.json")):
+        path = os.path.join(corpus_dir, sample["file"])
+        if os.path.exists(path) and not force:
+            continue
+        image = render_text(sample["text"], tuple(sample.get("size", (360, 24))))
+        Image.fromarray(image).save(path)
+        created += 1
+    return created
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 벤치마크 말뭉치 생성")
+    parser.add_argument("--force", action="store_true", help="기존 이미지도 다시 생성")
+    args = parser.parse_args()
+    print(f"{make_corpus(force=args.force)}개 이미지 생성")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,51 +1,123 @@
-import tkinter as tk
-import os
-import sys
-import logging
-
-# 프로젝트 루트를 Python path에 추가
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from src.app import EmailMonitorApp
-from src.config import Config
-from src.utils.tesseract_checker import check_tesseract_installation
-
-def setup_logging():
-    """로깅 설정"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('email_monitor.log'),
-            logging.StreamHandler()
-        ]
-    )
-
-def main():
-    """메인 애플리케이션 실행"""
-    setup_logging()
-    logger = logging.getLogger(__name__)
-    
-    try:
-        # Tesseract 설치 확인
-        if not check_tesseract_installation():
-            logger.error("Tesseract 또는 한글팩이 설치되지 않았습니다.")
-            input("Enter 키를 눌러 종료...")
-            return
-        
-        # 애플리케이션 시작
-        root = tk.Tk()
-        app = EmailMonitorApp(root)
-        
-        # 창 닫기 이벤트 처리
-        root.protocol("WM_DELETE_WINDOW", app.on_closing)
-        
-        logger.info("애플리케이션 시작")
-        root.mainloop()
-        
-    except Exception as e:
-        logger.error(f"애플리케이션 실행 중 오류: {e}")
-        input("Enter 키를 눌러 종료...")
-
-if __name__ == "__main__":
+import os
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# tkinter, cv2, numpy, pytesseract 등 무거운 모듈은 실행 모드에 필요한 것만 함수 안에서 불러옴
+# (python benchmarks/bench_startup.py로 모듈별 시간 확인)
+from src.config import Config
+
+def setup_logging(log_file: str = 'email_monitor.log'):
+    """로깅 설정 (log_file이 비어 있으면 표준 출력에만 기록)"""
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file))
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=Config.APP_NAME)
+    parser.add_argument("--headless", action="store_true",
+                        help="화면 없이 백그라운드 서비스로 실행 (tkinter를 불러오지 않음)")
+    parser.add_argument("--settings", default=str(Config.SETTINGS_FILE), help="설정 파일 경로")
+    parser.add_argument("--log-file", default=None,
+                        help="로그 파일 경로 (GUI 기본값 email_monitor.log, 헤드리스 기본값 표준 출력만)")
+    parser.add_argument("--frames", default=None,
+                        help="화면 대신 쓸 이미지 파일, 폴더 또는 동영상 (헤드리스 전용)")
+    parser.add_argument("--loop-frames", action="store_true", help="프레임 폴더를 반복 재생")
+    parser.add_argument("--record", default=None, help="캡처한 프레임을 기록할 파일 경로 (.emrec, 헤드리스 전용)")
+    parser.add_argument("--replay", default=None,
+                        help="기록 파일을 최대한 빠르게 재생해 감지 결과만 출력 (화면/슬랙 사용 안 함)")
+    parser.add_argument("--duration", type=float, default=None, help="지정한 초만큼 실행 후 종료 (헤드리스 전용)")
+    parser.add_argument("--skip-tesseract-check", action="store_true", help="Tesseract 설치 확인 생략")
+    return parser.parse_args(argv)
+
+def run_headless(args: argparse.Namespace) -> int:
+    """헤드리스 모드 실행"""
+    from src.utils.tesseract_checker import check_tesseract_installation
+    
+    logger = logging.getLogger(__name__)
+    if not args.skip_tesseract_check and not check_tesseract_installation():
+        logger.error("Tesseract 또는 한글팩이 설치되지 않았습니다.")
+        return 1
+    
+    import asyncio
+    from src.headless import HeadlessApp
+    from src.core.frame_source import create_frame_source
+    
+    frame_source = create_frame_source("replay", args.frames, args.loop_frames) if args.frames else None
+    app = HeadlessApp(args.settings, frame_source, args.record)
+    if not app.validate():
+        return 1
+    
+    logger.info("헤드리스 모니터링 시작")
+    asyncio.run(app.run(args.duration))
+    return 0
+
+def run_replay(args: argparse.Namespace) -> int:
+    """기록 파일 재생 (알림을 보내지 않고 감지 결과만 출력)"""
+    from src.models.settings import AppSettings
+    from src.core.replay import replay_recording
+    
+    settings = AppSettings.load(Path(args.settings))
+    summary, alerts = replay_recording(settings, Path(args.replay))
+    for timestamp, title_text, time_text, watch_name in alerts:
+        prefix = f"[{watch_name}] " if len(settings.active_watches()) > 1 else ""
+        print(f"{timestamp:.3f}\t{prefix}{title_text}\t{time_text}")
+    return 0
+
+def run_gui(args: argparse.Namespace):
+    """GUI 모드 실행"""
+    from src.utils.tesseract_checker import check_tesseract_installation
+    
+    logger = logging.getLogger(__name__)
+    
+    try:
+        # Tesseract 설치 확인 (결과를 캐시하므로 다시 실행할 때는 tesseract를 띄우지 않음)
+        if not args.skip_tesseract_check and not check_tesseract_installation():
+            logger.error("Tesseract 또는 한글팩이 설치되지 않았습니다.")
+            input("Enter 키를 눌러 종료...")
+            return
+        
+        import tkinter as tk
+        from src.app import EmailMonitorApp
+        
+        # 애플리케이션 시작
+        root = tk.Tk()
+        app = EmailMonitorApp(root)
+        
+        # 창 닫기 이벤트 처리
+        root.protocol("WM_DELETE_WINDOW", app.on_closing)
+        
+        logger.info("애플리케이션 시작")
+        root.mainloop()
+    
+    except Exception as e:
+        logger.error(f"애플리케이션 실행 중 오류: {e}")
+        input("Enter 키를 눌러 종료...")
+
+def main():
+    """메인 애플리케이션 실행"""
+    args = parse_args()
+    
+    if args.replay:
+        setup_logging(args.log_file or '')
+        sys.exit(run_replay(args))
+    
+    if args.headless:
+        setup_logging(args.log_file or '')
+        sys.exit(run_headless(args))
+    
+    setup_logging(args.log_file or 'email_monitor.log')
+    run_gui(args)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
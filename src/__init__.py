@@ -1,6 +1,6 @@
-"""
-이메일 모니터링 프로그램 패키지
-"""
-
-__version__ = "2.0.0"
+"""
+이메일 모니터링 프로그램 패키지
+"""
+
+__version__ = "2.0.0"
 __author__ = "hoony"
\ No newline at end of file
@@ -1,11 +1,11 @@
-"""
-핵심 로직 패키지
-"""
-
-from .ocr_engine import OCREngine
-from .monitor_service import MonitorService
-
-__all__ = [
-'OCREngine',
-'MonitorService'
+"""
+핵심 로직 패키지
+"""
+
+from .ocr_engine import OCREngine
+from .monitor_service import MonitorService
+
+__all__ = [
+'OCREngine',
+'MonitorService'
 ]
\ No newline at end of file
@@ -0,0 +1,297 @@
+import logging
+from typing import Dict, Hashable, List, Optional, Tuple
+import cv2
+import numpy as np
+
+def to_gray(image: np.ndarray) -> np.ndarray:
+    """RGB 이미지를 그레이스케일로 변환"""
+    return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if image.ndim == 3 else image
+
+def template_similarity(img1: np.ndarray, img2: np.ndarray) -> float:
+    """matchTemplate 기반 이미지 유사도 (0~1)"""
+    gray1 = to_gray(img1)
+    gray2 = to_gray(img2)
+    
+    if gray1.shape != gray2.shape:
+        gray2 = cv2.resize(gray2, (gray1.shape[1], gray1.shape[0]))
+    
+    result = cv2.matchTemplate(gray1, gray2, cv2.TM_CCOEFF_NORMED)
+    return max(0, result[0][0])
+
+def mask_to_bands(mask: np.ndarray, scale: int = 1, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+    """True인 연속 행 구간을 (시작, 끝) 픽셀 범위로 변환"""
+    bands = []
+    start = None
+    for index, flag in enumerate(mask.tolist()):
+        if flag and start is None:
+            start = index
+        elif not flag and start is not None:
+            bands.append((start * scale, index * scale))
+            start = None
+    if start is not None:
+        bands.append((start * scale, len(mask) * scale))
+    
+    if limit is not None:
+        bands = [(y0, min(y1, limit)) for y0, y1 in bands if y0 < limit]
+    return bands
+
+def dhash(image: np.ndarray, hash_size: int = 16) -> int:
+    """차분 해시 (hash_size x hash_size 비트)"""
+    small = cv2.resize(to_gray(image), (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = np.packbits(small[:, 1:] > small[:, :-1])
+    return int.from_bytes(bits.tobytes(), 'big')
+
+class ChangeDetector:
+    """화면 변화 감지기 인터페이스
+    
+    영역 키별로 직전 프레임의 서명만 보관하고, 새 프레임의 서명과 비교해
+    변화 여부를 판단한다. 마지막 비교 점수는 last_scores에, 바뀐 가로 띠
+    (행 범위)는 last_bands에 남는다. 행 정보가 없는 감지기는 변화가 있으면
+    영역 전체를 하나의 띠로 보고한다.
+    """
+    
+    name = "base"
+    default_threshold = 0.0
+    
+    def __init__(self, threshold: Optional[float] = None):
+        self.threshold = self.default_threshold if threshold is None else threshold
+        self.logger = logging.getLogger(__name__)
+        self.last_scores: Dict[Hashable, float] = {}
+        self.last_bands: Dict[Hashable, List[Tuple[int, int]]] = {}
+        self._signatures: Dict[Hashable, object] = {}
+    
+    def signature(self, image: np.ndarray):
+        """프레임 서명 계산"""
+        raise NotImplementedError
+    
+    def score(self, old_signature, new_signature) -> float:
+        """두 서명의 차이 점수 (클수록 많이 바뀜)"""
+        raise NotImplementedError
+    
+    def has_changed(self, key: Hashable, image: np.ndarray) -> bool:
+        """직전 프레임 대비 변화 여부"""
+        new_signature = self.signature(image)
+        old_signature = self._signatures.get(key)
+        self._signatures[key] = new_signature
+        
+        if old_signature is None:
+            return self._set_bands(key, image, True)
+        
+        score = self.score(old_signature, new_signature)
+        self.last_scores[key] = score
+        return self._set_bands(key, image, score > self.threshold)
+    
+    def changed_bands(self, key: Hashable) -> List[Tuple[int, int]]:
+        """마지막 비교에서 바뀐 가로 띠 목록"""
+        return self.last_bands.get(key, [])
+    
+    def _set_bands(self, key: Hashable, image: np.ndarray, changed: bool) -> bool:
+        """영역 전체 단위로 띠 기록"""
+        self.last_bands[key] = [(0, image.shape[0])] if changed else []
+        return changed
+    
+    def reset(self):
+        """저장된 서명 초기화"""
+        self._signatures.clear()
+        self.last_scores.clear()
+        self.last_bands.clear()
+
+class TemplateMatchDetector(ChangeDetector):
+    """matchTemplate 유사도 비교 (기존 방식)
+    
+    threshold는 유사도 임계값이며, 유사도가 이보다 낮으면 변화로 본다.
+    """
+    
+    name = "template"
+    default_threshold = 0.95
+    
+    def signature(self, image: np.ndarray):
+        return image
+    
+    def score(self, old_signature, new_signature) -> float:
+        return 1.0 - template_similarity(new_signature, old_signature)
+    
+    def has_changed(self, key: Hashable, image: np.ndarray) -> bool:
+        old_image = self._signatures.get(key)
+        self._signatures[key] = image
+        
+        if old_image is None:
+            return self._set_bands(key, image, True)
+        
+        similarity = template_similarity(image, old_image)
+        self.last_scores[key] = 1.0 - similarity
+        return self._set_bands(key, image, similarity < self.threshold)
+
+class MeanAbsDiffDetector(ChangeDetector):
+    """축소 영상의 블록 평균 절대 차이 비교
+    
+    그레이스케일 영상을 step x step 블록 평균으로 줄인 뒤 블록별 절대 차이의
+    최댓값을 점수로 쓴다. 영역별 버퍼를 미리 만들어 번갈아 쓰므로 유휴
+    프레임에서는 새 배열을 만들지 않는다. threshold는 블록 평균 밝기 차이(0~255)다.
+    """
+    
+    name = "mad"
+    default_threshold = 4.0
+    
+    def __init__(self, threshold: Optional[float] = None, step: int = 4):
+        super().__init__(threshold)
+        self.step = step
+        self._buffers: Dict[Hashable, list] = {}
+    
+    def _allocate(self, image: np.ndarray) -> list:
+        """영역 크기에 맞는 버퍼 생성 [회색조, 이전, 현재, 차이]"""
+        height, width = image.shape[:2]
+        small_shape = (max(height // self.step, 1), max(width // self.step, 1))
+        return [
+            np.empty((height, width), np.uint8),
+            np.empty(small_shape, np.uint8),
+            np.empty(small_shape, np.uint8),
+            np.empty(small_shape, np.uint8)
+        ]
+    
+    def _downsample(self, image: np.ndarray, gray: np.ndarray, out: np.ndarray):
+        """버퍼에 회색조 축소 영상 기록"""
+        if image.ndim == 3:
+            cv2.cvtColor(image, cv2.COLOR_RGB2GRAY, dst=gray)
+        else:
+            np.copyto(gray, image)
+        cv2.resize(gray, (out.shape[1], out.shape[0]), dst=out, interpolation=cv2.INTER_AREA)
+    
+    def has_changed(self, key: Hashable, image: np.ndarray) -> bool:
+        buffers = self._buffers.get(key)
+        
+        if buffers is None or buffers[0].shape != image.shape[:2]:
+            buffers = self._buffers[key] = self._allocate(image)
+            self._downsample(image, buffers[0], buffers[1])
+            return self._set_bands(key, image, True)
+        
+        gray, previous, current, diff = buffers
+        self._downsample(image, gray, current)
+        cv2.absdiff(current, previous, dst=diff)
+        
+        # 다음 비교를 위해 버퍼 교체
+        buffers[1], buffers[2] = current, previous
+        
+        score = float(diff.max())
+        self.last_scores[key] = score
+        changed = score > self.threshold
+        
+        if changed:
+            # 블록 행 단위로 바뀐 띠 계산
+            block_rows = diff.max(axis=1) > self.threshold
+            self.last_bands[key] = mask_to_bands(block_rows, self.step, image.shape[0])
+        else:
+            self.last_bands[key] = []
+        return changed
+    
+    def reset(self):
+        super().reset()
+        self._buffers.clear()
+
+class RowChecksumDetector(ChangeDetector):
+    """행 단위 픽셀 합 비교
+    
+    행마다 픽셀 합과 열 위치 가중(1, 2, ..., n) 합을 함께 저장한다. 픽셀 합만으로는
+    글자가 같은 행 안에서 자리만 바뀌면(밝기 총합이 같으면) 놓치므로, 위치 가중 합을
+    평균 가중치로 나눠 픽셀 합과 같은 단위로 비교한다. 합은 모두 정수로 계산하고
+    가중치와 중간 결과는 영역별 버퍼에 미리 만들어 두므로 유휴 프레임에서는 새 배열을
+    만들지 않는다. threshold는 한 행의 픽셀당 평균 밝기 변화량이며, 어느 한 행에서든
+    두 합 중 하나라도 이를 넘으면 변화로 본다.
+    """
+    
+    name = "rows"
+    default_threshold = 0.5
+    
+    def __init__(self, threshold: Optional[float] = None):
+        super().__init__(threshold)
+        self._buffers: Dict[Hashable, list] = {}
+    
+    def _allocate(self, image: np.ndarray) -> list:
+        """영역 크기에 맞는 버퍼 생성 [가중치, 가중 곱, 이전 합, 이전 가중 합, 현재 합, 현재 가중 합, 점수]"""
+        height = image.shape[0]
+        weights = np.arange(1, image[0].size + 1, dtype=np.int32).reshape(image.shape[1:])
+        return [
+            weights,
+            np.empty(image.shape, np.int32),
+            np.empty(height, np.int64),
+            np.empty(height, np.int64),
+            np.empty(height, np.int64),
+            np.empty(height, np.int64),
+            np.empty(height, np.float64)
+        ]
+    
+    @staticmethod
+    def _measure(image: np.ndarray, weights: np.ndarray, product: np.ndarray, sums: np.ndarray, weighted: np.ndarray):
+        """버퍼에 행별 픽셀 합과 위치 가중 합 기록"""
+        axes = tuple(range(1, image.ndim))
+        np.sum(image, axis=axes, dtype=np.int64, out=sums)
+        np.multiply(image, weights, out=product)
+        np.sum(product, axis=axes, dtype=np.int64, out=weighted)
+    
+    def has_changed(self, key: Hashable, image: np.ndarray) -> bool:
+        buffers = self._buffers.get(key)
+        
+        if buffers is None or buffers[1].shape != image.shape:
+            buffers = self._buffers[key] = self._allocate(image)
+            self._measure(image, buffers[0], buffers[1], buffers[2], buffers[3])
+            return self._set_bands(key, image, True)
+        
+        weights, product, old_sums, old_weighted, sums, weighted, scores = buffers
+        self._measure(image, weights, product, sums, weighted)
+        
+        # 행별 픽셀당 평균 변화량 = max(|합 차이|, |가중 합 차이| / 평균 가중치) / 행 길이
+        length = weights.size
+        np.subtract(old_weighted, weighted, out=old_weighted)
+        np.abs(old_weighted, out=old_weighted)
+        np.subtract(old_sums, sums, out=old_sums)
+        np.abs(old_sums, out=old_sums)
+        np.multiply(old_weighted, 2.0 / (length + 1), out=scores)
+        np.maximum(scores, old_sums, out=scores)
+        np.multiply(scores, 1.0 / max(length, 1), out=scores)
+        
+        # 다음 비교를 위해 버퍼 교체 (차이를 쓴 이전 버퍼는 다음 주기에 덮어씀)
+        buffers[2], buffers[3], buffers[4], buffers[5] = sums, weighted, old_sums, old_weighted
+        
+        score = float(scores.max()) if scores.size else 0.0
+        self.last_scores[key] = score
+        self.last_bands[key] = mask_to_bands(scores > self.threshold) if score > self.threshold else []
+        return bool(self.last_bands[key])
+    
+    def reset(self):
+        super().reset()
+        self._buffers.clear()
+
+class DHashDetector(ChangeDetector):
+    """차분 해시 해밍 거리 비교
+    
+    threshold는 변화로 보지 않을 최대 해밍 거리(비트 수)다.
+    """
+    
+    name = "dhash"
+    default_threshold = 0
+    
+    def __init__(self, threshold: Optional[float] = None, hash_size: int = 16):
+        super().__init__(threshold)
+        self.hash_size = hash_size
+    
+    def signature(self, image: np.ndarray):
+        return image.shape, dhash(image, self.hash_size)
+    
+    def score(self, old_signature, new_signature) -> float:
+        (old_shape, old_hash), (new_shape, new_hash) = old_signature, new_signature
+        if old_shape != new_shape:
+            return float('inf')
+        return bin(old_hash ^ new_hash).count('1')
+
+DETECTORS = {
+    detector.name: detector
+    for detector in (TemplateMatchDetector, MeanAbsDiffDetector, RowChecksumDetector, DHashDetector)
+}
+
+def create_change_detector(name: str = "template", threshold: Optional[float] = None) -> ChangeDetector:
+    """설정 이름으로 변화 감지기 생성"""
+    detector_class = DETECTORS.get(name)
+    if detector_class is None:
+        logging.getLogger(__name__).warning(f"알 수 없는 변화 감지기: {name} -> template 사용")
+        detector_class = TemplateMatchDetector
+    return detector_class(threshold)
\ No newline at end of file
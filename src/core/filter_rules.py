@@ -0,0 +1,353 @@
+import re
+import logging
+from datetime import datetime, time as dtime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from .keyword_matcher import FuzzyKeywordMatcher, KeywordMatcher, create_keyword_matcher
+from ..models.settings import FilterSettings
+
+logger = logging.getLogger(__name__)
+
+# 규칙 토큰: 괄호, "따옴표 구문", /정규식/, 그 밖의 단어
+TOKEN_PATTERN = re.compile(r'''
+    \s*(?:
+        (?P<paren>[()])
+      | "(?P<phrase>(?:[^"\\]|\\.)*)"
+      | /(?P<regex>(?:[^/\\]|\\.)+)/
+      | (?P<word>[^\s()"]+)
+    )''', re.VERBOSE)
+TIME_PATTERN = re.compile(r'^(?:time|시간):(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})$', re.IGNORECASE)
+OPERATORS = {'AND', 'OR', 'NOT'}
+
+@lru_cache(maxsize=None)
+def compile_regex(pattern: str, flags: int = 0) -> 're.Pattern':
+    """정규식 컴파일 (같은 패턴은 모든 규칙과 감시 대상이 공유)"""
+    return re.compile(pattern, flags)
+
+class RuleContext:
+    """규칙 하나를 평가할 때 필요한 값 (본문, 일치 키워드, 현재 시각)"""
+    
+    def __init__(self, text: str, found: Dict[str, int], now: datetime):
+        self.text = text
+        self.found = found
+        self.now = now
+
+class RuleNode:
+    """규칙 식 노드 (cost는 AND/OR 자식 평가 순서를 정하는 대략적인 비용)"""
+    
+    cost = 1
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        raise NotImplementedError
+    
+    def keywords(self) -> List[str]:
+        """식에 쓰인 키워드 항목"""
+        return []
+    
+    def triggers(self) -> Optional[set]:
+        """참이 되려면 하나는 본문에 있어야 하는 키워드 (None이면 제한 없음)"""
+        return None
+
+class KeywordTerm(RuleNode):
+    """키워드 포함 여부 (본문은 규칙 전체에서 한 번만 훑고 여기서는 사전 조회만 함)"""
+    
+    cost = 0
+    
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        return self.keyword in context.found
+    
+    def keywords(self) -> List[str]:
+        return [self.keyword]
+    
+    def triggers(self) -> Optional[set]:
+        return {self.keyword}
+
+class RegexTerm(RuleNode):
+    """정규식 검색 (원문 대상)"""
+    
+    cost = 3
+    
+    def __init__(self, pattern: str, flags: int):
+        self.regex = compile_regex(pattern, flags)
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        return self.regex.search(context.text) is not None
+
+class TimeTerm(RuleNode):
+    """감지 시각이 시간대 안인지 확인 (22:00-06:00처럼 자정을 넘는 구간도 가능)"""
+    
+    cost = 1
+    
+    def __init__(self, start: dtime, end: dtime):
+        self.start = start
+        self.end = end
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        current = context.now.time()
+        if self.start <= self.end:
+            return self.start <= current < self.end
+        return current >= self.start or current < self.end
+
+class NotNode(RuleNode):
+    def __init__(self, child: RuleNode):
+        self.child = child
+        self.cost = child.cost
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        return not self.child.evaluate(context)
+    
+    def keywords(self) -> List[str]:
+        return self.child.keywords()
+
+class AndNode(RuleNode):
+    """모든 자식이 참 (싼 자식부터 평가하고 거짓이 나오면 바로 중단)"""
+    
+    def __init__(self, children: List[RuleNode]):
+        self.children = sorted(children, key=lambda child: child.cost)
+        self.cost = sum(child.cost for child in children)
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        return all(child.evaluate(context) for child in self.children)
+    
+    def keywords(self) -> List[str]:
+        return [keyword for child in self.children for keyword in child.keywords()]
+    
+    def triggers(self) -> Optional[set]:
+        # 자식 중 가장 좁은 조건 하나만 만족해도 필요조건이 됨
+        candidates = [triggers for triggers in (child.triggers() for child in self.children) if triggers is not None]
+        return min(candidates, key=len) if candidates else None
+
+class OrNode(AndNode):
+    """자식 중 하나라도 참 (싼 자식부터 평가하고 참이 나오면 바로 중단)"""
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        return any(child.evaluate(context) for child in self.children)
+    
+    def triggers(self) -> Optional[set]:
+        triggers = set()
+        for child in self.children:
+            child_triggers = child.triggers()
+            if child_triggers is None:
+                return None
+            triggers |= child_triggers
+        return triggers
+
+class FilterRule:
+    """불리언 필터 규칙
+    
+    키워드, "따옴표 구문", /정규식/, time:HH:MM-HH:MM 항목을 AND/OR/NOT과
+    괄호로 묶는다. 연산자 없이 나란히 쓴 항목은 AND로 본다.
+        
+        (긴급 OR urgent) AND NOT 광고
+        "서버 점검" /\\d{2}:\\d{2}/ time:09:00-18:00
+    
+    정규식은 대소문자 구분 설정을 따르고 원문에 대해 검색한다. 키워드 항목은
+    FilterRules가 모든 규칙의 키워드를 한 매처로 모아 본문을 한 번만 훑는다.
+    """
+    
+    def __init__(self, text: str, case_sensitive: bool = False):
+        self.text = text
+        self.case_sensitive = case_sensitive
+        self._tokens = self._tokenize(text)
+        self._position = 0
+        
+        if not self._tokens:
+            raise ValueError("규칙 구문 오류: 빈 규칙")
+        self.root = self._parse_or()
+        if self._position < len(self._tokens):
+            raise ValueError(f"규칙 구문 오류: 예상하지 못한 '{self._tokens[self._position][1]}'")
+        self.keywords = list(dict.fromkeys(self.root.keywords()))
+        self.triggers = self.root.triggers()
+    
+    def _tokenize(self, text: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = TOKEN_PATTERN.match(text, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"규칙 구문 오류: '{text[position:]}'")
+            position = match.end()
+            
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == 'phrase':
+                value = value.replace('\\"', '"')
+            elif kind == 'regex':
+                value = value.replace('\\/', '/')
+            elif value.upper() in OPERATORS:
+                kind, value = 'operator', value.upper()
+            tokens.append((kind, value))
+        return tokens
+    
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+    
+    def _take(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ValueError("규칙 구문 오류: 식이 중간에 끝남")
+        self._position += 1
+        return token
+    
+    def _parse_or(self) -> RuleNode:
+        children = [self._parse_and()]
+        while self._peek() == ('operator', 'OR'):
+            self._take()
+            children.append(self._parse_and())
+        return children[0] if len(children) == 1 else OrNode(children)
+    
+    def _parse_and(self) -> RuleNode:
+        children = [self._parse_not()]
+        while True:
+            token = self._peek()
+            if token == ('operator', 'AND'):
+                self._take()
+            elif token is None or token == ('operator', 'OR') or token == ('paren', ')'):
+                break
+            children.append(self._parse_not())
+        return children[0] if len(children) == 1 else AndNode(children)
+    
+    def _parse_not(self) -> RuleNode:
+        if self._peek() == ('operator', 'NOT'):
+            self._take()
+            return NotNode(self._parse_not())
+        return self._parse_term()
+    
+    def _parse_term(self) -> RuleNode:
+        kind, value = self._take()
+        if kind == 'paren' and value == '(':
+            node = self._parse_or()
+            if self._peek() != ('paren', ')'):
+                raise ValueError("규칙 구문 오류: 닫는 괄호 없음")
+            self._take()
+            return node
+        if kind == 'regex':
+            try:
+                return RegexTerm(value, 0 if self.case_sensitive else re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"규칙 구문 오류: 정규식 /{value}/ ({e})")
+        if kind == 'word':
+            match = TIME_PATTERN.match(value)
+            if match:
+                start_hour, start_minute, end_hour, end_minute = map(int, match.groups())
+                try:
+                    return TimeTerm(dtime(start_hour, start_minute), dtime(end_hour, end_minute))
+                except ValueError:
+                    raise ValueError(f"규칙 구문 오류: 시간 '{value}'")
+        if kind in ('word', 'phrase') and value.strip():
+            return KeywordTerm(value)
+        raise ValueError(f"규칙 구문 오류: 예상하지 못한 '{value}'")
+    
+    def evaluate(self, context: RuleContext) -> bool:
+        return self.root.evaluate(context)
+
+class FilterRules:
+    """키워드 목록과 불리언 규칙을 함께 평가하는 필터
+    
+    모든 규칙의 키워드 항목과 (완전일치가 아니면) 일반 키워드를 매처 하나로
+    컴파일해 본문을 한 번만 훑고, 각 규칙은 그 결과를 사전 조회로 평가한다.
+    규칙은 참이 되는 데 필요한 키워드(triggers)로 색인해 두고, 그 키워드가
+    본문에 있는 규칙만 평가하므로 규칙이 많아도 대부분은 건드리지 않는다.
+    오타 허용/대소문자 구분 설정은 규칙의 키워드 항목에도 적용된다.
+    구문 오류가 있는 규칙은 경고만 남기고 건너뛴다.
+    """
+    
+    def __init__(self, filter_settings: FilterSettings):
+        self.exact_match = filter_settings.exact_match
+        self.keywords = list(filter_settings.keywords)
+        self.rules: List[FilterRule] = []
+        for text in filter_settings.rules:
+            try:
+                self.rules.append(FilterRule(text, filter_settings.case_sensitive))
+            except ValueError as e:
+                logger.warning(f"{e} - {text}")
+        
+        terms = [keyword for rule in self.rules for keyword in rule.keywords]
+        if not self.exact_match:
+            terms.extend(self.keywords)
+        terms = list(dict.fromkeys(terms))
+        
+        self._term_matcher = None
+        if terms:
+            if filter_settings.fuzzy_match:
+                self._term_matcher = FuzzyKeywordMatcher(terms, filter_settings.fuzzy_max_distance,
+                                                         case_sensitive=filter_settings.case_sensitive)
+            else:
+                self._term_matcher = KeywordMatcher(terms, case_sensitive=filter_settings.case_sensitive)
+        
+        # 완전일치는 제목 전체 비교라 규칙 항목과 합칠 수 없으므로 따로 둠
+        self._exact_matcher = None
+        if self.exact_match and self.keywords:
+            self._exact_matcher = create_keyword_matcher(filter_settings)
+        self._keyword_set = set(self.keywords)
+        
+        # 필요 키워드 -> 규칙 번호, 필요 키워드가 없는 규칙은 항상 평가
+        self._rule_index: Dict[str, List[int]] = {}
+        self._always_rules: List[int] = []
+        for rule_id, rule in enumerate(self.rules):
+            if rule.triggers is None:
+                self._always_rules.append(rule_id)
+                continue
+            for keyword in rule.triggers:
+                self._rule_index.setdefault(keyword, []).append(rule_id)
+    
+    @staticmethod
+    def signature(filter_settings: FilterSettings) -> Tuple:
+        """다시 컴파일해야 하는지 판단할 설정 서명"""
+        return KeywordMatcher.signature(filter_settings) + (tuple(filter_settings.rules),)
+    
+    def find_with_scores(self, text: str, now: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """일치한 키워드와 규칙, 편집 거리 목록
+        
+        규칙의 거리는 규칙 안에서 일치한 키워드 항목 중 가장 큰 거리다.
+        """
+        if not text:
+            return []
+        
+        found = dict(self._term_matcher.find_with_scores(text)) if self._term_matcher else {}
+        if self._exact_matcher is not None:
+            matches = self._exact_matcher.find_with_scores(text)
+        else:
+            matches = [(keyword, distance) for keyword, distance in found.items() if keyword in self._keyword_set]
+        
+        candidates = set(self._always_rules)
+        for keyword in found:
+            candidates.update(self._rule_index.get(keyword, ()))
+        if candidates:
+            context = RuleContext(text, found, now or datetime.now())
+            for rule_id in sorted(candidates):
+                rule = self.rules[rule_id]
+                if rule.evaluate(context):
+                    distance = max((found[keyword] for keyword in rule.keywords if keyword in found), default=0)
+                    matches.append((rule.text, distance))
+        return matches
+    
+    def find(self, text: str, now: Optional[datetime] = None) -> List[str]:
+        """일치한 키워드와 규칙 목록"""
+        return [label for label, _ in self.find_with_scores(text, now)]
+    
+    def matches(self, text: str, now: Optional[datetime] = None) -> bool:
+        """키워드나 규칙이 하나라도 일치하는지 확인"""
+        return bool(self.find_with_scores(text, now))
+
+def compile_filter(filter_settings: FilterSettings) -> FilterRules:
+    """필터 설정 컴파일 (같은 설정의 감시 대상끼리 컴파일 결과를 공유)"""
+    return _compile_filter(FilterRules.signature(filter_settings))
+
+@lru_cache(maxsize=64)
+def _compile_filter(signature: Tuple) -> FilterRules:
+    keywords, exact_match, case_sensitive, fuzzy_match, fuzzy_max_distance, rules = signature
+    return FilterRules(FilterSettings(
+        keywords=list(keywords),
+        exact_match=exact_match,
+        case_sensitive=case_sensitive,
+        fuzzy_match=fuzzy_match,
+        fuzzy_max_distance=fuzzy_max_distance,
+        rules=list(rules)
+    ))
\ No newline at end of file
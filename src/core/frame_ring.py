@@ -0,0 +1,222 @@
+import os
+import mmap
+import time
+import struct
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional, Tuple
+import numpy as np
+from .frame_source import FrameSource
+from .recording import FrameRecorder
+
+# 파일 머리말 (매직, 칸 수, 데이터 영역 크기)
+RING_MAGIC = b'EMRING1\n'
+RING_HEADER = struct.Struct('<8sQQ')
+# 칸 (순번, 시각, 캡처 좌표 4개, 높이, 너비, 채널, 데이터 위치), 순번 0은 빈 칸
+RING_SLOT = struct.Struct('<Qd4i3IQ')
+
+class FrameRingBuffer:
+    """최근 캡처 프레임을 고정 크기 mmap 파일에 순환 기록
+    
+    파일은 머리말, 프레임 메타데이터 칸 목록, 데이터 영역으로 나뉜다. 새 프레임은
+    데이터 영역의 다음 위치에 그대로 쓰고, 끝에 닿으면 처음으로 돌아가며 덮어쓰는
+    범위의 가장 오래된 프레임부터 버린다. 파일 크기는 생성할 때 정해지므로
+    메모리 사용량은 기록 시간과 관계없이 일정하다.
+    
+    캡처 경로에서는 캡처한 배열을 mmap 위의 numpy 뷰로 한 번 복사할 뿐
+    중간 바이트열이나 압축을 만들지 않는다. 압축은 dump()에서만 한다.
+    메타데이터도 파일에 있으므로 프로그램이 죽은 뒤에도 read_frames()로 읽을 수 있다.
+    시작할 때 이전 실행의 링 버퍼 파일이 있으면 '.prev'를 붙인 이름으로 옮겨 두므로
+    다시 시작해도 직전 실행의 마지막 화면이 남는다.
+    """
+    
+    def __init__(self, file_path, capacity_mb: int = 256, slots: int = 8192, clock=time.time):
+        self.file_path = Path(file_path)
+        self.slots = slots
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        
+        self.data_offset = RING_HEADER.size + RING_SLOT.size * slots
+        self.data_size = capacity_mb * 1024 * 1024
+        size = self.data_offset + self.data_size
+        
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._keep_previous()
+        self._file = open(self.file_path, 'w+b')
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        RING_HEADER.pack_into(self._mmap, 0, RING_MAGIC, slots, self.data_size)
+        self._data = np.frombuffer(self._mmap, dtype=np.uint8, count=self.data_size, offset=self.data_offset)
+        
+        # 살아 있는 프레임 (순번, 데이터 위치, 길이), 오래된 것부터
+        self._live: Deque[Tuple[int, int, int]] = deque()
+        self._sequence = 0
+        self._write_position = 0
+        self._lock = threading.Lock()
+        self._oversize_warned = False
+    
+    def __len__(self) -> int:
+        return len(self._live)
+    
+    @property
+    def previous_path(self) -> Path:
+        """직전 실행의 링 버퍼 파일 경로"""
+        return self.file_path.with_name(self.file_path.name + '.prev')
+    
+    def _keep_previous(self):
+        """이전 실행의 링 버퍼 파일을 덮어쓰지 않도록 옮겨 둠 (링 버퍼 파일이 아니면 그대로 덮어씀)"""
+        try:
+            with open(self.file_path, 'rb') as file:
+                magic = file.read(len(RING_MAGIC))
+        except OSError:
+            return
+        if magic != RING_MAGIC:
+            return
+        try:
+            os.replace(self.file_path, self.previous_path)
+            self.logger.info(f"이전 링 버퍼 보관: {self.previous_path}")
+        except OSError as e:
+            self.logger.warning(f"이전 링 버퍼 보관 실패: {e}")
+    
+    def _slot_offset(self, sequence: int) -> int:
+        return RING_HEADER.size + RING_SLOT.size * (sequence % self.slots)
+    
+    def _evict_oldest(self):
+        sequence, _, _ = self._live.popleft()
+        RING_SLOT.pack_into(self._mmap, self._slot_offset(sequence), 0, 0.0, 0, 0, 0, 0, 0, 0, 0, 0)
+    
+    def write(self, area: Tuple[int, int, int, int], image: np.ndarray, timestamp: Optional[float] = None):
+        """프레임 하나 기록 (가장 오래된 프레임을 덮어씀)"""
+        length = image.nbytes
+        if length > self.data_size:
+            if not self._oversize_warned:
+                self.logger.warning(f"프레임({length}바이트)이 링 버퍼보다 커서 기록하지 않습니다.")
+                self._oversize_warned = True
+            return
+        
+        height, width = image.shape[:2]
+        channels = image.shape[2] if image.ndim == 3 else 1
+        with self._lock:
+            if self._mmap is None:
+                return
+            
+            start = self._write_position
+            wrapped = start + length > self.data_size
+            if wrapped:
+                start = 0
+            end = start + length
+            
+            # 덮어쓸 범위에 걸친 프레임과 칸이 모자라면 가장 오래된 프레임부터 버림
+            # (끝에서 처음으로 돌아갈 때는 남은 꼬리 부분의 프레임이 가장 오래됨)
+            while self._live:
+                _, offset, size = self._live[0]
+                if len(self._live) >= self.slots or (offset < end and offset + size > start) \
+                        or (wrapped and offset >= self._write_position):
+                    self._evict_oldest()
+                else:
+                    break
+            
+            target = self._data[start:end].reshape(image.shape)
+            np.copyto(target, image, casting='no')
+            
+            self._sequence += 1
+            RING_SLOT.pack_into(self._mmap, self._slot_offset(self._sequence), self._sequence,
+                                self.clock() if timestamp is None else timestamp,
+                                *area, height, width, channels, start)
+            self._live.append((self._sequence, start, length))
+            self._write_position = end
+    
+    def snapshot(self, start_time: float = float('-inf'),
+                 end_time: float = float('inf')) -> List[Tuple[float, Tuple[int, int, int, int], np.ndarray]]:
+        """시간 범위 안의 프레임 복사본 목록 (시각, 캡처 좌표, 이미지), 오래된 것부터"""
+        frames = []
+        with self._lock:
+            if self._mmap is None:
+                return frames
+            for sequence, _, _ in self._live:
+                timestamp, area, image = self._read_slot(sequence)
+                if start_time <= timestamp <= end_time:
+                    frames.append((timestamp, area, image.copy()))
+        return frames
+    
+    def _read_slot(self, sequence: int) -> Tuple[float, Tuple[int, int, int, int], np.ndarray]:
+        fields = RING_SLOT.unpack_from(self._mmap, self._slot_offset(sequence))
+        timestamp, area = fields[1], tuple(fields[2:6])
+        height, width, channels, offset = fields[6:10]
+        shape = (height, width, channels) if channels > 1 else (height, width)
+        image = self._data[offset:offset + height * width * channels].reshape(shape)
+        return timestamp, area, image
+    
+    def dump(self, file_path, start_time: float = float('-inf'), end_time: float = float('inf')) -> int:
+        """시간 범위 안의 프레임을 기록 파일(.emrec)로 저장하고 저장한 프레임 수 반환
+        
+        저장한 파일은 replay(python main.py --replay)로 그대로 재생할 수 있다.
+        """
+        frames = self.snapshot(start_time, end_time)
+        if not frames:
+            return 0
+        
+        recorder = FrameRecorder(file_path)
+        for timestamp, area, image in frames:
+            recorder.write(area, image, timestamp)
+        recorder.close()
+        return len(frames)
+    
+    def close(self):
+        with self._lock:
+            if self._mmap is None:
+                return
+            self._data = None
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+            self._file.close()
+    
+    @staticmethod
+    def read_frames(file_path) -> List[Tuple[float, Tuple[int, int, int, int], np.ndarray]]:
+        """링 버퍼 파일에 남아 있는 프레임 읽기 (비정상 종료 후 확인용), 오래된 것부터"""
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        magic, slots, data_size = RING_HEADER.unpack_from(data, 0)
+        if magic != RING_MAGIC:
+            raise ValueError(f"링 버퍼 파일이 아닙니다: {file_path}")
+        
+        data_offset = RING_HEADER.size + RING_SLOT.size * slots
+        entries = []
+        for index in range(slots):
+            fields = RING_SLOT.unpack_from(data, RING_HEADER.size + RING_SLOT.size * index)
+            if fields[0]:
+                entries.append(fields)
+        entries.sort()
+        
+        frames = []
+        for fields in entries:
+            height, width, channels, offset = fields[6:10]
+            shape = (height, width, channels) if channels > 1 else (height, width)
+            start = data_offset + offset
+            image = np.frombuffer(data, dtype=np.uint8, count=height * width * channels, offset=start).reshape(shape)
+            frames.append((fields[1], tuple(fields[2:6]), image))
+        return frames
+
+class RingBufferFrameSource(FrameSource):
+    """다른 프레임 공급원의 캡처를 그대로 돌려주면서 링 버퍼에 기록"""
+    
+    def __init__(self, source: FrameSource, ring: FrameRingBuffer):
+        self.source = source
+        self.name = source.name
+        self.ring = ring
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        image = self.source.capture(area)
+        if image is not None and image.dtype == np.uint8:
+            self.ring.write(area, image)
+        return image
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        return self.source.screen_bounds()
+    
+    def close(self):
+        self.ring.close()
+        self.source.close()
\ No newline at end of file
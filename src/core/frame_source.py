@@ -0,0 +1,470 @@
+import os
+import sys
+import ctypes
+import ctypes.util
+import logging
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+import cv2
+import numpy as np
+from PIL import Image, ImageGrab
+
+try:
+    import mss
+except ImportError:  # 선택 의존성
+    mss = None
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp'}
+VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mkv', '.mov', '.webm'}
+# 프레임 기록 파일 확장자 (recording.FrameRecorder)
+RECORDING_EXTENSION = '.emrec'
+
+class FrameSource:
+    """화면 프레임 공급원
+    
+    capture()는 화면 좌표 (x1, y1, x2, y2) 영역을 RGB numpy 배열로 돌려준다.
+    OCREngine은 캡처를 모두 이 인터페이스로 하므로 실제 화면 대신 파일이나
+    녹화본으로 모니터링을 돌릴 수 있다. 돌려준 배열은 호출한 쪽이 직전 이미지로
+    보관하므로 다음 캡처에서 덮어쓰지 않는다.
+    """
+    
+    name = "base"
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        raise NotImplementedError
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """화면 전체 좌표 (영역 위치를 다시 찾을 때 사용, 알 수 없으면 None)"""
+        width, height = ImageGrab.grab().size
+        return (0, 0, width, height)
+    
+    def close(self):
+        """자원 정리"""
+        pass
+
+class ImageGrabFrameSource(FrameSource):
+    """PIL ImageGrab으로 실제 화면 캡처 (기존 동작)"""
+    
+    name = "imagegrab"
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        return np.array(ImageGrab.grab(bbox=area))
+
+class MssFrameSource(FrameSource):
+    """mss로 화면 캡처 (Windows GDI, macOS CoreGraphics, X11 XGetImage)
+    
+    mss 인스턴스는 스레드 사이에 공유할 수 없으므로 스레드마다 하나씩 만든다.
+    """
+    
+    name = "mss"
+    
+    def __init__(self):
+        if mss is None:
+            raise RuntimeError("mss가 설치되어 있지 않습니다.")
+        self._local = threading.local()
+        self._instances = []
+        self._instances_lock = threading.Lock()
+    
+    def _get_instance(self):
+        instance = getattr(self._local, 'instance', None)
+        if instance is None:
+            instance = mss.mss()
+            self._local.instance = instance
+            with self._instances_lock:
+                self._instances.append(instance)
+        return instance
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        x1, y1, x2, y2 = area
+        shot = self._get_instance().grab({'left': x1, 'top': y1, 'width': x2 - x1, 'height': y2 - y1})
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2RGB)
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        # monitors[0]은 모든 모니터를 합친 가상 화면
+        monitor = self._get_instance().monitors[0]
+        left, top = monitor['left'], monitor['top']
+        return (left, top, left + monitor['width'], top + monitor['height'])
+    
+    def close(self):
+        with self._instances_lock:
+            for instance in self._instances:
+                instance.close()
+            self._instances = []
+
+class _XImage(ctypes.Structure):
+    """Xlib XImage 앞부분 (필요한 필드까지만)"""
+    _fields_ = [
+        ('width', ctypes.c_int),
+        ('height', ctypes.c_int),
+        ('xoffset', ctypes.c_int),
+        ('format', ctypes.c_int),
+        ('data', ctypes.c_void_p),
+        ('byte_order', ctypes.c_int),
+        ('bitmap_unit', ctypes.c_int),
+        ('bitmap_bit_order', ctypes.c_int),
+        ('bitmap_pad', ctypes.c_int),
+        ('depth', ctypes.c_int),
+        ('bytes_per_line', ctypes.c_int),
+        ('bits_per_pixel', ctypes.c_int),
+    ]
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ('shmseg', ctypes.c_ulong),
+        ('shmid', ctypes.c_int),
+        ('shmaddr', ctypes.c_void_p),
+        ('readOnly', ctypes.c_int),
+    ]
+
+class X11ShmFrameSource(FrameSource):
+    """X11 MIT-SHM 확장으로 화면 캡처 (Linux)
+    
+    X 서버와 공유 메모리 세그먼트 하나를 만들어 두고 XShmGetImage로 그 안에
+    바로 화면을 받으므로, XGetImage처럼 소켓으로 픽셀을 복사해 오지 않는다.
+    캡처 영역 크기가 같으면 세그먼트를 계속 재사용하고(감시 영역은 보통 고정),
+    크기가 바뀔 때만 다시 만든다. 돌려주는 RGB 배열은 호출마다 새로 만든다.
+    """
+    
+    name = "x11shm"
+    
+    ZPIXMAP = 2
+    ALL_PLANES = ctypes.c_ulong(-1).value
+    IPC_PRIVATE = 0
+    IPC_CREAT = 0o1000
+    IPC_RMID = 0
+    
+    def __init__(self, display: Optional[str] = None):
+        if not sys.platform.startswith('linux'):
+            raise RuntimeError("X11 공유 메모리 캡처는 Linux에서만 사용할 수 있습니다.")
+        
+        xlib_path = ctypes.util.find_library('X11')
+        xext_path = ctypes.util.find_library('Xext')
+        if not xlib_path or not xext_path:
+            raise RuntimeError("libX11/libXext를 찾을 수 없습니다.")
+        
+        self.xlib = ctypes.CDLL(xlib_path)
+        self.xext = ctypes.CDLL(xext_path)
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._declare_functions()
+        
+        self.display = self.xlib.XOpenDisplay(display.encode() if display else None)
+        if not self.display:
+            raise RuntimeError(f"X 디스플레이에 연결할 수 없습니다: {display or os.environ.get('DISPLAY', '')}")
+        if not self.xext.XShmQueryExtension(self.display):
+            self.xlib.XCloseDisplay(self.display)
+            raise RuntimeError("X 서버가 MIT-SHM 확장을 지원하지 않습니다.")
+        
+        screen = self.xlib.XDefaultScreen(self.display)
+        self.screen_size = (self.xlib.XDisplayWidth(self.display, screen), self.xlib.XDisplayHeight(self.display, screen))
+        self.root = self.xlib.XRootWindow(self.display, screen)
+        self.visual = self.xlib.XDefaultVisual(self.display, screen)
+        self.depth = self.xlib.XDefaultDepth(self.display, screen)
+        
+        self._image = None
+        self._shminfo = _XShmSegmentInfo()
+        self._size: Optional[Tuple[int, int]] = None
+        self._buffer: Optional[np.ndarray] = None
+        # Xlib 디스플레이 연결은 스레드 안전하지 않음
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+    
+    def _declare_functions(self):
+        xlib, xext, libc = self.xlib, self.xext, self.libc
+        xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        xlib.XOpenDisplay.restype = ctypes.c_void_p
+        xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        xlib.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        xlib.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XRootWindow.restype = ctypes.c_ulong
+        xlib.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDefaultVisual.restype = ctypes.c_void_p
+        xlib.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XFree.argtypes = [ctypes.c_void_p]
+        
+        xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        xext.XShmCreateImage.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+                                         ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo),
+                                         ctypes.c_uint, ctypes.c_uint]
+        xext.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmGetImage.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XImage),
+                                      ctypes.c_int, ctypes.c_int, ctypes.c_ulong]
+        
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+    
+    def _allocate(self, width: int, height: int):
+        """영역 크기의 공유 메모리 이미지 생성 (크기가 같으면 재사용)"""
+        if self._size == (width, height):
+            return
+        self._release()
+        
+        image = self.xext.XShmCreateImage(self.display, self.visual, self.depth, self.ZPIXMAP,
+                                          None, ctypes.byref(self._shminfo), width, height)
+        if not image:
+            raise RuntimeError("XShmCreateImage 실패")
+        if image.contents.bits_per_pixel != 32:
+            self.xlib.XFree(image)
+            raise RuntimeError(f"지원하지 않는 픽셀 형식: {image.contents.bits_per_pixel}bpp")
+        
+        size = image.contents.bytes_per_line * height
+        shmid = self.libc.shmget(self.IPC_PRIVATE, size, self.IPC_CREAT | 0o600)
+        if shmid < 0:
+            self.xlib.XFree(image)
+            raise OSError(ctypes.get_errno(), "shmget 실패")
+        
+        address = self.libc.shmat(shmid, None, 0)
+        if address in (None, ctypes.c_void_p(-1).value):
+            self.libc.shmctl(shmid, self.IPC_RMID, None)
+            self.xlib.XFree(image)
+            raise OSError(ctypes.get_errno(), "shmat 실패")
+        
+        self._shminfo.shmid = shmid
+        self._shminfo.shmaddr = address
+        self._shminfo.readOnly = 0
+        image.contents.data = address
+        self.xext.XShmAttach(self.display, ctypes.byref(self._shminfo))
+        self.xlib.XSync(self.display, 0)
+        # 프로세스가 비정상 종료되어도 세그먼트가 남지 않도록 바로 삭제 표시
+        self.libc.shmctl(shmid, self.IPC_RMID, None)
+        
+        bytes_per_line = image.contents.bytes_per_line
+        raw = (ctypes.c_ubyte * size).from_address(address)
+        self._buffer = np.frombuffer(raw, dtype=np.uint8).reshape(height, bytes_per_line // 4, 4)[:, :width]
+        self._image = image
+        self._size = (width, height)
+    
+    def _release(self):
+        if self._image is None:
+            return
+        self.xext.XShmDetach(self.display, ctypes.byref(self._shminfo))
+        self.xlib.XSync(self.display, 0)
+        self.libc.shmdt(self._shminfo.shmaddr)
+        self.xlib.XFree(self._image)
+        self._image = None
+        self._buffer = None
+        self._size = None
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        # 화면 밖 좌표로 XShmGetImage를 부르면 BadMatch 오류로 프로세스가 끝나므로
+        # 화면 안으로 잘라서 요청한다 (영역 추적 여백 때문에 가장자리를 넘기 쉬움)
+        width, height = self.screen_size
+        x1, y1, x2, y2 = max(area[0], 0), max(area[1], 0), min(area[2], width), min(area[3], height)
+        if (x1, y1, x2, y2) != tuple(area):
+            self.logger.warning(f"캡처 영역이 화면({width}x{height}) 밖입니다: {area}")
+        if x2 <= x1 or y2 <= y1:
+            return None
+        with self._lock:
+            if not self.display:
+                return None
+            self._allocate(x2 - x1, y2 - y1)
+            if not self.xext.XShmGetImage(self.display, self.root, self._image, x1, y1, self.ALL_PLANES):
+                return None
+            # 공유 버퍼는 다음 캡처에서 덮어쓰므로 변환 결과는 새 배열
+            image = cv2.cvtColor(self._buffer, cv2.COLOR_BGRA2RGB)
+        return pad_to_area(image, area, (x1, y1))
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        return (0, 0) + self.screen_size
+    
+    def close(self):
+        with self._lock:
+            if self.display:
+                self._release()
+                self.xlib.XCloseDisplay(self.display)
+                self.display = None
+
+class FileFrameSource(FrameSource):
+    """이미지 파일이나 폴더를 화면 대신 쓰는 프레임 공급원
+    
+    파일 하나면 파일이 바뀔 때(mtime)마다 다시 읽으므로 다른 프로그램이 덮어쓰는
+    스크린샷을 감시할 수 있다. 폴더면 이미지를 이름 순서대로 캡처 호출마다 한 장씩
+    넘기고, 마지막 장에서 멈추거나(loop=False) 처음으로 돌아간다.
+    이미지는 화면 전체로 보고 요청한 좌표를 잘라서 돌려준다.
+    """
+    
+    name = "file"
+    
+    def __init__(self, path, loop: bool = False):
+        self.path = Path(path)
+        self.loop = loop
+        self.logger = logging.getLogger(__name__)
+        
+        self._files: List[Path] = []
+        if self.path.is_dir():
+            self._files = sorted(p for p in self.path.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+            if not self._files:
+                raise FileNotFoundError(f"프레임 이미지가 없습니다: {self.path}")
+        elif not self.path.exists():
+            raise FileNotFoundError(f"프레임 파일이 없습니다: {self.path}")
+        
+        self._index = 0
+        self._frame: Optional[np.ndarray] = None
+        self._mtime: Optional[float] = None
+        # 여러 감시가 동시에 캡처하면 같은 프레임을 건너뛰거나 두 번 넘기지 않도록
+        self._lock = threading.Lock()
+    
+    @property
+    def frame_count(self) -> int:
+        return len(self._files) or 1
+    
+    @property
+    def finished(self) -> bool:
+        """폴더의 마지막 프레임까지 넘겼는지 (반복 재생이면 항상 False)"""
+        return bool(self._files) and not self.loop and self._index >= len(self._files)
+    
+    def _next_frame(self) -> np.ndarray:
+        if not self._files:
+            mtime = self.path.stat().st_mtime
+            if self._frame is None or mtime != self._mtime:
+                self._frame = self._read(self.path)
+                self._mtime = mtime
+            return self._frame
+        
+        if self._index >= len(self._files):
+            if self.loop:
+                self._index = 0
+            else:
+                return self._frame
+        self._frame = self._read(self._files[self._index])
+        self._index += 1
+        return self._frame
+    
+    def _read(self, file_path: Path) -> np.ndarray:
+        with Image.open(file_path) as image:
+            return np.array(image.convert('RGB'))
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        with self._lock:
+            frame = self._next_frame()
+        return crop_frame(frame, area, self.logger)
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        with self._lock:
+            frame = self._frame
+        if frame is None:
+            frame = self._read(self._files[0] if self._files else self.path)
+        return (0, 0, frame.shape[1], frame.shape[0])
+
+class VideoFrameSource(FrameSource):
+    """동영상 파일을 화면 대신 쓰는 프레임 공급원 (캡처 호출마다 다음 프레임)"""
+    
+    name = "video"
+    
+    def __init__(self, path, loop: bool = False):
+        self.path = Path(path)
+        self.loop = loop
+        self.logger = logging.getLogger(__name__)
+        self._capture = cv2.VideoCapture(str(self.path))
+        if not self._capture.isOpened():
+            raise FileNotFoundError(f"동영상을 열 수 없습니다: {self.path}")
+        self._frame: Optional[np.ndarray] = None
+        self.finished = False
+        self._lock = threading.Lock()
+    
+    def _next_frame(self) -> Optional[np.ndarray]:
+        ok, frame = self._capture.read()
+        if not ok and self.loop:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = self._capture.read()
+        if ok:
+            self._frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        else:
+            # 끝에 도달하면 마지막 프레임 유지
+            self.finished = True
+        return self._frame
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        with self._lock:
+            frame = self._next_frame()
+        if frame is None:
+            return None
+        return crop_frame(frame, area, self.logger)
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        return (0, 0, width, height) if width and height else None
+    
+    def close(self):
+        self._capture.release()
+
+def pad_to_area(image: np.ndarray, area: Tuple[int, int, int, int], origin: Tuple[int, int]) -> np.ndarray:
+    """화면 밖이 잘려 나간 캡처를 요청한 영역 크기로 채움 (잘린 부분은 검은색)
+    
+    origin은 image 왼쪽 위의 화면 좌표다. 호출한 쪽은 요청 좌표 기준으로 잘라 쓰므로
+    크기가 다르면 영역이 잘린 만큼 밀린다.
+    """
+    x1, y1, x2, y2 = area
+    if image.shape[:2] == (y2 - y1, x2 - x1):
+        return image
+    padded = np.zeros((y2 - y1, x2 - x1) + image.shape[2:], dtype=image.dtype)
+    left, top = origin[0] - x1, origin[1] - y1
+    padded[top:top + image.shape[0], left:left + image.shape[1]] = image
+    return padded
+
+def crop_frame(frame: np.ndarray, area: Tuple[int, int, int, int], logger: logging.Logger) -> np.ndarray:
+    """화면 전체 프레임에서 영역 잘라내기 (프레임 밖 부분은 검은색으로 채움)"""
+    x1, y1, x2, y2 = area
+    height, width = frame.shape[:2]
+    if x1 < 0 or y1 < 0 or x2 > width or y2 > height:
+        logger.warning(f"캡처 영역이 프레임({width}x{height}) 밖입니다: {area}")
+        inner = frame[max(y1, 0):max(min(y2, height), 0), max(x1, 0):max(min(x2, width), 0)]
+        return pad_to_area(inner, area, (max(x1, 0), max(y1, 0)))
+    return frame[y1:y2, x1:x2]
+
+def create_frame_source(name: str = "auto", source: str = "", loop: bool = False) -> FrameSource:
+    """설정 이름으로 프레임 공급원 생성
+    
+    auto는 X11(Linux)에서 MIT-SHM, mss, ImageGrab 순서로 사용할 수 있는 것을 고른다.
+    file/video/recording은 source 경로가 필요하고, file은 폴더나 이미지, video는
+    동영상 파일, recording은 FrameRecorder로 기록한 파일이다. replay는 확장자로 고른다.
+    """
+    logger = logging.getLogger(__name__)
+    
+    if name == "replay":
+        suffix = Path(source).suffix.lower()
+        if suffix == RECORDING_EXTENSION:
+            name = "recording"
+        else:
+            name = VideoFrameSource.name if suffix in VIDEO_EXTENSIONS else FileFrameSource.name
+    
+    if name == "recording":
+        # recording 모듈이 이 모듈을 불러오므로 여기서 불러옴
+        from .recording import ReplayFrameSource
+        return ReplayFrameSource(source, loop=loop)
+    
+    if name in (FileFrameSource.name, VideoFrameSource.name):
+        source_class = VideoFrameSource if name == VideoFrameSource.name else FileFrameSource
+        return source_class(source, loop=loop)
+    
+    if name == "auto":
+        candidates = [MssFrameSource]
+        if sys.platform.startswith('linux') and os.environ.get('DISPLAY'):
+            candidates.insert(0, X11ShmFrameSource)
+    elif name == X11ShmFrameSource.name:
+        candidates = [X11ShmFrameSource]
+    elif name == MssFrameSource.name:
+        candidates = [MssFrameSource]
+    else:
+        if name != ImageGrabFrameSource.name:
+            logger.warning(f"알 수 없는 캡처 백엔드: {name} -> imagegrab 사용")
+        candidates = []
+    
+    for source_class in candidates:
+        try:
+            return source_class()
+        except (RuntimeError, OSError) as e:
+            if name != "auto":
+                logger.warning(f"{source_class.name} 캡처를 사용할 수 없어 imagegrab으로 대체합니다: {e}")
+    
+    return ImageGrabFrameSource()
\ No newline at end of file
@@ -0,0 +1,267 @@
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+import cv2
+import numpy as np
+
+# 학습 가능한 시간 문자열: (앞 단어)(공백)(숫자로 시작하는 글리프 문자열), 예: "오후 3:25", "15:25", "2024-01-05"
+LEARNABLE_PATTERN = re.compile(r'^(?:(?P<word>[^\s0-9]\S*?)(?P<space>\s*))?(?P<glyphs>[0-9][0-9:./\-]*)$')
+
+# 서로 다른 글자로 학습된 모양 (인식하지 않고 tesseract로 넘김)
+AMBIGUOUS = '\0'
+
+class GlyphTimeRecognizer:
+    """시간 영역 전용 글리프 템플릿 인식기
+    
+    시간 영역은 숫자, 콜론, 오전/오후 정도만 들어 있으므로 tesseract로 읽은
+    결과에서 글자 모양(템플릿)을 배우고, 이후 프레임은 세로 투영으로 글자를
+    나눈 뒤 템플릿과 비교해 읽는다. 작은 영역이라 1ms보다 훨씬 짧게 걸린다.
+    
+    - 학습: tesseract 결과가 "앞 단어 + 숫자/구두점" 형태이고 글자 수와 분할한
+      조각 수가 맞을 때만 조각마다 글자를 붙여 저장한다. 앞 단어(오전/오후)는
+      조각을 나누지 않고 통째로 저장한다.
+    - 인식: 오른쪽 조각부터 글리프 템플릿과 맞춰 보고 남은 앞부분은 단어
+      템플릿과 맞춘다. 가장 가까운 템플릿과의 차이가 크거나, 다른 글자와
+      차이가 거의 없거나, 학습한 적 없는 형식(예: d:dd)이면 None을 돌려주어
+      tesseract로 넘긴다.
+    - 같은 모양인데 다른 글자로 학습되면(tesseract 오인식) 두 견본을 모두
+      버려 그 글자는 다시 tesseract로 읽는다.
+    """
+    
+    # 정규화 크기 (글리프 높이 x 너비, 단어 높이 x 너비)
+    GLYPH_SHAPE = (20, 16)
+    WORD_SHAPE = (20, 48)
+    # 템플릿과의 평균 제곱 차이(이진 이미지면 다른 픽셀 비율)가 이 값 이하여야 인정
+    MAX_DISTANCE = 0.045
+    # 가장 가까운 다른 글자와의 차이가 이만큼은 더 커야 인정
+    MIN_MARGIN = 0.02
+    # 글자당 보관할 견본 수 (글꼴/감시 대상이 여러 개여도 각각 기억)
+    MAX_SAMPLES = 8
+    # 글리프 조각 너비가 줄 높이의 이 배수보다 넓으면 여러 글자가 붙은 것으로 봄
+    MAX_GLYPH_ASPECT = 1.0
+    # 이보다 작은 조각은 잡음으로 보고 무시 (픽셀 수)
+    MIN_SEGMENT_PIXELS = 2
+    
+    def __init__(self, min_reads: int = 3):
+        self.min_reads = min_reads
+        self.reads = 0
+        self.hits = 0
+        self.fallbacks = 0
+        
+        self._glyphs: Dict[str, List[np.ndarray]] = {}
+        self._words: Dict[str, List[np.ndarray]] = {}
+        self._formats: Set[Tuple[str, str]] = set()
+        self._matrix: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def ready(self) -> bool:
+        return self.reads >= self.min_reads
+    
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.fallbacks
+        return {
+            'reads': self.reads,
+            'hits': self.hits,
+            'fallbacks': self.fallbacks,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+    
+    def _binarize(self, image: np.ndarray) -> Optional[np.ndarray]:
+        """글자 픽셀이 True인 이진 이미지 (배경이 어두워도 동작)"""
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if image.ndim == 3 else image
+        if gray.dtype != np.uint8 or gray.size == 0 or int(gray.max()) - int(gray.min()) < 32:
+            return None
+        _, binary = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        foreground = binary.astype(bool)
+        # 글자보다 배경 픽셀이 많으므로 많은 쪽을 배경으로 봄
+        if foreground.mean() > 0.5:
+            foreground = ~foreground
+        return foreground
+    
+    def _segment(self, image: np.ndarray) -> Optional[Tuple[np.ndarray, List[Tuple[int, int]]]]:
+        """글자 줄 이미지와 세로 투영으로 나눈 조각 열 범위 목록"""
+        foreground = self._binarize(image)
+        if foreground is None:
+            return None
+        
+        rows = np.flatnonzero(foreground.any(axis=1))
+        if rows.size == 0:
+            return None
+        line = foreground[rows[0]:rows[-1] + 1]
+        
+        columns = line.sum(axis=0)
+        occupied = np.concatenate(([False], columns > 0, [False]))
+        edges = np.flatnonzero(occupied[1:] != occupied[:-1])
+        segments = [
+            (int(start), int(end)) for start, end in zip(edges[::2], edges[1::2])
+            if columns[start:end].sum() >= self.MIN_SEGMENT_PIXELS
+        ]
+        return line, segments
+    
+    def _normalize(self, line: np.ndarray, start: int, end: int, shape: Tuple[int, int]) -> np.ndarray:
+        """조각을 줄 높이 그대로 잘라 고정 크기 벡터로 변환 (점/콜론처럼 세로 위치도 비교)"""
+        piece = line[:, start:end].astype(np.float32)
+        height, width = shape
+        if shape == self.WORD_SHAPE:
+            return cv2.resize(piece, (width, height), interpolation=cv2.INTER_AREA).ravel()
+        
+        scaled_width = min(max(int(round(piece.shape[1] * height / piece.shape[0])), 1), width)
+        scaled = cv2.resize(piece, (scaled_width, height), interpolation=cv2.INTER_AREA)
+        canvas = np.zeros(shape, np.float32)
+        left = (width - scaled_width) // 2
+        canvas[:, left:left + scaled_width] = scaled
+        return canvas.ravel()
+    
+    def _distance(self, first: np.ndarray, second: np.ndarray) -> float:
+        """평균 제곱 차이 (이진 이미지면 다른 픽셀 비율)"""
+        return float(np.square(first - second).mean())
+    
+    def _format_of(self, glyphs: str) -> str:
+        return re.sub(r'[0-9]', 'd', glyphs)
+    
+    def learn(self, image: np.ndarray, text: str) -> bool:
+        """tesseract가 읽은 결과로 템플릿 학습 (학습했으면 True)"""
+        match = LEARNABLE_PATTERN.match(text.strip())
+        if not match:
+            return False
+        
+        segmented = self._segment(image)
+        if segmented is None:
+            return False
+        line, segments = segmented
+        
+        word = match.group('word') or ""
+        glyphs = match.group('glyphs')
+        word_segments = len(segments) - len(glyphs)
+        if word_segments < 0 or bool(word) != (word_segments > 0):
+            return False
+        
+        # 붙어 버린 숫자(예: "11")가 한 조각이 되면 글자와 조각이 어긋나므로 학습하지 않음
+        if any(end - start > line.shape[0] * self.MAX_GLYPH_ASPECT for start, end in segments[word_segments:]):
+            return False
+        # 띄어 쓴 앞 단어는 가장 넓은 간격에서 끝나야 함
+        if word and match.group('space'):
+            gaps = [segments[index + 1][0] - segments[index][1] for index in range(len(segments) - 1)]
+            if gaps[word_segments - 1] < max(gaps):
+                return False
+        
+        word_label = word + (" " if word and match.group('space') else "")
+        with self._lock:
+            for char, (start, end) in zip(glyphs, segments[word_segments:]):
+                self._add_sample(self._glyphs, char, self._normalize(line, start, end, self.GLYPH_SHAPE))
+            if word:
+                start, end = segments[0][0], segments[word_segments - 1][1]
+                self._add_sample(self._words, word_label, self._normalize(line, start, end, self.WORD_SHAPE))
+            
+            self._formats.add((word_label, self._format_of(glyphs)))
+            self._matrix = {}
+            self.reads += 1
+        return True
+    
+    def _add_sample(self, templates: Dict[str, List[np.ndarray]], label: str, vector: np.ndarray):
+        """견본 추가
+        
+        같은 모양이 다른 글자로 학습되어 있으면(tesseract 오인식) 양쪽 견본을 모두
+        빼고 그 모양을 모호한 견본으로 남겨, 이후 그 모양은 항상 tesseract로 읽는다.
+        """
+        for other, samples in templates.items():
+            if other in (label, AMBIGUOUS):
+                continue
+            conflicts = [sample for sample in samples if self._distance(sample, vector) <= self.MAX_DISTANCE]
+            if conflicts:
+                templates[other] = [sample for sample in samples
+                                    if not any(sample is conflict for conflict in conflicts)]
+                ambiguous = templates.setdefault(AMBIGUOUS, [])
+                ambiguous.extend(conflicts + [vector])
+                del ambiguous[:-self.MAX_SAMPLES]
+                return
+        
+        if any(self._distance(sample, vector) <= self.MAX_DISTANCE for sample in templates.get(AMBIGUOUS, [])):
+            return
+        
+        samples = templates.setdefault(label, [])
+        if any(self._distance(sample, vector) <= self.MAX_DISTANCE / 4 for sample in samples):
+            return
+        samples.append(vector)
+        del samples[:-self.MAX_SAMPLES]
+    
+    def _get_matrix(self, kind: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+        """견본을 한 행렬로 묶어 조각 전체를 행렬 곱 한 번으로 비교 (견본 행렬, 제곱 노름, 글자 번호, 글자)"""
+        if kind not in self._matrix:
+            templates = self._glyphs if kind == 'glyph' else self._words
+            names = [label for label, samples in templates.items() if samples]
+            label_ids = np.array([index for index, label in enumerate(names) for _ in templates[label]], np.intp)
+            vectors = [sample for label in names for sample in templates[label]]
+            matrix = np.stack(vectors) if vectors else np.zeros((0, 1), np.float32)
+            self._matrix[kind] = (matrix, np.einsum('ij,ij->i', matrix, matrix), label_ids, names)
+        return self._matrix[kind]
+    
+    def _classify(self, vectors: np.ndarray, kind: str) -> List[Optional[str]]:
+        """조각별 가장 가까운 글자 (확신할 수 없으면 None)"""
+        matrix, norms, label_ids, names = self._get_matrix(kind)
+        if not names:
+            return [None] * len(vectors)
+        
+        # 평균 제곱 차이 = (|v|^2 + |m|^2 - 2 v.m) / 차원
+        distances = (np.einsum('ij,ij->i', vectors, vectors)[:, None] + norms[None, :]
+                     - 2 * vectors @ matrix.T) / vectors.shape[1]
+        best = distances.argmin(axis=1)
+        best_ids = label_ids[best]
+        best_distances = distances[np.arange(len(vectors)), best]
+        rival_distances = np.where(label_ids[None, :] == best_ids[:, None], np.inf, distances).min(axis=1)
+        
+        results = []
+        for label_id, distance, rival in zip(best_ids, best_distances, rival_distances):
+            label = names[label_id]
+            if distance > self.MAX_DISTANCE or label == AMBIGUOUS or rival - distance < self.MIN_MARGIN:
+                results.append(None)
+            else:
+                results.append(label)
+        return results
+    
+    def recognize(self, image: np.ndarray) -> Optional[str]:
+        """템플릿으로 시간 읽기 (확신할 수 없으면 None)"""
+        if not self.ready:
+            return None
+        
+        text = self._recognize(image)
+        with self._lock:
+            if text is None:
+                self.fallbacks += 1
+            else:
+                self.hits += 1
+        return text
+    
+    def _recognize(self, image: np.ndarray) -> Optional[str]:
+        segmented = self._segment(image)
+        if segmented is None:
+            return None
+        line, segments = segmented
+        if not segments:
+            return None
+        
+        with self._lock:
+            vectors = np.stack([self._normalize(line, start, end, self.GLYPH_SHAPE) for start, end in segments])
+            chars = self._classify(vectors, 'glyph')
+            
+            # 학습한 형식마다 오른쪽 조각들이 그 형식의 글리프로 읽히고 남은 앞부분이
+            # 그 단어로 읽히는지 확인 (앞 단어의 일부가 숫자처럼 보여도 형식으로 걸러짐)
+            words: Dict[int, Optional[str]] = {}
+            for word_label, glyph_format in sorted(self._formats, key=lambda item: -len(item[1])):
+                word_segments = len(segments) - len(glyph_format)
+                if word_segments < 0 or bool(word_label) != (word_segments > 0):
+                    continue
+                tail = chars[word_segments:]
+                if None in tail or self._format_of("".join(tail)) != glyph_format:
+                    continue
+                
+                if word_segments:
+                    if word_segments not in words:
+                        start, end = segments[0][0], segments[word_segments - 1][1]
+                        vector = self._normalize(line, start, end, self.WORD_SHAPE)[None, :]
+                        words[word_segments] = self._classify(vector, 'word')[0]
+                    if words[word_segments] != word_label:
+                        continue
+                return word_label + "".join(tail)
+        return None
\ No newline at end of file
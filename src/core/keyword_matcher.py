@@ -0,0 +1,323 @@
+import re
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from ..models.settings import FilterSettings
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 한글 음절 자모 분해표 (호환 자모)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+             "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+def normalize_text(text: str) -> str:
+    """텍스트 정규화 (소문자, 연속 공백을 한 칸으로)"""
+    if not text:
+        return ""
+    return WHITESPACE_PATTERN.sub(' ', text.lower()).strip()
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (다른 문자는 그대로)
+    
+    OCR이 '긴'을 '간'으로 읽는 것처럼 자모 하나만 틀린 경우 음절 단위로는
+    한 글자 전체가 틀리지만, 자모 단위로 비교하면 편집 거리 1이 된다.
+    """
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            chars.append(CHOSEONG[index // 588])
+            chars.append(JUNGSEONG[(index % 588) // 28])
+            chars.append(JONGSEONG[index % 28])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+def myers_distance(pattern: str, text: str, substring: bool = True) -> int:
+    """Myers 비트 병렬 편집 거리
+    
+    패턴 길이만큼의 비트 벡터(파이썬 정수)로 DP 표의 한 열을 통째로 갱신하므로
+    본문 한 글자당 정수 연산 몇 번으로 끝난다. substring이면 본문의 어느 부분
+    문자열과도 비교한 최소 거리, 아니면 본문 전체와의 거리를 돌려준다.
+    """
+    length = len(pattern)
+    if length == 0:
+        return 0 if substring else len(text)
+    
+    peq: Dict[str, int] = {}
+    for index, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << index)
+    
+    all_ones = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    pv, mv = all_ones, 0
+    score = best = length
+    
+    for char in text:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & all_ones)
+        mh = pv & xh
+        
+        if ph & last_bit:
+            score += 1
+        elif mh & last_bit:
+            score -= 1
+        
+        # 부분 문자열 검색은 본문 어디서 시작해도 비용이 없으므로 첫 행 증가분을 넣지 않음
+        ph = (ph << 1) & all_ones
+        mh = (mh << 1) & all_ones
+        if not substring:
+            ph |= 1
+        pv = mh | (~(xv | ph) & all_ones)
+        mv = ph & xv
+        
+        if substring and score < best:
+            best = score
+    
+    return best if substring else score
+
+class KeywordMatcher:
+    """키워드 목록을 한 번에 찾는 Aho-Corasick 매처
+    
+    FilterSettings의 키워드를 정규화해 오토마톤 하나로 컴파일하고, 본문을
+    한 번만 훑어 일치한 키워드를 모두 찾는다. 키워드 수가 늘어도 검사 시간은
+    본문 길이와 일치 개수에만 비례한다. 완전일치 모드는 사전 조회로 처리한다.
+    
+    대소문자 구분 모드는 원문 그대로, 아니면 normalize_text()로 정규화한
+    키워드와 본문을 비교한다 (기존 필터링 동작과 같음).
+    """
+    
+    def __init__(self, keywords: List[str], exact_match: bool = False, case_sensitive: bool = False):
+        self.keywords = list(keywords)
+        self.exact_match = exact_match
+        self.case_sensitive = case_sensitive
+        
+        # 정규화한 패턴 -> 원래 키워드 목록 (같은 패턴의 키워드는 함께 보고)
+        self._patterns: Dict[str, List[str]] = {}
+        for keyword in self.keywords:
+            pattern = self._prepare(keyword)
+            if pattern:
+                self._patterns.setdefault(pattern, []).append(keyword)
+        
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[str]] = [None]
+        self._output_link: List[int] = [0]
+        if not exact_match:
+            self._build()
+    
+    @classmethod
+    def from_settings(cls, filter_settings: FilterSettings) -> 'KeywordMatcher':
+        return cls(filter_settings.keywords, filter_settings.exact_match, filter_settings.case_sensitive)
+    
+    @staticmethod
+    def signature(filter_settings: FilterSettings) -> Tuple:
+        """다시 컴파일해야 하는지 판단할 설정 서명"""
+        return (tuple(filter_settings.keywords), filter_settings.exact_match, filter_settings.case_sensitive,
+                filter_settings.fuzzy_match, filter_settings.fuzzy_max_distance)
+    
+    def _prepare(self, text: str) -> str:
+        return text if self.case_sensitive else normalize_text(text)
+    
+    def _build(self):
+        """트라이 구성 후 BFS로 실패 링크와 출력 링크 계산"""
+        for pattern in self._patterns:
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(None)
+                    self._output_link.append(0)
+                node = next_node
+            self._output[node] = pattern
+        
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[child] = fail if fail != child else 0
+                
+                # 실패 경로에서 가장 가까운 출력 노드 (일치 보고 시 이 링크만 따라감)
+                fail = self._fail[child]
+                self._output_link[child] = fail if self._output[fail] is not None else self._output_link[fail]
+    
+    def _scan(self, text: str, first_only: bool) -> List[str]:
+        """본문을 한 번 훑어 일치한 패턴 목록 (처음 나온 순서)"""
+        goto, fail, output, output_link = self._goto, self._fail, self._output, self._output_link
+        found: Dict[str, None] = {}
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            
+            match = node if output[node] is not None else output_link[node]
+            while match:
+                found.setdefault(output[match])
+                if first_only:
+                    return list(found)
+                match = output_link[match]
+        return list(found)
+    
+    def find(self, text: str) -> List[str]:
+        """일치한 키워드 목록 (원래 표기)"""
+        if not text or not self._patterns:
+            return []
+        
+        target = self._prepare(text)
+        if self.exact_match:
+            patterns = [target] if target in self._patterns else []
+        else:
+            patterns = self._scan(target, first_only=False)
+        return [keyword for pattern in patterns for keyword in self._patterns[pattern]]
+    
+    def find_with_scores(self, text: str) -> List[Tuple[str, int]]:
+        """일치한 키워드와 편집 거리 목록 (항상 0)"""
+        return [(keyword, 0) for keyword in self.find(text)]
+    
+    def matches(self, text: str) -> bool:
+        """키워드가 하나라도 일치하는지 확인 (첫 일치에서 중단)"""
+        if not text or not self._patterns:
+            return False
+        
+        target = self._prepare(text)
+        if self.exact_match:
+            return target in self._patterns
+        return bool(self._scan(target, first_only=True))
+
+class FuzzyKeywordMatcher:
+    """OCR 오인식을 허용하는 키워드 매처
+    
+    키워드와 본문을 공백을 뺀 자모 문자열로 바꿔 비교하고, 편집 거리가 예산
+    이내면 일치로 본다. 키워드마다 자모 2-gram 역색인을 만들어 두고, 본문과
+    공유하는 2-gram 수가 q-gram 하한((m - 1) - 2k)에 못 미치는 키워드는
+    거리 계산 없이 제외하므로 후보 조회는 키워드 수가 아니라 본문의
+    2-gram이 걸린 키워드 수에 비례한다. 남은 후보만 Myers 비트 병렬
+    편집 거리로 확인한다.
+    
+    짧은 키워드가 아무 데나 걸리지 않도록 키워드별 예산은
+    min(max_distance, 자모 길이 // 4)로 제한한다.
+    """
+    
+    GRAM = 2
+    
+    def __init__(self, keywords: List[str], max_distance: int = 1, exact_match: bool = False,
+                 case_sensitive: bool = False):
+        self.keywords = list(keywords)
+        self.max_distance = max(max_distance, 0)
+        self.exact_match = exact_match
+        self.case_sensitive = case_sensitive
+        
+        # 키워드별 (자모 패턴, 예산), 같은 패턴의 키워드는 함께 보고
+        self._patterns: List[str] = []
+        self._budgets: List[int] = []
+        self._required: List[int] = []
+        self._keywords: List[List[str]] = []
+        # 2-gram -> [(패턴 번호, 패턴 안 등장 횟수)]
+        self._index: Dict[str, List[Tuple[int, int]]] = {}
+        # 하한이 0 이하라 색인으로 거를 수 없는 패턴 (항상 후보)
+        self._always: List[int] = []
+        self._build()
+    
+    @classmethod
+    def from_settings(cls, filter_settings: FilterSettings) -> 'FuzzyKeywordMatcher':
+        return cls(filter_settings.keywords, filter_settings.fuzzy_max_distance,
+                   filter_settings.exact_match, filter_settings.case_sensitive)
+    
+    def _prepare(self, text: str) -> str:
+        """공백 제거 후 자모 분해 (OCR이 띄어쓰기를 빼거나 더하는 경우 무시)"""
+        text = text if self.case_sensitive else text.lower()
+        return decompose_jamo(WHITESPACE_PATTERN.sub('', text))
+    
+    def _grams(self, text: str) -> Dict[str, int]:
+        """2-gram 등장 횟수"""
+        grams: Dict[str, int] = {}
+        for start in range(len(text) - self.GRAM + 1):
+            gram = text[start:start + self.GRAM]
+            grams[gram] = grams.get(gram, 0) + 1
+        return grams
+    
+    def _build(self):
+        seen: Dict[str, int] = {}
+        for keyword in self.keywords:
+            pattern = self._prepare(keyword)
+            if not pattern:
+                continue
+            if pattern in seen:
+                self._keywords[seen[pattern]].append(keyword)
+                continue
+            
+            pattern_id = len(self._patterns)
+            seen[pattern] = pattern_id
+            budget = min(self.max_distance, len(pattern) // 4)
+            required = (len(pattern) - self.GRAM + 1) - budget * self.GRAM
+            
+            self._patterns.append(pattern)
+            self._budgets.append(budget)
+            self._required.append(required)
+            self._keywords.append([keyword])
+            
+            if required <= 0:
+                self._always.append(pattern_id)
+                continue
+            for gram, count in self._grams(pattern).items():
+                self._index.setdefault(gram, []).append((pattern_id, count))
+    
+    def _candidates(self, target: str) -> List[int]:
+        """2-gram 하한을 만족하는 패턴 번호"""
+        shared: Dict[int, int] = {}
+        for gram in self._grams(target):
+            for pattern_id, count in self._index.get(gram, ()):
+                shared[pattern_id] = shared.get(pattern_id, 0) + count
+        
+        candidates = [pattern_id for pattern_id, count in shared.items() if count >= self._required[pattern_id]]
+        return self._always + sorted(candidates)
+    
+    def find_with_scores(self, text: str) -> List[Tuple[str, int]]:
+        """일치한 키워드와 편집 거리 목록 (거리가 작은 순)"""
+        if not text or not self._patterns:
+            return []
+        
+        target = self._prepare(text)
+        matches = []
+        for pattern_id in self._candidates(target):
+            pattern = self._patterns[pattern_id]
+            budget = self._budgets[pattern_id]
+            if self.exact_match and abs(len(pattern) - len(target)) > budget:
+                continue
+            
+            distance = myers_distance(pattern, target, substring=not self.exact_match)
+            if distance <= budget:
+                matches.extend((keyword, distance) for keyword in self._keywords[pattern_id])
+        
+        return sorted(matches, key=lambda match: match[1])
+    
+    def find(self, text: str) -> List[str]:
+        """일치한 키워드 목록 (원래 표기)"""
+        return [keyword for keyword, _ in self.find_with_scores(text)]
+    
+    def matches(self, text: str) -> bool:
+        """키워드가 하나라도 일치하는지 확인"""
+        return bool(self.find_with_scores(text))
+
+def create_keyword_matcher(filter_settings: FilterSettings):
+    """필터 설정에 맞는 키워드 매처 생성"""
+    if filter_settings.fuzzy_match:
+        return FuzzyKeywordMatcher.from_settings(filter_settings)
+    return KeywordMatcher.from_settings(filter_settings)
\ No newline at end of file
@@ -0,0 +1,90 @@
+import re
+import statistics
+from dataclasses import dataclass, field
+from typing import List
+from .ocr_backend import OCRWord
+
+# 영문 월 이름 (Oct, October, Oct.)
+MONTH_NAME_PATTERN = re.compile(r'^(Jan(uary)?|Feb(ruary)?|Mar(ch)?|Apr(il)?|May|June?|July?|Aug(ust)?|'
+                                r'Sep(t(ember)?)?|Oct(ober)?|Nov(ember)?|Dec(ember)?)\.?$', re.IGNORECASE)
+# 영문 월 이름 뒤의 일 (Oct 17, Oct 17,)
+DAY_NUMBER_PATTERN = re.compile(r'^\d{1,2},?$')
+
+# 메일 목록의 시간/날짜 표기 (10:30, 오후 3:15, 2025-07-19, 07-19, 2025.07.19, 07/19,
+# 어제, 10월 17일, 2025년, Yesterday)
+TIME_TOKEN_PATTERN = re.compile(
+    r'^(오전|오후|AM|PM|am|pm|'
+    r'\d{1,2}:\d{2}(:\d{2})?|'
+    r'(\d{2,4}[-./])?\d{1,2}[-./]\d{1,2}\.?|'
+    r'\d{2,4}년|\d{1,2}월|\d{1,2}일|'
+    r'오늘|어제|그제|그저께|[Tt]oday|[Yy]esterday|'
+    r'\(?[월화수목금토일]\)?)$'
+)
+
+@dataclass
+class ListRow:
+    """메일 목록 한 줄"""
+    title: str
+    time: str
+    top: int
+    bottom: int
+    words: List[OCRWord] = field(default_factory=list, repr=False)
+
+def is_time_token(text: str) -> bool:
+    """시간/날짜 구성 토큰인지 확인"""
+    text = text.strip()
+    return bool(TIME_TOKEN_PATTERN.match(text) or MONTH_NAME_PATTERN.match(text))
+
+def group_rows(words: List[OCRWord]) -> List[List[OCRWord]]:
+    """세로 위치로 단어를 줄 단위로 묶음
+    
+    tesseract는 제목 열과 시간 열을 서로 다른 블록으로 인식하기도 하므로
+    줄 식별자 대신 단어 중심의 y 좌표가 가까운 단어들을 한 줄로 본다.
+    """
+    if not words:
+        return []
+    
+    tolerance = statistics.median(word.height for word in words) * 0.6
+    rows: List[List[OCRWord]] = []
+    centers: List[float] = []
+    
+    for word in sorted(words, key=lambda w: w.top + w.height / 2):
+        center = word.top + word.height / 2
+        if rows and abs(center - centers[-1]) <= tolerance:
+            rows[-1].append(word)
+            centers[-1] = sum(w.top + w.height / 2 for w in rows[-1]) / len(rows[-1])
+        else:
+            rows.append([word])
+            centers.append(center)
+    
+    return [sorted(row, key=lambda w: w.left) for row in rows]
+
+def split_title_time(row_words: List[OCRWord]) -> ListRow:
+    """줄 오른쪽 끝의 시간 토큰들과 나머지 제목 분리"""
+    split_index = len(row_words)
+    while split_index > 0:
+        text = row_words[split_index - 1].text.strip()
+        # 숫자만 있는 토큰은 바로 앞이 영문 월 이름일 때만 날짜로 봄 (제목 끝 숫자와 구분)
+        is_day = (split_index > 1 and DAY_NUMBER_PATTERN.match(text)
+                  and MONTH_NAME_PATTERN.match(row_words[split_index - 2].text.strip()))
+        if not (is_day or is_time_token(text)):
+            break
+        split_index -= 1
+    
+    # 제목 전체가 시간처럼 보이는 경우는 제목으로 취급
+    if split_index == 0:
+        split_index = len(row_words)
+    
+    title_words = row_words[:split_index]
+    time_words = row_words[split_index:]
+    return ListRow(
+        title=" ".join(word.text for word in title_words),
+        time=" ".join(word.text for word in time_words),
+        top=min(word.top for word in row_words),
+        bottom=max(word.top + word.height for word in row_words),
+        words=row_words
+    )
+
+def parse_list_rows(words: List[OCRWord]) -> List[ListRow]:
+    """레이아웃 단어 목록을 (제목, 시간) 줄 목록으로 변환"""
+    return [split_title_time(row_words) for row_words in group_rows(words)]
\ No newline at end of file
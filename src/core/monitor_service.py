@@ -1,185 +1,690 @@
-import threading
-import time
-import pyautogui
-import logging
-import re
-from typing import Optional, Callable
-from .ocr_engine import OCREngine
-from ..models.settings import AppSettings
-
-class MonitorService:
-    """모니터링 서비스"""
-    
-    def __init__(self, settings: AppSettings, ocr_engine: OCREngine):
-        self.settings = settings
-        self.ocr_engine = ocr_engine
-        self.logger = logging.getLogger(__name__)
-        
-        self.is_monitoring = False
-        self.monitor_thread: Optional[threading.Thread] = None
-        self.refresh_thread: Optional[threading.Thread] = None
-        
-        self.previous_title_image = None
-        self.previous_time_image = None
-        self.baseline_time = None
-        
-        # 콜백 함수들
-        self.on_detection_callback: Optional[Callable] = None
-        self.on_log_callback: Optional[Callable] = None
-    
-    def set_callbacks(self, on_detection: Callable, on_log: Callable):
-        """콜백 함수 설정"""
-        self.on_detection_callback = on_detection
-        self.on_log_callback = on_log
-    
-    def start_monitoring(self):
-        """모니터링 시작"""
-        if self.is_monitoring:
-            return
-        
-        self.is_monitoring = True
-        self._set_baseline()
-        
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self.monitor_thread.start()
-        
-        if self.settings.monitor_settings.refresh_enabled:
-            self.refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
-            self.refresh_thread.start()
-        
-        self._log("모니터링 시작")
-    
-    def stop_monitoring(self):
-        """모니터링 중지"""
-        self.is_monitoring = False
-        self._log("모니터링 중지")
-    
-    def _set_baseline(self):
-        """기준점 설정"""
-        try:
-            if not self.settings.time_area:
-                return
-            
-            time_image = self.ocr_engine.capture_area(self.settings.time_area.to_tuple())
-            if time_image is not None:
-                time_text = self.ocr_engine.extract_text(time_image)
-                if time_text:
-                    self.baseline_time = time_text
-                    self._log(f"기준점 설정: {self.baseline_time}")
-        except Exception as e:
-            self._log(f"기준점 설정 오류: {e}")
-    
-    def _monitor_loop(self):
-        """모니터링 메인 루프"""
-        while self.is_monitoring:
-            try:
-                self._log("유사도 감지 중...")
-                
-                # 현재 이미지 캡처
-                title_image = self.ocr_engine.capture_area(self.settings.title_area.to_tuple())
-                time_image = self.ocr_engine.capture_area(self.settings.time_area.to_tuple())
-                
-                if title_image is None or time_image is None:
-                    continue
-                
-                # 변화 감지
-                if self._detect_changes(title_image, time_image):
-                    self._log("변화 감지 -> 검증 시작")
-                    self._process_detection(title_image, time_image)
-                
-                # 이전 이미지 저장
-                self.previous_title_image = title_image
-                self.previous_time_image = time_image
-                
-                time.sleep(self.settings.monitor_settings.interval)
-                
-            except Exception as e:
-                self._log(f"모니터링 오류: {e}")
-                time.sleep(self.settings.monitor_settings.interval)
-    
-    def _detect_changes(self, title_image, time_image) -> bool:
-        """변화 감지"""
-        if self.previous_title_image is None or self.previous_time_image is None:
-            return True
-        
-        title_similarity = self.ocr_engine.calculate_similarity(title_image, self.previous_title_image)
-        time_similarity = self.ocr_engine.calculate_similarity(time_image, self.previous_time_image)
-        
-        threshold = self.settings.monitor_settings.similarity_threshold
-        return title_similarity < threshold or time_similarity < threshold
-    
-    def _process_detection(self, title_image, time_image):
-        """감지 처리"""
-        title_text = self.ocr_engine.extract_text(title_image)
-        time_text = self.ocr_engine.extract_text(time_image)
-        
-        self._log(f'제목: "{title_text}" | 시간: "{time_text}"')
-        
-        # 시간 중복 확인
-        if time_text != self.baseline_time:
-            # 필터링 확인
-            if self._check_keyword_match(title_text):
-                self._log("필터링 일치 -> 알림 발송")
-                
-                if self.on_detection_callback:
-                    self.on_detection_callback(title_text, time_text)
-                
-                # 기준점 갱신
-                self.baseline_time = time_text
-            else:
-                self._log("필터링 불일치 -> 패스")
-        else:
-            self._log("시간 중복 -> 패스")
-    
-    def _check_keyword_match(self, text: str) -> bool:
-        """키워드 매칭 확인"""
-        if not text or not self.settings.filter_settings.keywords:
-            return False
-        
-        normalized_text = self._normalize_text(text)
-        
-        for keyword in self.settings.filter_settings.keywords:
-            normalized_keyword = self._normalize_text(keyword)
-            
-            if self.settings.filter_settings.exact_match:
-                if self.settings.filter_settings.case_sensitive:
-                    if keyword == text:
-                        return True
-                else:
-                    if normalized_keyword == normalized_text:
-                        return True
-            else:
-                if self.settings.filter_settings.case_sensitive:
-                    if keyword in text:
-                        return True
-                else:
-                    if normalized_keyword in normalized_text:
-                        return True
-        
-        return False
-    
-    def _normalize_text(self, text: str) -> str:
-        """텍스트 정규화"""
-        if not text:
-            return ""
-        
-        normalized = text.lower()
-        normalized = re.sub(r'\s+', ' ', normalized)
-        return normalized.strip()
-    
-    def _refresh_loop(self):
-        """새로고침 루프"""
-        while self.is_monitoring and self.settings.monitor_settings.refresh_enabled:
-            try:
-                time.sleep(self.settings.monitor_settings.refresh_interval * 60)
-                if self.is_monitoring:
-                    pyautogui.press('f5')
-                    self._log("새로고침 실행")
-            except Exception as e:
-                self._log(f"새로고침 오류: {e}")
-    
-    def _log(self, message: str):
-        """로그 출력"""
-        self.logger.info(message)
-        if self.on_log_callback:
-            self.on_log_callback(message)
+import time
+import asyncio
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Callable, Tuple
+from .ocr_engine import OCREngine
+from .scheduler import AdaptiveScheduler
+from .pipeline import Pipeline, StageQueue
+from .region_tracker import RegionTracker
+from .seen_store import SeenStore
+from .watch import Watch
+from ..config import Config
+from ..models.settings import AppSettings
+
+class MonitorService:
+    """모니터링 서비스
+    
+    여러 감시 대상(메일함/폴더/모니터)을 하나의 asyncio 이벤트 루프와 공용
+    OCR 워커 풀로 처리한다. 캡처/감지/OCR 같은 블로킹 작업은 작업 스레드
+    풀에서 돌리고, 폴링 대기와 새로고침 대기는 루프에서 기다리므로 중지
+    요청 시 바로 취소된다. 감시 대상이 늘어도 스레드는 늘지 않는다.
+    
+    asyncio 코드에서는 start()/stop()을 await하고, tkinter처럼 동기 코드에서는
+    start_monitoring()/stop_monitoring()이 전용 루프 스레드에서 같은 일을 한다.
+    """
+    
+    # 파이프라인 모드 알림 큐 크기 (알림은 되도록 버리지 않음)
+    NOTIFY_QUEUE_SIZE = 100
+    # 캡처/감지/OCR 작업 스레드 수 (동시에 OCR할 수 있는 감시 대상 수)
+    WORKER_COUNT = 4
+    # 중지 요청 후 작업 종료를 기다리는 최대 시간(초)
+    STOP_TIMEOUT = 2.0
+    
+    def __init__(self, settings: AppSettings, ocr_engine: OCREngine, seen_store: Optional[SeenStore] = None):
+        self.settings = settings
+        self.ocr_engine = ocr_engine
+        self.logger = logging.getLogger(__name__)
+        
+        # 확인한 메일 기록 (재시작해도 유지)
+        if seen_store is None:
+            seen_store = SeenStore(Config.SEEN_STORE_FILE)
+            seen_store.load()
+        self.seen_store = seen_store
+        
+        self.is_monitoring = False
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: List[asyncio.Task] = []
+        self.stop_event: Optional[asyncio.Event] = None
+        self.scheduler = self._create_scheduler()
+        
+        self.watches: Dict[str, Watch] = {}
+        self._watch_turn = 0
+        # 이름이 겹쳐 바꾼 감시 대상 (경고를 한 번만 남기기 위해)
+        self._renamed_watches: set = set()
+        # 감시 대상 목록/감지기 교체와 파이프라인 감지 단계가 겹치지 않도록 보호
+        self._watch_lock = threading.RLock()
+        self.pipeline: Optional[Pipeline] = None
+        self.notify_queue: Optional[StageQueue] = None
+        self._pipeline_changed = False
+        
+        # 콜백 함수들 (알림 싱크는 여러 개를 동시에 호출)
+        self.sinks: List[Callable] = []
+        self.on_log_callback: Optional[Callable] = None
+    
+    @property
+    def baseline_time(self) -> Optional[str]:
+        """첫 번째 감시 대상의 기준점 시간"""
+        for watch in self.watches.values():
+            return watch.baseline_time
+        return None
+    
+    def set_callbacks(self, on_detection: Callable, on_log: Callable):
+        """콜백 함수 설정"""
+        self.sinks = [on_detection]
+        self.on_log_callback = on_log
+    
+    def add_sink(self, sink: Callable):
+        """알림 싱크 추가 (sink(title_text, time_text, watch_name), 코루틴 함수도 가능)"""
+        self.sinks.append(sink)
+    
+    def start_monitoring(self):
+        """모니터링 시작 (동기 코드용, 기준점 설정까지 기다림)"""
+        if self.is_monitoring:
+            return
+        
+        if self._loop_thread is None:
+            self.loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self.loop.run_forever, name="monitor-loop", daemon=True)
+            self._loop_thread.start()
+        
+        asyncio.run_coroutine_threadsafe(self.start(), self.loop).result()
+    
+    def stop_monitoring(self):
+        """모니터링 중지 (동기 코드용, 최대 STOP_TIMEOUT초 남짓 대기)"""
+        if not self.is_monitoring or self.loop is None:
+            return
+        
+        future = asyncio.run_coroutine_threadsafe(self.stop(), self.loop)
+        try:
+            future.result(self.STOP_TIMEOUT + 1.0)
+        except FutureTimeoutError:
+            self.logger.warning("모니터링 중지 대기 시간 초과")
+    
+    def close(self):
+        """모니터링을 멈추고 전용 루프 스레드 종료"""
+        self.stop_monitoring()
+        
+        if self._loop_thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._loop_thread.join(self.STOP_TIMEOUT)
+            self._loop_thread = None
+        
+        self.seen_store.close()
+    
+    async def start(self):
+        """모니터링 시작"""
+        if self.is_monitoring:
+            return
+        
+        self.is_monitoring = True
+        self.loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.WORKER_COUNT, thread_name_prefix="monitor")
+        self.scheduler = self._create_scheduler()
+        self.watches = {}
+        self.seen_store.configure(self.settings.monitor_settings.seen_max_entries,
+                                  self.settings.monitor_settings.seen_ttl_hours * 3600)
+        await self._run_blocking(self._sync_watches)
+        
+        self._tasks = [self.loop.create_task(self._monitor_loop(self.scheduler))]
+        if self.settings.monitor_settings.refresh_enabled:
+            self._tasks.append(self.loop.create_task(self._refresh_loop()))
+        
+        self._log(f"모니터링 시작 (감시 대상 {len(self.watches)}개)")
+    
+    async def stop(self):
+        """모니터링 중지
+        
+        대기 중인 작업은 바로 취소되고, 작업 스레드에서 진행 중인 OCR은 최대
+        STOP_TIMEOUT초까지만 기다린다. 그 뒤에 끝나는 OCR 결과는 버린다.
+        """
+        if not self.is_monitoring:
+            return
+        
+        self.is_monitoring = False
+        self.stop_event.set()
+        for task in self._tasks:
+            task.cancel()
+        
+        _, pending = await asyncio.wait(self._tasks, timeout=self.STOP_TIMEOUT)
+        if pending:
+            self.logger.warning(f"중지 대기 시간 초과: 작업 {len(pending)}개")
+        self._tasks = []
+        self._executor.shutdown(wait=False)
+        self.seen_store.compact()
+        self._log("모니터링 중지")
+        
+        tick_stats = self.scheduler.stats()
+        if 'mean_lateness_ms' in tick_stats:
+            self._log(f"폴링 {tick_stats['ticks']}회: 지연 평균 {tick_stats['mean_lateness_ms']:.1f}ms / "
+                      f"p95 {tick_stats['p95_lateness_ms']:.1f}ms / 최대 {tick_stats['max_lateness_ms']:.1f}ms, "
+                      f"주기 초과 {tick_stats['overruns']}회")
+        
+        cache_stats = self.ocr_engine.cache_stats()
+        if cache_stats:
+            self._log(f"OCR 캐시: 적중 {cache_stats['hits']}회 / 실패 {cache_stats['misses']}회 "
+                      f"(적중률 {cache_stats['hit_rate']:.0%})")
+        
+        relocations = sum(watch.tracker.relocations for watch in self.watches.values() if watch.tracker is not None)
+        if relocations:
+            self._log(f"창 이동 추적: 영역 위치 다시 찾기 {relocations}회")
+        
+        glyph_stats = self.ocr_engine.glyph_stats()
+        if glyph_stats.get('hits') or glyph_stats.get('fallbacks'):
+            self._log(f"시간 글리프 인식: 적중 {glyph_stats['hits']}회 / tesseract 대체 {glyph_stats['fallbacks']}회 "
+                      f"(학습 {glyph_stats['reads']}회)")
+    
+    def _sync_watches(self):
+        """설정의 감시 대상 목록 반영
+        
+        기존 감시 대상은 상태를 유지한 채 바뀐 영역/필터/임계값만 반영하고,
+        새로 추가된 감시 대상은 기준점을 잡고 시작한다. 모니터링 루프가 주기
+        사이에만 호출하며, 파이프라인 감지 단계와는 _watch_lock으로 겹치지 않는다.
+        """
+        with self._watch_lock:
+            self._update_watches()
+    
+    def _update_watches(self):
+        """감시 대상 목록 갱신 (_watch_lock 안에서 호출)"""
+        watches: Dict[str, Watch] = {}
+        added: List[Watch] = []
+        for index, watch_settings in enumerate(self.settings.active_watches()):
+            name = self._unique_watch_name(watch_settings.name or f"감시 {index + 1}", watches)
+            watch = self.watches.get(name)
+            if watch is None:
+                watch = Watch(name, watch_settings, self.ocr_engine, self.seen_store)
+                added.append(watch)
+            else:
+                watch.update(watch_settings)
+            watches[name] = watch
+        
+        self.watches = watches
+        for watch in watches.values():
+            self._sync_tracker(watch)
+        for watch in added:
+            self._set_baseline(watch)
+    
+    def _unique_watch_name(self, name: str, watches: Dict[str, Watch]) -> str:
+        """이미 쓰인 이름이면 번호를 붙인 이름 (같은 이름끼리 서로 덮어쓰거나 확인 기록을 공유하지 않도록)"""
+        unique, number = name, 2
+        while unique in watches:
+            unique = f"{name} ({number})"
+            number += 1
+        if unique != name and unique not in self._renamed_watches:
+            self._renamed_watches.add(unique)
+            self._log(f"감시 대상 이름이 겹쳐 '{unique}'(으)로 바꿔 감시합니다: {name}")
+        return unique
+    
+    def _sync_tracker(self, watch: Watch):
+        """창 이동 추적 설정 반영 (처음 켰거나 영역을 다시 선택했으면 지금 화면으로 템플릿 생성)"""
+        if not self.settings.monitor_settings.region_tracking:
+            watch.tracker = None
+            return
+        
+        if watch.tracker is None:
+            watch.tracker = RegionTracker(watch.name, Config.REGION_ANCHOR_DIR)
+        watch.tracker.sync(watch.selected_areas(), self.ocr_engine.capture_area)
+    
+    def _set_baseline(self, watch: Watch):
+        """기준점 설정 (현재 보이는 메일은 확인한 것으로 기록)"""
+        try:
+            if watch.settings.list_mode:
+                self._set_list_baseline(watch)
+                return
+            
+            images = self.ocr_engine.capture_areas(watch.areas())
+            if images is None:
+                self._log("기준점 설정 실패: 캡처 실패", watch)
+                return
+            if images.get('time') is not None:
+                time_text = self.ocr_engine.extract_text(images['time'], region='time')
+                if time_text:
+                    title_text = ""
+                    if images.get('title') is not None:
+                        title_text = self.ocr_engine.extract_text(images['title'], region='title')
+                    watch.remember(title_text, time_text)
+                    watch.baseline_time = time_text
+                    self._log(f"기준점 설정: {watch.baseline_time}", watch)
+        except Exception as e:
+            self._log(f"기준점 설정 오류: {e}", watch)
+    
+    def _set_list_baseline(self, watch: Watch):
+        """목록 모드 기준점 설정 (현재 보이는 줄은 모두 확인한 것으로 처리)"""
+        list_image = self.ocr_engine.capture_area(watch.areas()['list'])
+        if list_image is None:
+            self._log("기준점 설정 실패: 캡처 실패", watch)
+            return
+        
+        rows = self.ocr_engine.extract_rows(list_image)
+        for row in rows:
+            watch.remember_row(row)
+        if rows:
+            watch.baseline_time = rows[0].time
+        self._log(f"기준점 설정: 목록 {len(rows)}줄", watch)
+    
+    def _create_scheduler(self) -> AdaptiveScheduler:
+        """설정에 맞는 폴링 스케줄러 생성"""
+        scheduler = AdaptiveScheduler(self.settings.monitor_settings.interval)
+        self._sync_scheduler(scheduler)
+        return scheduler
+    
+    def _sync_scheduler(self, scheduler: AdaptiveScheduler):
+        """모니터링 중 UI에서 바꾼 간격 설정 반영"""
+        monitor_settings = self.settings.monitor_settings
+        scheduler.base_interval = monitor_settings.interval
+        scheduler.adaptive = monitor_settings.adaptive_polling
+        scheduler.min_interval = monitor_settings.min_interval
+        scheduler.max_interval = max(monitor_settings.max_interval, monitor_settings.min_interval)
+        scheduler.backoff = monitor_settings.backoff_factor
+    
+    async def _run_blocking(self, func: Callable, *args):
+        """블로킹 작업을 작업 스레드 풀에서 실행"""
+        return await self.loop.run_in_executor(self._executor, func, *args)
+    
+    async def _monitor_loop(self, scheduler: AdaptiveScheduler):
+        """모니터링 메인 루프
+        
+        작업 시간을 뺀 만큼만 기다리도록 고정 마감 시각에 맞춰 주기를 돌고,
+        중지 요청 시 대기 중이어도 바로 빠져나온다.
+        """
+        pipeline = self._start_pipeline() if self.settings.monitor_settings.pipeline_enabled else None
+        
+        scheduler.start()
+        try:
+            while await scheduler.wait(self.stop_event):
+                changed = False
+                try:
+                    # 설정 변경은 주기 사이에만 반영 (캡처/감지 도중 감시 대상이 바뀌지 않도록)
+                    await self._run_blocking(self._sync_watches)
+                    self._log("유사도 감지 중...")
+                    
+                    if pipeline is not None:
+                        changed = await self._run_blocking(self._feed_pipeline, pipeline)
+                    else:
+                        changed = await self._check_frame()
+                
+                except Exception as e:
+                    self._log(f"모니터링 오류: {e}")
+                
+                self._sync_scheduler(scheduler)
+                scheduler.tick_done(changed)
+        finally:
+            if pipeline is not None:
+                # 단계 워커 종료는 블로킹이므로 기본 스레드 풀에서 기다림
+                await self.loop.run_in_executor(None, self._stop_pipeline, pipeline)
+    
+    async def _check_frame(self) -> bool:
+        """캡처부터 알림까지 한 주기 처리 (변화 감지 여부 반환)
+        
+        변화가 감지된 감시 대상들은 작업 스레드에서 동시에 OCR한다.
+        """
+        frame = await self._run_blocking(self._capture_frame)
+        if frame is None:
+            return False
+        
+        detected = await self._run_blocking(self._detect_frame, frame)
+        if not detected:
+            return False
+        
+        await asyncio.gather(*(self._run_blocking(self._process_frame, [item]) for item in detected))
+        return True
+    
+    def _capture_frame(self) -> Optional[Dict[str, Dict]]:
+        """모든 감시 대상 영역을 한 번에 캡처 ({감시 대상 이름: {영역: 이미지}})"""
+        areas = {
+            (name, region): area
+            for name, watch in self.watches.items()
+            for region, area in {**watch.areas(), **watch.anchor_areas()}.items()
+        }
+        if not areas:
+            return None
+        
+        images = self.ocr_engine.capture_areas(areas)
+        if images is None:
+            return None
+        
+        frame: Dict[str, Dict] = {name: {} for name in self.watches}
+        for (name, region), image in images.items():
+            frame[name][region] = image
+        return frame
+    
+    def _detect_frame(self, frame: Dict[str, Dict]) -> List[Tuple[Watch, Dict]]:
+        """감시 대상별 변화 감지 (변화가 있는 감시 대상과 바뀐 줄 정보를 담은 프레임 목록)
+        
+        OCR 순서가 한 감시 대상에 치우치지 않도록 매 주기 시작 위치를 돌린다.
+        """
+        with self._watch_lock:
+            return self._detect_watches(frame)
+    
+    def _detect_watches(self, frame: Dict[str, Dict]) -> List[Tuple[Watch, Dict]]:
+        names = [name for name in frame if name in self.watches]
+        if names:
+            start = self._watch_turn % len(names)
+            names = names[start:] + names[:start]
+            self._watch_turn += 1
+        
+        detected = []
+        for name in names:
+            watch = self.watches[name]
+            watch_frame = self._detect_watch(watch, frame[name])
+            if watch_frame is not None:
+                detected.append((watch, watch_frame))
+        return detected
+    
+    def _detect_watch(self, watch: Watch, frame: Dict) -> Optional[Dict]:
+        """감시 대상 하나의 변화 감지"""
+        if watch.tracker is not None and not self._track_regions(watch, frame):
+            return None
+        
+        if 'list' in frame:
+            changed = watch.change_detector.has_changed('list', frame['list'])
+            watch.previous_list_image = frame['list']
+            if changed:
+                self._log("목록 변화 감지 -> 검증 시작", watch)
+            return frame if changed else None
+        
+        changed = self._detect_changes(watch, frame['title'], frame['time'])
+        
+        # 이전 이미지 저장
+        watch.previous_title_image = frame['title']
+        watch.previous_time_image = frame['time']
+        
+        if not changed:
+            return None
+        
+        self._log("변화 감지 -> 검증 시작", watch)
+        # 파이프라인에서는 OCR 시점에 감지기가 다음 프레임으로 넘어가 있으므로 지금 기록
+        return dict(frame, title_bands=list(watch.change_detector.changed_bands('title')))
+    
+    def _track_regions(self, watch: Watch, frame: Dict) -> bool:
+        """창 이동 추적: 영역 주변이 저장한 화면과 맞는지 확인 (맞지 않으면 이번 프레임은 건너뜀)
+        
+        연속으로 맞지 않으면 화면 전체를 캡처해 영역 위치를 다시 찾고, 다음
+        주기부터 옮긴 좌표로 캡처한다.
+        """
+        matched, lost = watch.tracker.verify(frame)
+        if not lost:
+            return matched
+        
+        try:
+            bounds = self.ocr_engine.frame_source.screen_bounds()
+            screen = self.ocr_engine.capture_area(bounds) if bounds is not None else None
+            if screen is None:
+                return False
+            
+            previous = {region: (watch.tracker.offset(region), watch.tracker.is_detached(region)) for region in lost}
+            for region, offset in watch.tracker.relocate(screen, bounds[:2], lost).items():
+                offset_before, detached = previous[region]
+                if offset is None:
+                    if not detached:
+                        self._log(f"{region} 영역을 찾지 못해 현재 위치에서 계속 감시 (창이 다시 보이면 따라감)", watch)
+                elif offset != offset_before or detached:
+                    self._log(f"영역 위치 이동 감지: {region} ({offset[0]:+d}, {offset[1]:+d})", watch)
+        except Exception as e:
+            self._log(f"영역 위치 찾기 오류: {e}", watch)
+        return False
+    
+    def _process_frame(self, detected: List[Tuple[Watch, Dict]]):
+        """변화가 감지된 감시 대상들의 OCR/필터링"""
+        for watch, frame in detected:
+            try:
+                if 'list' in frame:
+                    self._process_list_detection(watch, frame['list'])
+                else:
+                    self._process_detection(watch, frame['title'], frame['time'], frame.get('title_bands'))
+            except Exception as e:
+                self._log(f"감지 처리 오류: {e}", watch)
+    
+    def _start_pipeline(self) -> Pipeline:
+        """감지 -> OCR -> 알림 단계 파이프라인 시작
+        
+        캡처는 스케줄러 스레드가 맡고, 나머지 단계는 각자의 워커에서 돈다.
+        OCR이나 슬랙 전송이 느려도 캡처와 변화 감지는 계속되며, 밀린 프레임은
+        오래된 것부터 버린다.
+        """
+        queue_size = self.settings.monitor_settings.pipeline_queue_size
+        pipeline = Pipeline()
+        pipeline.add_stage('detect', self._detect_stage, queue_size)
+        pipeline.add_stage('ocr', self._ocr_stage, queue_size, merge=self._merge_detected)
+        notify_stage = pipeline.add_stage('notify', self._notify_stage, self.NOTIFY_QUEUE_SIZE)
+        
+        self._pipeline_changed = False
+        self.notify_queue = notify_stage.input_queue
+        self.pipeline = pipeline
+        pipeline.start()
+        return pipeline
+    
+    def _stop_pipeline(self, pipeline: Pipeline):
+        """파이프라인 종료 후 단계별 통계 기록"""
+        pipeline.stop(self.STOP_TIMEOUT)
+        self.notify_queue = None
+        
+        for name, stage_stats in pipeline.stats().items():
+            self._log(f"[{name}] 처리 {stage_stats['processed']}건 ({stage_stats['throughput']:.2f}건/초, "
+                      f"평균 {stage_stats['mean_ms']:.0f}ms) | 큐 최대 {stage_stats['max_depth']} / "
+                      f"버림 {stage_stats['dropped']}")
+    
+    def _feed_pipeline(self, pipeline: Pipeline) -> bool:
+        """캡처 단계: 프레임을 감지 단계로 넘기고 직전 주기 이후 변화 여부 반환"""
+        frame = self._capture_frame()
+        if frame is not None and not pipeline.put(frame):
+            self.logger.debug("감지 단계 지연 -> 오래된 프레임 버림")
+        
+        changed = self._pipeline_changed
+        self._pipeline_changed = False
+        return changed
+    
+    def _detect_stage(self, frame: Dict[str, Dict]) -> Optional[List[Tuple[Watch, Dict]]]:
+        """감지 단계 워커"""
+        detected = self._detect_frame(frame)
+        if not detected:
+            return None
+        
+        self._pipeline_changed = True
+        return detected
+    
+    @staticmethod
+    def _merge_detected(dropped: List[Tuple[Watch, Dict]],
+                        detected: List[Tuple[Watch, Dict]]) -> List[Tuple[Watch, Dict]]:
+        """OCR이 밀려 버릴 감지 결과를 새 감지 결과에 합침
+        
+        줄 단위 OCR은 바뀐 줄만 다시 읽으므로 버린 프레임에서만 바뀐 줄이
+        빠지면 새 메일을 놓친다. 같은 감시 대상이면 바뀐 줄을 합치고, 새 결과에
+        없는 감시 대상은 버릴 결과를 그대로 남긴다.
+        """
+        merged = {watch.name: (watch, frame) for watch, frame in dropped}
+        for watch, frame in detected:
+            previous = merged.get(watch.name)
+            if previous is not None and 'title_bands' in frame and 'title_bands' in previous[1]:
+                frame = dict(frame, title_bands=sorted(set(previous[1]['title_bands']) | set(frame['title_bands'])))
+            merged[watch.name] = (watch, frame)
+        return list(merged.values())
+    
+    def _ocr_stage(self, detected: List[Tuple[Watch, Dict]]):
+        """OCR 단계 워커 (알림은 notify_queue로 넘김)"""
+        self._process_frame(detected)
+    
+    def _rule_time(self) -> Optional[datetime]:
+        """시간 규칙을 평가할 현재 시각 (None이면 실제 현재 시각)"""
+        return None
+    
+    def _notify_stage(self, alert: tuple):
+        """알림 단계 워커 (모든 싱크 전송이 끝날 때까지 기다림)"""
+        asyncio.run_coroutine_threadsafe(self._dispatch(alert), self.loop).result()
+    
+    def _notify(self, watch: Watch, title_text: str, time_text: str):
+        """알림 발송 (작업 스레드에서 호출, 파이프라인 모드면 알림 단계로 넘김)
+        
+        감시 대상이 둘 이상이면 어느 감시 대상의 메일인지 이름을 함께 넘긴다.
+        전송은 이벤트 루프에서 진행되므로 OCR 작업은 전송을 기다리지 않는다.
+        """
+        alert = (title_text, time_text, watch.name if len(self.watches) > 1 else "")
+        if self.ocr_engine.frame_ring is not None and self.settings.monitor_settings.ring_dump_on_alert:
+            self._request_frame_dump("alert")
+        
+        if self.notify_queue is not None:
+            self.notify_queue.put(alert)
+        elif self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._dispatch(alert), self.loop)
+        else:
+            self._log(f'종료 후 감지되어 알림 생략: "{title_text}"', watch)
+    
+    def dump_recent_frames(self, reason: str = "manual", center: Optional[float] = None) -> Optional[Path]:
+        """링 버퍼에서 center 앞뒤(ring_dump_before/after초) 화면을 기록 파일로 저장
+        
+        저장한 파일은 python main.py --replay로 재생할 수 있다. 링 버퍼가 꺼져
+        있거나 저장할 프레임이 없으면 None을 반환한다.
+        """
+        frame_ring = self.ocr_engine.frame_ring
+        if frame_ring is None:
+            self._log("최근 화면 저장 불가: 링 버퍼가 꺼져 있습니다 (capture_ring_mb)")
+            return None
+        
+        monitor_settings = self.settings.monitor_settings
+        center = time.time() if center is None else center
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(center)) + f"-{int(center * 1000) % 1000:03d}"
+        file_path = Config.FRAME_DUMP_DIR / f"{stamp}_{reason}.emrec"
+        try:
+            count = frame_ring.dump(file_path, center - monitor_settings.ring_dump_before,
+                                    center + monitor_settings.ring_dump_after)
+        except Exception as e:
+            self._log(f"최근 화면 저장 오류: {e}")
+            return None
+        
+        if not count:
+            self._log("최근 화면 저장: 저장할 프레임 없음")
+            return None
+        self._log(f"최근 화면 {count}장 저장: {file_path}")
+        return file_path
+    
+    def _request_frame_dump(self, reason: str):
+        """감지 시각 이후 화면까지 모이도록 ring_dump_after초 뒤에 저장 (작업 스레드에서 호출)"""
+        if self.loop is not None and self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._dump_frames_later(reason, time.time()), self.loop)
+    
+    async def _dump_frames_later(self, reason: str, center: float):
+        """지연 저장 (기다리는 중 종료되면 그때까지 모인 화면만 저장)"""
+        try:
+            await asyncio.sleep(self.settings.monitor_settings.ring_dump_after)
+        except asyncio.CancelledError:
+            self.dump_recent_frames(reason, center)
+            raise
+        await self.loop.run_in_executor(None, self.dump_recent_frames, reason, center)
+    
+    async def _dispatch(self, alert: tuple):
+        """모든 알림 싱크에 동시에 전달 (한 싱크의 오류가 다른 싱크를 막지 않음)"""
+        results = await asyncio.gather(*(self._call_sink(sink, alert) for sink in self.sinks),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self._log(f"알림 전송 오류: {result}")
+    
+    async def _call_sink(self, sink: Callable, alert: tuple):
+        """싱크 호출 (동기 함수는 기본 스레드 풀에서 실행)"""
+        if asyncio.iscoroutinefunction(sink):
+            await sink(*alert)
+        else:
+            await self.loop.run_in_executor(None, sink, *alert)
+    
+    def _detect_changes(self, watch: Watch, title_image, time_image) -> bool:
+        """변화 감지"""
+        # 두 영역의 서명을 모두 갱신해야 하므로 단락 평가하지 않음
+        title_changed = watch.change_detector.has_changed('title', title_image)
+        time_changed = watch.change_detector.has_changed('time', time_image)
+        return title_changed or time_changed
+    
+    def _process_detection(self, watch: Watch, title_image, time_image, title_bands=None):
+        """감지 처리"""
+        if watch.settings.dirty_row_ocr:
+            # 바뀐 줄만 OCR하고 나머지 줄은 이전 결과 재사용
+            if title_bands is None:
+                title_bands = watch.change_detector.changed_bands('title')
+            title_text = watch.title_row_ocr.extract(title_image, title_bands)
+        else:
+            title_text = self.ocr_engine.extract_text(title_image, region='title')
+        time_text = self.ocr_engine.extract_text(time_image, region='time')
+        
+        self._log(f'제목: "{title_text}" | 시간: "{time_text}"', watch)
+        
+        if not title_text.strip() or not time_text.strip():
+            self._log("제목이나 시간을 읽지 못함 -> 패스", watch)
+            return
+        
+        # 중복 확인 (같은 시간이라도 제목이 다르면 새 메일)
+        if not watch.remember(title_text, time_text):
+            self._log("이미 확인한 메일 -> 패스", watch)
+            return
+        
+        # 필터링 확인
+        matched = watch.match_keywords(title_text, self._rule_time())
+        if matched:
+            self._log(f"필터링 일치 ({self._format_matches(matched)}) -> 알림 발송", watch)
+            
+            self._notify(watch, title_text, time_text)
+            
+            # 기준점 갱신
+            watch.baseline_time = time_text
+        else:
+            self._log("필터링 불일치 -> 패스", watch)
+    
+    def _process_list_detection(self, watch: Watch, list_image):
+        """목록 감지 처리 (한 번의 OCR로 새로 나타난 모든 줄 처리)"""
+        rows = self.ocr_engine.extract_rows(list_image)
+        # 시간을 읽지 못한 줄은 확인한 메일로 기록할 수 없어 매번 새 메일로 보이므로 건너뜀
+        dated_rows = [row for row in rows if row.time.strip()]
+        new_rows = [row for row in dated_rows if watch.is_new_row(row)]
+        self._log(f"목록 {len(rows)}줄 중 새 메일 {len(new_rows)}건", watch)
+        if len(dated_rows) < len(rows):
+            self._log(f"시간을 읽지 못한 줄 {len(rows) - len(dated_rows)}개 -> 패스", watch)
+        
+        # 목록 위쪽이 최신이므로 오래된 메일부터 알림
+        for row in reversed(new_rows):
+            watch.remember_row(row)
+            self._log(f'제목: "{row.title}" | 시간: "{row.time}"', watch)
+            
+            matched = watch.match_keywords(row.title, self._rule_time())
+            if matched:
+                self._log(f"필터링 일치 ({self._format_matches(matched)}) -> 알림 발송", watch)
+                
+                self._notify(watch, row.title, row.time)
+                
+                watch.baseline_time = row.time
+            else:
+                self._log("필터링 불일치 -> 패스", watch)
+    
+    async def _refresh_loop(self):
+        """새로고침 루프 (대기 중 중지 요청이 오면 바로 취소됨)"""
+        # pyautogui는 import할 때 디스플레이에 연결하므로 새로고침을 쓸 때만 불러옴
+        # (디스플레이가 없으면 import가 실패하므로 작업이 조용히 끝나지 않도록 로그를 남김)
+        try:
+            import pyautogui
+        except Exception as e:
+            self._log(f"새로고침 사용 불가 (pyautogui 로드 실패): {e}")
+            return
+        
+        while self.settings.monitor_settings.refresh_enabled:
+            try:
+                await asyncio.sleep(self.settings.monitor_settings.refresh_interval * 60)
+                await self._run_blocking(pyautogui.press, 'f5')
+                self._log("새로고침 실행")
+            except Exception as e:
+                self._log(f"새로고침 오류: {e}")
+    
+    def _format_matches(self, matched: List[Tuple[str, int]]) -> str:
+        """일치 키워드 로그 문자열 (오타 허용으로 일치하면 편집 거리 표시)"""
+        return ', '.join(keyword if distance == 0 else f"{keyword}, 거리 {distance}"
+                         for keyword, distance in matched)
+    
+    def _log(self, message: str, watch: Optional[Watch] = None):
+        """로그 출력 (감시 대상이 둘 이상이면 이름 표시)"""
+        if watch is not None and len(self.watches) > 1:
+            message = f"[{watch.name}] {message}"
+        self.logger.info(message)
+        if self.on_log_callback:
+            self.on_log_callback(message)
\ No newline at end of file
@@ -0,0 +1,224 @@
+import os
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+import pytesseract
+
+try:
+    import tesserocr
+except ImportError:  # 선택 의존성
+    tesserocr = None
+
+class OCRResult(NamedTuple):
+    """OCR 결과 (텍스트, 단어 평균 신뢰도 0~100)"""
+    text: str
+    confidence: float
+
+class OCRWord(NamedTuple):
+    """단어 위치와 신뢰도"""
+    text: str
+    confidence: float
+    left: int
+    top: int
+    width: int
+    height: int
+    line: Tuple[int, ...]  # tesseract가 부여한 줄 식별자
+
+def mean_confidence(confidences) -> float:
+    """유효한 단어 신뢰도 평균 (tesseract는 비단어에 -1을 줌)"""
+    valid = [float(conf) for conf in confidences if float(conf) >= 0]
+    return sum(valid) / len(valid) if valid else 0.0
+
+class OCRBackend:
+    """OCR 백엔드 인터페이스"""
+    
+    name = "base"
+    
+    def image_to_string(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                        timeout: float = 0) -> str:
+        """numpy 이미지에서 텍스트 추출"""
+        raise NotImplementedError
+    
+    def recognize(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                  timeout: float = 0) -> OCRResult:
+        """텍스트와 단어 신뢰도 추출"""
+        raise NotImplementedError
+    
+    def image_to_words(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                       timeout: float = 0) -> List[OCRWord]:
+        """단어 단위 레이아웃 추출"""
+        raise NotImplementedError
+    
+    def close(self):
+        """리소스 정리"""
+        pass
+
+class PytesseractBackend(OCRBackend):
+    """호출마다 tesseract 프로세스를 실행하는 백엔드 (기존 방식)"""
+    
+    name = "pytesseract"
+    
+    def image_to_string(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                        timeout: float = 0) -> str:
+        config = f"--psm {psm}" if psm is not None else ""
+        return pytesseract.image_to_string(image, lang=lang, config=config, timeout=timeout)
+    
+    def recognize(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                  timeout: float = 0) -> OCRResult:
+        words = self.image_to_words(image, lang, psm, timeout)
+        
+        # 단어들을 (블록, 문단, 줄) 단위로 묶어 image_to_string과 같은 형태로 복원
+        lines: Dict[tuple, list] = {}
+        for word in words:
+            lines.setdefault(word.line, []).append(word.text)
+        
+        text = "\n".join(" ".join(line_words) for line_words in lines.values())
+        return OCRResult(text, mean_confidence(word.confidence for word in words))
+    
+    def image_to_words(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                       timeout: float = 0) -> List[OCRWord]:
+        config = f"--psm {psm}" if psm is not None else ""
+        data = pytesseract.image_to_data(
+            image, lang=lang, config=config, timeout=timeout, output_type=pytesseract.Output.DICT
+        )
+        
+        words = []
+        for i, text in enumerate(data['text']):
+            if not text or not text.strip():
+                continue
+            words.append(OCRWord(
+                text.strip(), float(data['conf'][i]),
+                data['left'][i], data['top'][i], data['width'][i], data['height'][i],
+                (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            ))
+        return words
+
+class TesserocrBackend(OCRBackend):
+    """tesseract API를 프로세스 안에 상주시키는 백엔드
+    
+    워커 스레드마다 언어별 API 인스턴스를 한 번만 만들고 계속 재사용하므로
+    traineddata 로드와 프로세스 생성, 임시 파일 쓰기가 모두 사라진다.
+    스레드마다 잠금을 하나 두고 인식하는 동안 잡고 있으므로, close()는 인식 중인
+    API가 끝나기를 기다렸다가 End()를 부른다.
+    """
+    
+    name = "tesserocr"
+    
+    def __init__(self, tessdata_path: Optional[str] = None):
+        if tesserocr is None:
+            raise RuntimeError("tesserocr가 설치되어 있지 않습니다.")
+        
+        self.logger = logging.getLogger(__name__)
+        self.tessdata_path = tessdata_path or self._find_tessdata()
+        self._local = threading.local()
+        # (스레드 잠금, 그 스레드의 언어별 API) 목록
+        self._threads: List[Tuple[threading.Lock, Dict[str, object]]] = []
+        self._threads_lock = threading.Lock()
+        self._closed = False
+    
+    @staticmethod
+    def _find_tessdata() -> Optional[str]:
+        """tesseract 실행 파일 옆의 tessdata 경로"""
+        cmd_dir = os.path.dirname(pytesseract.pytesseract.tesseract_cmd)
+        path = os.path.join(cmd_dir, "tessdata")
+        return path if cmd_dir and os.path.isdir(path) else None
+    
+    @contextmanager
+    def _use_api(self, lang: str):
+        """현재 스레드의 언어별 API 인스턴스를 잠금을 잡은 채로 반환"""
+        lock = getattr(self._local, "lock", None)
+        if lock is None:
+            lock = self._local.lock = threading.Lock()
+            self._local.apis = {}
+            with self._threads_lock:
+                self._threads.append((lock, self._local.apis))
+        
+        with lock:
+            if self._closed:
+                raise RuntimeError("tesserocr 백엔드가 이미 종료되었습니다.")
+            
+            apis: Dict[str, object] = self._local.apis
+            api = apis.get(lang)
+            if api is None:
+                if self.tessdata_path:
+                    api = tesserocr.PyTessBaseAPI(path=self.tessdata_path, lang=lang)
+                else:
+                    api = tesserocr.PyTessBaseAPI(lang=lang)
+                apis[lang] = api
+                self.logger.debug(f"tesserocr API 생성 [{threading.current_thread().name}]: {lang}")
+            yield api
+    
+    @staticmethod
+    def _recognize(api, image: np.ndarray, psm: Optional[int], timeout: float):
+        """API에 numpy 버퍼를 전달하고 인식 (timeout초를 넘기면 pytesseract처럼 RuntimeError)"""
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+        
+        api.SetPageSegMode(psm if psm is not None else tesserocr.PSM.AUTO)
+        api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+        # Recognize의 timeout은 밀리초 단위이고 0이면 제한 없음
+        if not api.Recognize(timeout=int(timeout * 1000) if timeout > 0 else 0):
+            raise RuntimeError("Tesseract process timeout")
+    
+    def image_to_string(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                        timeout: float = 0) -> str:
+        with self._use_api(lang) as api:
+            self._recognize(api, image, psm, timeout)
+            return api.GetUTF8Text()
+    
+    def recognize(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                  timeout: float = 0) -> OCRResult:
+        with self._use_api(lang) as api:
+            self._recognize(api, image, psm, timeout)
+            text = api.GetUTF8Text()
+            return OCRResult(text, mean_confidence(api.AllWordConfidences()))
+    
+    def image_to_words(self, image: np.ndarray, lang: str, psm: Optional[int] = None,
+                       timeout: float = 0) -> List[OCRWord]:
+        with self._use_api(lang) as api:
+            self._recognize(api, image, psm, timeout)
+            
+            words = []
+            line_index = -1
+            iterator = api.GetIterator()
+            level = tesserocr.RIL.WORD
+            for word_iterator in tesserocr.iterate_level(iterator, level):
+                if word_iterator.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                    line_index += 1
+                text = word_iterator.GetUTF8Text(level)
+                box = word_iterator.BoundingBox(level)
+                if not text or not text.strip() or box is None:
+                    continue
+                x1, y1, x2, y2 = box
+                words.append(OCRWord(
+                    text.strip(), word_iterator.Confidence(level), x1, y1, x2 - x1, y2 - y1, (line_index,)
+                ))
+            return words
+    
+    def close(self):
+        with self._threads_lock:
+            self._closed = True
+            threads, self._threads = self._threads, []
+        # 다른 스레드가 인식 중이면 끝날 때까지 기다렸다가 정리
+        for lock, apis in threads:
+            with lock:
+                for api in apis.values():
+                    api.End()
+                apis.clear()
+
+def create_backend(name: str = "auto") -> OCRBackend:
+    """설정 이름으로 OCR 백엔드 생성"""
+    logger = logging.getLogger(__name__)
+    
+    if name in ("auto", TesserocrBackend.name):
+        if tesserocr is not None:
+            return TesserocrBackend()
+        if name == TesserocrBackend.name:
+            logger.warning("tesserocr를 사용할 수 없어 pytesseract 백엔드로 대체합니다.")
+    elif name != PytesseractBackend.name:
+        logger.warning(f"알 수 없는 OCR 백엔드: {name} -> pytesseract 사용")
+    
+    return PytesseractBackend()
\ No newline at end of file
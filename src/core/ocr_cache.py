@@ -0,0 +1,94 @@
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+import numpy as np
+from .change_detector import dhash
+
+class OCRCache:
+    """영역 이미지 지문 기반 OCR 결과 LRU 캐시
+    
+    exact 모드는 픽셀 바이트의 blake2b 해시를 키로 사용하고,
+    perceptual 모드는 차분 해시(dHash)를 사용해 해밍 거리가
+    max_distance 이하인 이미지를 같은 이미지로 취급한다.
+    """
+    
+    MODES = ('exact', 'perceptual')
+    
+    def __init__(self, max_entries: int = 256, mode: str = 'exact', max_distance: int = 0,
+                 hash_size: int = 16):
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 캐시 모드: {mode}")
+        
+        self.max_entries = max_entries
+        self.mode = mode
+        self.max_distance = max_distance
+        self.hash_size = hash_size
+        self.logger = logging.getLogger(__name__)
+        
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def make_key(self, image: np.ndarray) -> Hashable:
+        """이미지 지문 계산"""
+        if self.mode == 'perceptual':
+            return (image.shape, dhash(image, self.hash_size))
+        
+        digest = hashlib.blake2b(np.ascontiguousarray(image), digest_size=16)
+        digest.update(str((image.shape, image.dtype.str)).encode())
+        return digest.digest()
+    
+    def get(self, key: Hashable) -> Optional[str]:
+        """캐시 조회"""
+        with self._lock:
+            matched_key = key if key in self._entries else self._find_similar(key)
+            if matched_key is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(matched_key)
+            self.hits += 1
+            return self._entries[matched_key]
+    
+    def _find_similar(self, key: Hashable) -> Optional[Hashable]:
+        """해밍 거리 허용 범위 안의 키 검색"""
+        if self.mode != 'perceptual' or self.max_distance <= 0:
+            return None
+        
+        shape, value = key
+        for other_key in reversed(self._entries):
+            other_shape, other_value = other_key
+            if other_shape == shape and bin(value ^ other_value).count('1') <= self.max_distance:
+                return other_key
+        return None
+    
+    def put(self, key: Hashable, text: str):
+        """캐시 저장"""
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, float]:
+        """적중/실패 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0
+            }
\ No newline at end of file
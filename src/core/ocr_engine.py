@@ -1,147 +1,411 @@
-import cv2
-import numpy as np
-from PIL import Image, ImageEnhance, ImageGrab
-import pytesseract
-import re
-import logging
-from typing import List, Tuple, Optional
-from datetime import datetime
-
-class OCREngine:
-    """OCR 처리 엔진"""
-    
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
-    def capture_area(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
-        """화면 영역 캡처"""
-        try:
-            x1, y1, x2, y2 = area
-            screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2))
-            return np.array(screenshot)
-        except Exception as e:
-            self.logger.error(f"영역 캡처 오류: {e}")
-            return None
-    
-    def preprocess_image(self, pil_image: Image.Image) -> Image.Image:
-        """이미지 전처리"""
-        try:
-            # 크기 확대
-            width, height = pil_image.size
-            scale_factor = max(4, 300 / width)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            pil_image = pil_image.resize((new_width, new_height), Image.LANCZOS)
-            
-            # 그레이스케일 변환
-            gray_image = pil_image.convert('L')
-            
-            # 가우시안 블러
-            img_array = np.array(gray_image)
-            blurred = cv2.GaussianBlur(img_array, (1, 1), 0)
-            
-            # 적응형 임계값
-            adaptive_thresh = cv2.adaptiveThreshold(
-                blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                cv2.THRESH_BINARY, 11, 2
-            )
-            
-            # 모폴로지 연산
-            kernel = np.ones((1, 1), np.uint8)
-            morphed = cv2.morphologyEx(adaptive_thresh, cv2.MORPH_CLOSE, kernel)
-            
-            return Image.fromarray(morphed)
-            
-        except Exception as e:
-            self.logger.error(f"이미지 전처리 오류: {e}")
-            return pil_image
-    
-    def extract_text(self, image: np.ndarray) -> str:
-        """이미지에서 텍스트 추출"""
-        try:
-            if isinstance(image, np.ndarray):
-                pil_image = Image.fromarray(image)
-            else:
-                pil_image = image
-            
-            text_results = []
-            
-            # 다양한 OCR 방식 시도
-            ocr_methods = [
-                ('원본', lambda img: pytesseract.image_to_string(img, lang='kor+eng')),
-                ('전처리', lambda img: pytesseract.image_to_string(self.preprocess_image(img), lang='kor+eng')),
-                ('한글전용', lambda img: pytesseract.image_to_string(img, lang='kor')),
-                ('영어전용', lambda img: pytesseract.image_to_string(img, lang='eng')),
-                ('PSM8', lambda img: pytesseract.image_to_string(img, lang='kor+eng', config='--psm 8')),
-                ('확대', lambda img: pytesseract.image_to_string(
-                    img.resize((img.width * 3, img.height * 3), Image.LANCZOS), lang='kor+eng'
-                ))
-            ]
-            
-            for method_name, method_func in ocr_methods:
-                try:
-                    result = method_func(pil_image)
-                    cleaned = self._clean_text(result)
-                    text_results.append((method_name, cleaned))
-                    self.logger.debug(f"OCR [{method_name}]: '{cleaned}'")
-                except Exception as e:
-                    self.logger.debug(f"OCR [{method_name}] 실패: {e}")
-            
-            # 한글 포함 결과 우선 선택
-            return self._select_best_result(text_results)
-            
-        except Exception as e:
-            self.logger.error(f"OCR 처리 오류: {e}")
-            return ""
-    
-    def _clean_text(self, text: str) -> str:
-        """텍스트 정리"""
-        if not text:
-            return ""
-        
-        # 개행 문자 제거 및 공백 정리
-        cleaned = re.sub(r'\s+', ' ', text.strip())
-        
-        # 불필요한 특수문자 제거
-        cleaned = re.sub(r'[|]', '', cleaned)
-        
-        # 연속된 공백 제거
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        
-        return cleaned.strip()
-    
-    def _select_best_result(self, results: List[Tuple[str, str]]) -> str:
-        """최적 결과 선택"""
-        if not results:
-            return ""
-        
-        # 한글 포함 결과 찾기
-        korean_results = []
-        for method, result in results:
-            if re.search(r'[가-힣]', result):
-                korean_results.append((method, result, len(result)))
-        
-        if korean_results:
-            best_korean = max(korean_results, key=lambda x: x[2])
-            self.logger.info(f"최종 선택 [한글우선-{best_korean[0]}]: '{best_korean[1]}'")
-            return best_korean[1]
-        else:
-            best_result = max(results, key=lambda x: len(x[1]))
-            self.logger.info(f"최종 선택 [길이우선-{best_result[0]}]: '{best_result[1]}'")
-            return best_result[1]
-    
-    def calculate_similarity(self, img1: np.ndarray, img2: np.ndarray) -> float:
-        """이미지 유사도 계산"""
-        try:
-            gray1 = cv2.cvtColor(img1, cv2.COLOR_RGB2GRAY)
-            gray2 = cv2.cvtColor(img2, cv2.COLOR_RGB2GRAY)
-            
-            if gray1.shape != gray2.shape:
-                gray2 = cv2.resize(gray2, (gray1.shape[1], gray1.shape[0]))
-            
-            result = cv2.matchTemplate(gray1, gray2, cv2.TM_CCOEFF_NORMED)
-            return max(0, result[0][0])
-            
-        except Exception as e:
-            self.logger.error(f"유사도 계산 오류: {e}")
+import numpy as np
+from PIL import Image, ImageEnhance
+import os
+import re
+import time
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Hashable, List, NamedTuple, Tuple, Optional
+from datetime import datetime
+from .ocr_backend import OCRBackend, OCRResult, create_backend
+from .ocr_cache import OCRCache
+from .frame_source import FrameSource, create_frame_source
+from .recording import RecordingFrameSource
+from .frame_ring import FrameRingBuffer, RingBufferFrameSource
+from .glyph_ocr import GlyphTimeRecognizer
+from .change_detector import template_similarity
+from .preprocess import PreprocessPipeline
+from .list_parser import ListRow, parse_list_rows
+from .strategy_stats import StrategyStats
+from ..config import Config
+from ..models.settings import OCRSettings
+
+class OCRStrategy(NamedTuple):
+    """OCR 방식 (언어, 페이지 분할 모드, 사전 변환)"""
+    name: str
+    lang: str
+    psm: Optional[int] = None
+    transform: Optional[Callable[[np.ndarray, str], np.ndarray]] = None
+
+class OCREngine:
+    """OCR 처리 엔진"""
+    
+    def __init__(self, settings: Optional[OCRSettings] = None, frame_source: Optional[FrameSource] = None):
+        self.settings = settings or OCRSettings()
+        self.logger = logging.getLogger(__name__)
+        # 화면 캡처 공급원 (지정하지 않으면 설정의 캡처 백엔드)
+        self.frame_source = frame_source or create_frame_source(
+            self.settings.capture_backend, self.settings.capture_source, self.settings.capture_loop
+        )
+        # 최근 캡처 프레임 링 버퍼 (오탐/미탐 확인용)
+        self.frame_ring: Optional[FrameRingBuffer] = None
+        if self.settings.capture_ring_mb > 0:
+            self.frame_ring = FrameRingBuffer(Config.RING_BUFFER_FILE, self.settings.capture_ring_mb)
+            self.frame_source = RingBufferFrameSource(self.frame_source, self.frame_ring)
+            self.logger.info(f"최근 화면 링 버퍼: {self.settings.capture_ring_mb}MB")
+        if self.settings.capture_record:
+            # 캡처한 프레임을 그대로 기록 (나중에 replay로 재생)
+            self.frame_source = RecordingFrameSource(self.frame_source, self.settings.capture_record)
+            self.logger.info(f"캡처 프레임 기록: {self.settings.capture_record}")
+        self.logger.info(f"캡처 백엔드: {self.frame_source.name}")
+        self.backend: OCRBackend = create_backend(self.settings.backend)
+        self.logger.info(f"OCR 백엔드: {self.backend.name}")
+        
+        # 영역별 전처리 파이프라인 (출력 버퍼 재사용)
+        self.preprocessor = PreprocessPipeline(self.settings.preprocess_profiles)
+        
+        # 같은 화면이 반복될 때 OCR을 생략하기 위한 결과 캐시
+        self.cache: Optional[OCRCache] = None
+        if self.settings.cache_size > 0:
+            self.cache = OCRCache(
+                max_entries=self.settings.cache_size,
+                mode=self.settings.cache_mode,
+                max_distance=self.settings.cache_max_distance
+            )
+        
+        # 시간 영역 글리프 템플릿 인식기 (tesseract 결과로 학습)
+        self.glyph_recognizer: Optional[GlyphTimeRecognizer] = None
+        if self.settings.time_glyph_match:
+            self.glyph_recognizer = GlyphTimeRecognizer(self.settings.time_glyph_min_reads)
+        
+        # 영역별로 자주 이기는 OCR 방식을 먼저 시도하기 위한 통계
+        self.strategy_stats = StrategyStats()
+        if self.settings.adaptive_order:
+            self.strategy_stats.load(Config.OCR_STATS_FILE)
+        
+        # OCR 전략 병렬 실행용 워커 풀 (최초 사용 시 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    @property
+    def max_workers(self) -> int:
+        """워커 풀 크기"""
+        return self.settings.max_workers or os.cpu_count() or 4
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """워커 풀 반환"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ocr"
+                )
+            return self._executor
+    
+    def cache_stats(self) -> dict:
+        """OCR 캐시 통계"""
+        return self.cache.stats() if self.cache is not None else {}
+    
+    def glyph_stats(self) -> dict:
+        """시간 글리프 인식 통계"""
+        return self.glyph_recognizer.stats() if self.glyph_recognizer is not None else {}
+    
+    def shutdown(self):
+        """워커 풀 및 백엔드 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.backend.close()
+        self.frame_source.close()
+        self.save_strategy_stats()
+    
+    def capture_area(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        """화면 영역 캡처"""
+        try:
+            x1, y1, x2, y2 = area
+            return self.frame_source.capture((x1, y1, x2, y2))
+        except Exception as e:
+            self.logger.error(f"영역 캡처 오류: {e}")
+            return None
+    
+    def capture_areas(self, areas: Dict[Hashable, Tuple[int, int, int, int]]) -> Optional[Dict[Hashable, np.ndarray]]:
+        """여러 화면 영역을 한 번에 캡처
+        
+        모든 영역을 감싸는 사각형을 한 번만 캡처하고 영역별로 복사 없는
+        numpy 뷰를 돌려주므로 영역들이 같은 시점의 화면이 된다.
+        """
+        if not areas:
+            return {}
+        
+        try:
+            left = min(area[0] for area in areas.values())
+            top = min(area[1] for area in areas.values())
+            right = max(area[2] for area in areas.values())
+            bottom = max(area[3] for area in areas.values())
+            
+            frame = self.capture_area((left, top, right, bottom))
+            if frame is None:
+                return None
+            # 영역별 뷰는 요청 좌표 기준으로 자르므로 크기가 다르면 모든 영역이 밀림
+            if frame.shape[:2] != (bottom - top, right - left):
+                self.logger.warning(f"캡처 크기 {frame.shape[1]}x{frame.shape[0]}가 요청 영역 {(left, top, right, bottom)}과 다릅니다.")
+                return None
+            
+            return {
+                name: frame[y1 - top:y2 - top, x1 - left:x2 - left]
+                for name, (x1, y1, x2, y2) in areas.items()
+            }
+        except Exception as e:
+            self.logger.error(f"영역 일괄 캡처 오류: {e}")
+            return None
+    
+    def preprocess_image(self, pil_image: Image.Image, region: str = 'default') -> Image.Image:
+        """이미지 전처리"""
+        try:
+            return Image.fromarray(self.preprocessor.preprocess(np.asarray(pil_image), region).copy())
+        except Exception as e:
+            self.logger.error(f"이미지 전처리 오류: {e}")
+            return pil_image
+    
+    def extract_text(self, image: np.ndarray, region: str = 'default') -> str:
+        """이미지에서 텍스트 추출"""
+        try:
+            if not isinstance(image, np.ndarray):
+                image = np.asarray(image)
+            
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(image)
+                cached_text = self.cache.get(cache_key)
+                if cached_text is not None:
+                    self.logger.debug(f"OCR 캐시 적중: '{cached_text}'")
+                    return cached_text
+            
+            # 시간 영역은 학습한 글자 모양으로 먼저 읽고, 확신할 수 없을 때만 tesseract 사용
+            if region == 'time' and self.glyph_recognizer is not None:
+                glyph_text = self.glyph_recognizer.recognize(image)
+                if glyph_text is not None:
+                    self.logger.debug(f"시간 글리프 인식: '{glyph_text}'")
+                    if cache_key is not None:
+                        self.cache.put(cache_key, glyph_text)
+                    return glyph_text
+            
+            deadline = time.monotonic() + self.settings.timeout
+            ocr_methods = self._get_ocr_methods(deadline, region)
+            ocr_results = self._run_strategies(ocr_methods, image, deadline)
+            
+            best_method, best_text = self._select_winner(ocr_results)
+            if best_method and self.settings.adaptive_order:
+                self.strategy_stats.record_win(region, best_method)
+            
+            if region == 'time' and self.glyph_recognizer is not None and best_text:
+                self.glyph_recognizer.learn(image, best_text)
+            
+            if cache_key is not None and best_text:
+                self.cache.put(cache_key, best_text)
+            return best_text
+            
+        except Exception as e:
+            self.logger.error(f"OCR 처리 오류: {e}")
+            return ""
+    
+    def extract_rows(self, image: np.ndarray, region: str = 'list') -> List[ListRow]:
+        """메일 목록 영역 전체를 한 번의 레이아웃 OCR로 (제목, 시간) 줄 단위 분석"""
+        try:
+            if not isinstance(image, np.ndarray):
+                image = np.asarray(image)
+            
+            factor = self.preprocessor.profile(region).upscale_factor
+            upscaled = self.preprocessor.upscale(image, region)
+            words = self.backend.image_to_words(upscaled, 'kor+eng', psm=6, timeout=self.settings.timeout)
+            
+            rows = []
+            for row in parse_list_rows(words):
+                row.title = self._clean_text(row.title)
+                row.time = self._clean_text(row.time)
+                row.top = int(row.top / factor)
+                row.bottom = int(row.bottom / factor)
+                if row.title:
+                    rows.append(row)
+            
+            self.logger.debug(f"목록 OCR: {len(words)}단어 -> {len(rows)}줄")
+            return rows
+            
+        except Exception as e:
+            self.logger.error(f"목록 OCR 처리 오류: {e}")
+            return []
+    
+    def get_strategies(self) -> List[OCRStrategy]:
+        """다양한 OCR 방식 목록"""
+        return [
+            OCRStrategy('원본', 'kor+eng'),
+            OCRStrategy('전처리', 'kor+eng', transform=self._preprocess_array),
+            OCRStrategy('한글전용', 'kor'),
+            OCRStrategy('영어전용', 'eng'),
+            OCRStrategy('PSM8', 'kor+eng', psm=8),
+            OCRStrategy('확대', 'kor+eng', transform=self._upscale_array)
+        ]
+    
+    def get_strategy_order(self, region: str = 'default') -> List[str]:
+        """영역별로 학습된 OCR 방식 시도 순서"""
+        method_names = [strategy.name for strategy in self.get_strategies()]
+        if not self.settings.adaptive_order:
+            return method_names
+        return self.strategy_stats.order(region, method_names)
+    
+    def save_strategy_stats(self):
+        """학습된 OCR 방식 통계 저장"""
+        if not self.settings.adaptive_order:
+            return
+        try:
+            self.strategy_stats.save(Config.OCR_STATS_FILE)
+        except OSError as e:
+            self.logger.warning(f"OCR 방식 통계 저장 실패: {e}")
+    
+    def _preprocess_array(self, image: np.ndarray, region: str) -> np.ndarray:
+        """numpy 이미지 전처리"""
+        try:
+            return self.preprocessor.preprocess(image, region)
+        except Exception as e:
+            self.logger.error(f"이미지 전처리 오류: {e}")
+            return image
+    
+    def _upscale_array(self, image: np.ndarray, region: str) -> np.ndarray:
+        """numpy 이미지 확대"""
+        return self.preprocessor.upscale(image, region)
+    
+    def _get_ocr_methods(self, deadline: float, region: str = 'default') -> List[Tuple[str, Callable[[np.ndarray], OCRResult]]]:
+        """OCR 방식별 실행 함수 목록 (학습된 순서)"""
+        def make_method(strategy: OCRStrategy) -> Callable[[np.ndarray], OCRResult]:
+            def method(image: np.ndarray) -> OCRResult:
+                if strategy.transform is not None:
+                    image = strategy.transform(image, region)
+                # 마감 시간을 넘긴 tesseract 호출은 백엔드가 중단시킴
+                remaining = max(deadline - time.monotonic(), 0.1)
+                return self.backend.recognize(image, strategy.lang, strategy.psm, timeout=remaining)
+            return method
+        
+        strategies = {strategy.name: strategy for strategy in self.get_strategies()}
+        return [(name, make_method(strategies[name])) for name in self.get_strategy_order(region)]
+    
+    def _is_confident(self, result: OCRResult) -> bool:
+        """조기 종료 가능한 결과인지 확인"""
+        threshold = self.settings.confidence_threshold
+        return threshold > 0 and bool(result.text) and result.confidence >= threshold
+    
+    def _run_strategies(self, ocr_methods, image: np.ndarray, deadline: float) -> List[Tuple[str, OCRResult]]:
+        """OCR 방식 실행 (신뢰도 기준 통과 시 조기 종료)
+        
+        병렬 모드는 모든 방식을 학습된 순서대로 한꺼번에 제출하고 처음으로 신뢰도 기준을
+        통과한 결과가 나오면 아직 시작하지 않은 방식을 취소한다. 순차 모드는 가장 자주
+        이긴 방식부터 하나씩 실행한다.
+        """
+        if self.settings.parallel:
+            return self._run_parallel(ocr_methods, image, deadline)
+        return self._run_sequential(ocr_methods, image, deadline)
+    
+    def _run_method(self, method_name: str, method_func: Callable, image: np.ndarray) -> Optional[OCRResult]:
+        """단일 OCR 방식 실행"""
+        try:
+            result = method_func(image)
+            cleaned = OCRResult(self._clean_text(result.text), result.confidence)
+            self.logger.debug(f"OCR [{method_name}]: '{cleaned.text}' ({cleaned.confidence:.0f})")
+            return cleaned
+        except Exception as e:
+            self.logger.debug(f"OCR [{method_name}] 실패: {e}")
+            return None
+    
+    def _run_sequential(self, ocr_methods, image: np.ndarray, deadline: float) -> List[Tuple[str, OCRResult]]:
+        """OCR 방식 순차 실행"""
+        ocr_results = []
+        for method_name, method_func in ocr_methods:
+            if time.monotonic() >= deadline:
+                self.logger.debug(f"OCR 마감 시간 초과 -> [{method_name}] 이후 생략")
+                break
+            result = self._run_method(method_name, method_func, image)
+            if result is not None:
+                ocr_results.append((method_name, result))
+                if self._is_confident(result):
+                    break
+        return ocr_results
+    
+    def _run_parallel(self, ocr_methods, image: np.ndarray, deadline: float) -> List[Tuple[str, OCRResult]]:
+        """OCR 방식 병렬 실행"""
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._run_method, method_name, method_func, image): method_name
+            for method_name, method_func in ocr_methods
+        }
+        
+        ocr_results = []
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=max(deadline - time.monotonic(), 0),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                self.logger.debug(f"OCR 마감 시간 초과: {len(pending)}개 방식 제외")
+                break
+            
+            for future in done:
+                if future.result() is not None:
+                    ocr_results.append((futures[future], future.result()))
+            
+            if any(self._is_confident(result) for _, result in ocr_results):
+                break
+        
+        for future in pending:
+            future.cancel()
+        return ocr_results
+    
+    def _select_winner(self, ocr_results: List[Tuple[str, OCRResult]]) -> Tuple[Optional[str], str]:
+        """최종 결과 선택 (신뢰도 기준 통과 결과 우선)"""
+        confident = [(method, result) for method, result in ocr_results if self._is_confident(result)]
+        if confident:
+            method, result = max(confident, key=lambda x: x[1].confidence)
+            self.logger.info(f"최종 선택 [신뢰도-{method}]: '{result.text}' ({result.confidence:.0f})")
+            return method, result.text
+        
+        # 선택 규칙이 순서에 의존하므로 기본 방식 순서로 정렬
+        canonical = [strategy.name for strategy in self.get_strategies()]
+        ordered = sorted(ocr_results, key=lambda x: canonical.index(x[0]))
+        return self._select_best([(method, result.text) for method, result in ordered])
+    
+    def _clean_text(self, text: str) -> str:
+        """텍스트 정리"""
+        if not text:
+            return ""
+        
+        # 개행 문자 제거 및 공백 정리
+        cleaned = re.sub(r'\s+', ' ', text.strip())
+        
+        # 불필요한 특수문자 제거
+        cleaned = re.sub(r'[|]', '', cleaned)
+        
+        # 연속된 공백 제거
+        cleaned = re.sub(r'\s+', ' ', cleaned)
+        
+        return cleaned.strip()
+    
+    def _select_best_result(self, results: List[Tuple[str, str]]) -> str:
+        """최적 결과 선택"""
+        return self._select_best(results)[1]
+    
+    def _select_best(self, results: List[Tuple[str, str]]) -> Tuple[Optional[str], str]:
+        """최적 결과와 선택된 방식"""
+        if not results:
+            return None, ""
+        
+        # 한글 포함 결과 찾기
+        korean_results = []
+        for method, result in results:
+            if re.search(r'[가-힣]', result):
+                korean_results.append((method, result, len(result)))
+        
+        if korean_results:
+            best_korean = max(korean_results, key=lambda x: x[2])
+            self.logger.info(f"최종 선택 [한글우선-{best_korean[0]}]: '{best_korean[1]}'")
+            return best_korean[0], best_korean[1]
+        else:
+            best_result = max(results, key=lambda x: len(x[1]))
+            self.logger.info(f"최종 선택 [길이우선-{best_result[0]}]: '{best_result[1]}'")
+            return best_result
+    
+    def calculate_similarity(self, img1: np.ndarray, img2: np.ndarray) -> float:
+        """이미지 유사도 계산"""
+        try:
+            return template_similarity(img1, img2)
+            
+        except Exception as e:
+            self.logger.error(f"유사도 계산 오류: {e}")
             return 0
\ No newline at end of file
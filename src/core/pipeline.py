@@ -0,0 +1,175 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+# 버리는 항목을 새 항목에 합치는 함수 (버릴 항목, 새 항목) -> 합친 항목
+MergeFunc = Callable[[Any, Any], Any]
+
+class StageQueue:
+    """오래된 항목을 버리는 크기 제한 큐
+    
+    가득 찬 상태에서 넣으면 가장 오래된 항목을 버리고 새 항목을 넣으므로
+    앞 단계는 뒤 단계가 느려도 멈추지 않는다. 버린 개수와 최대 적재량을 기록한다.
+    merge를 주면 버릴 항목을 새 항목에 합쳐 넣으므로 버린 항목의 정보가 사라지지 않는다.
+    """
+    
+    def __init__(self, name: str, maxsize: int, merge: Optional[MergeFunc] = None):
+        self.name = name
+        self.maxsize = max(maxsize, 1)
+        self.merge = merge
+        self._items = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        
+        self.put_count = 0
+        self.dropped = 0
+        self.max_depth = 0
+    
+    def put(self, item: Any) -> bool:
+        """항목 추가 (오래된 항목을 버렸으면 False)"""
+        with self._condition:
+            dropped = len(self._items) >= self.maxsize
+            if dropped:
+                oldest = self._items.popleft()
+                self.dropped += 1
+                if self.merge is not None:
+                    item = self.merge(oldest, item)
+            self._items.append(item)
+            self.put_count += 1
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._condition.notify()
+            return not dropped
+    
+    def get(self) -> Optional[Any]:
+        """항목 꺼내기 (닫히고 비었으면 None)"""
+        with self._condition:
+            while not self._items and not self._closed:
+                self._condition.wait()
+            if not self._items:
+                return None
+            return self._items.popleft()
+    
+    def close(self, discard: bool = False):
+        """대기 중인 소비자 깨우기 (discard가 아니면 남은 항목은 처리됨)"""
+        with self._condition:
+            if discard:
+                self.dropped += len(self._items)
+                self._items.clear()
+            self._closed = True
+            self._condition.notify_all()
+    
+    def depth(self) -> int:
+        """현재 적재량"""
+        with self._condition:
+            return len(self._items)
+    
+    def stats(self) -> Dict[str, int]:
+        """큐 통계"""
+        return {
+            'depth': self.depth(),
+            'max_depth': self.max_depth,
+            'put': self.put_count,
+            'dropped': self.dropped
+        }
+
+class PipelineStage:
+    """입력 큐에서 항목을 꺼내 처리하는 단계 워커
+    
+    handler가 값을 돌려주면 다음 단계 큐로 넘기고, None이면 그 항목은
+    여기서 끝난다. 처리 중 예외는 로그만 남기고 다음 항목으로 넘어간다.
+    """
+    
+    def __init__(self, name: str, handler: Callable[[Any], Any], input_queue: StageQueue,
+                 output_queue: Optional[StageQueue] = None):
+        self.name = name
+        self.handler = handler
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.logger = logging.getLogger(__name__)
+        self.thread: Optional[threading.Thread] = None
+        
+        self.processed = 0
+        self.errors = 0
+        self.busy_time = 0.0
+        self.started_at = 0.0
+    
+    def start(self):
+        """워커 스레드 시작"""
+        self.started_at = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name=f"pipeline-{self.name}", daemon=True)
+        self.thread.start()
+    
+    def _run(self):
+        while True:
+            item = self.input_queue.get()
+            if item is None:
+                break
+            
+            started = time.perf_counter()
+            try:
+                result = self.handler(item)
+                if result is not None and self.output_queue is not None:
+                    self.output_queue.put(result)
+            except Exception as e:
+                self.errors += 1
+                self.logger.error(f"[{self.name}] 처리 오류: {e}")
+            self.busy_time += time.perf_counter() - started
+            self.processed += 1
+    
+    def join(self, timeout: Optional[float] = None):
+        """워커 종료 대기"""
+        if self.thread is not None:
+            self.thread.join(timeout)
+    
+    def stats(self) -> Dict[str, float]:
+        """단계 통계 (처리량은 초당 항목 수)"""
+        elapsed = max(time.perf_counter() - self.started_at, 1e-9) if self.started_at else 0.0
+        return {
+            'processed': self.processed,
+            'errors': self.errors,
+            'throughput': self.processed / elapsed if elapsed else 0.0,
+            'busy': self.busy_time / elapsed if elapsed else 0.0,
+            'mean_ms': self.busy_time / self.processed * 1000 if self.processed else 0.0,
+            **self.input_queue.stats()
+        }
+
+class Pipeline:
+    """단계들을 큐로 이은 파이프라인
+    
+    첫 단계 큐에는 put()으로 넣고, 마지막 단계는 출력 큐 없이 부수 효과만 낸다.
+    stop()은 앞 단계부터 차례로 큐를 닫는다. 중간 단계의 남은 프레임은 버리고
+    마지막 단계(알림)에 이미 들어온 항목은 모두 처리한 뒤 종료한다.
+    """
+    
+    def __init__(self):
+        self.stages: List[PipelineStage] = []
+    
+    def add_stage(self, name: str, handler: Callable[[Any], Any], maxsize: int,
+                  merge: Optional[MergeFunc] = None) -> PipelineStage:
+        """단계 추가 (직전 단계 출력이 이 단계 입력 큐로 연결됨)"""
+        stage = PipelineStage(name, handler, StageQueue(name, maxsize, merge))
+        if self.stages:
+            self.stages[-1].output_queue = stage.input_queue
+        self.stages.append(stage)
+        return stage
+    
+    def start(self):
+        """모든 단계 워커 시작"""
+        for stage in self.stages:
+            stage.start()
+    
+    def put(self, item: Any) -> bool:
+        """첫 단계에 항목 투입"""
+        return self.stages[0].input_queue.put(item)
+    
+    def stop(self, timeout: float = 5.0):
+        """단계 종료 (각 단계 대기 시간 timeout초)"""
+        for stage in self.stages:
+            stage.input_queue.close(discard=stage is not self.stages[-1])
+            stage.join(timeout)
+    
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """단계별 통계"""
+        return {stage.name: stage.stats() for stage in self.stages}
\ No newline at end of file
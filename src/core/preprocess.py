@@ -0,0 +1,110 @@
+import threading
+from dataclasses import dataclass, fields
+from typing import Dict, Optional, Tuple
+import cv2
+import numpy as np
+
+@dataclass
+class PreprocessProfile:
+    """영역별 전처리 설정"""
+    scale: float = 4.0  # 최소 확대 배율
+    min_width: int = 300  # 확대 후 최소 폭(px)
+    blur_ksize: int = 1  # 1 이하면 블러 생략
+    morph_ksize: int = 1  # 1 이하면 모폴로지 생략
+    block_size: int = 11  # 적응형 임계값 블록 크기
+    threshold_c: int = 2  # 적응형 임계값 상수
+    upscale_factor: float = 3.0  # '확대' 방식 배율
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PreprocessProfile':
+        """알 수 없는 키를 무시하고 생성"""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+class PreprocessPipeline:
+    """numpy/OpenCV 전처리 파이프라인
+    
+    그레이스케일 변환, 확대, 블러, 적응형 임계값, 모폴로지를 PIL 변환 없이
+    numpy 배열로 처리한다. 출력 버퍼는 (영역, 단계, 크기)별로 만들어 두고
+    재사용하며, 병렬 OCR 워커끼리 버퍼를 공유하지 않도록 스레드마다 따로 둔다.
+    """
+    
+    def __init__(self, profiles: Optional[Dict[str, dict]] = None):
+        self.profiles: Dict[str, PreprocessProfile] = {
+            region: PreprocessProfile.from_dict(profile)
+            for region, profile in (profiles or {}).items()
+        }
+        self.default_profile = self.profiles.get('default', PreprocessProfile())
+        self._local = threading.local()
+        self._kernels: Dict[Tuple[str, int], np.ndarray] = {}
+    
+    def profile(self, region: str) -> PreprocessProfile:
+        """영역 전처리 설정"""
+        return self.profiles.get(region, self.default_profile)
+    
+    def _buffer(self, region: str, stage: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """재사용 출력 버퍼"""
+        buffers = getattr(self._local, 'buffers', None)
+        if buffers is None:
+            buffers = self._local.buffers = {}
+        
+        key = (region, stage)
+        buffer = buffers.get(key)
+        if buffer is None or buffer.shape != shape:
+            buffer = buffers[key] = np.empty(shape, np.uint8)
+        return buffer
+    
+    def _kernel(self, kind: str, ksize: int) -> np.ndarray:
+        """모폴로지 커널 캐시"""
+        kernel = self._kernels.get((kind, ksize))
+        if kernel is None:
+            kernel = self._kernels[(kind, ksize)] = np.ones((ksize, ksize), np.uint8)
+        return kernel
+    
+    def _gray(self, image: np.ndarray, region: str) -> np.ndarray:
+        """그레이스케일 (이미 회색조면 그대로)"""
+        if image.ndim == 2:
+            return image
+        gray = self._buffer(region, 'gray', image.shape[:2])
+        code = cv2.COLOR_RGBA2GRAY if image.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+        cv2.cvtColor(image, code, dst=gray)
+        return gray
+    
+    def _resize(self, image: np.ndarray, region: str, stage: str, factor: float) -> np.ndarray:
+        """버퍼에 LANCZOS 확대"""
+        height, width = image.shape[:2]
+        new_size = (int(width * factor), int(height * factor))
+        out = self._buffer(region, stage, (new_size[1], new_size[0]) + image.shape[2:])
+        cv2.resize(image, new_size, dst=out, interpolation=cv2.INTER_LANCZOS4)
+        return out
+    
+    def preprocess(self, image: np.ndarray, region: str = 'default') -> np.ndarray:
+        """OCR용 이진화 이미지 생성"""
+        profile = self.profile(region)
+        
+        # 회색조로 먼저 바꿔 확대할 채널 수를 줄임
+        gray = self._gray(image, region)
+        factor = max(profile.scale, profile.min_width / max(gray.shape[1], 1))
+        enlarged = self._resize(gray, region, 'enlarged', factor)
+        
+        if profile.blur_ksize > 1:
+            blurred = self._buffer(region, 'blurred', enlarged.shape)
+            cv2.GaussianBlur(enlarged, (profile.blur_ksize, profile.blur_ksize), 0, dst=blurred)
+            enlarged = blurred
+        
+        binary = self._buffer(region, 'binary', enlarged.shape)
+        cv2.adaptiveThreshold(
+            enlarged, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            cv2.THRESH_BINARY, profile.block_size, profile.threshold_c, dst=binary
+        )
+        
+        if profile.morph_ksize > 1:
+            morphed = self._buffer(region, 'morphed', binary.shape)
+            cv2.morphologyEx(binary, cv2.MORPH_CLOSE, self._kernel('close', profile.morph_ksize), dst=morphed)
+            binary = morphed
+        
+        return binary
+    
+    def upscale(self, image: np.ndarray, region: str = 'default') -> np.ndarray:
+        """'확대' 방식용 확대 이미지"""
+        return self._resize(image, region, 'upscaled', self.profile(region).upscale_factor)
\ No newline at end of file
@@ -0,0 +1,281 @@
+import json
+import mmap
+import time
+import zlib
+import struct
+import logging
+import threading
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+from .frame_source import FrameSource, crop_frame
+
+# 파일 머리말과 청크 머리말 (매직, 메타데이터 길이, 압축 데이터 길이, 원본 길이)
+FILE_MAGIC = b'EMREC01\n'
+CHUNK_MAGIC = b'FRCK'
+CHUNK_HEADER = struct.Struct('<4sIII')
+
+class FrameRecorder:
+    """캡처한 영역 이미지를 타임스탬프와 함께 청크 단위로 기록
+    
+    파일은 머리말 뒤에 청크가 이어지는 구조다. 청크마다 JSON 메타데이터(프레임별
+    시각, 캡처 좌표, 크기)와 프레임 바이트를 zlib으로 압축한 데이터가 들어 있어
+    청크 하나만으로 복원할 수 있고, 기록 도중 프로그램이 죽어도 마지막 청크만 잃는다.
+    
+    같은 청크 안에서 직전 프레임과 크기가 같으면 XOR 차분을 저장하므로 화면이
+    그대로인 프레임은 거의 0바이트로 압축된다 (zlib 창은 32KB라 차분 없이는
+    프레임 사이의 반복을 찾지 못함).
+    """
+    
+    def __init__(self, file_path, chunk_frames: int = 64, chunk_bytes: int = 16 * 1024 * 1024,
+                 compress_level: int = 1, clock=time.time):
+        self.file_path = Path(file_path)
+        self.chunk_frames = chunk_frames
+        self.chunk_bytes = chunk_bytes
+        self.compress_level = compress_level
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.file_path, 'wb')
+        self._file.write(FILE_MAGIC)
+        self._frames: List[dict] = []
+        self._parts: List[bytes] = []
+        self._raw_size = 0
+        self._previous: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self.frame_count = 0
+    
+    def write(self, area: Tuple[int, int, int, int], image: np.ndarray, timestamp: Optional[float] = None):
+        """프레임 하나 기록"""
+        image = np.ascontiguousarray(image)
+        with self._lock:
+            if self._file is None:
+                return
+            
+            delta = self._previous is not None and self._previous.shape == image.shape
+            data = np.bitwise_xor(image, self._previous) if delta else image
+            self._frames.append({
+                'time': self.clock() if timestamp is None else timestamp,
+                'area': list(area),
+                'shape': list(image.shape),
+                'delta': delta,
+                'offset': self._raw_size,
+            })
+            self._parts.append(data.tobytes())
+            self._raw_size += image.nbytes
+            self._previous = image
+            self.frame_count += 1
+            
+            if len(self._frames) >= self.chunk_frames or self._raw_size >= self.chunk_bytes:
+                self._flush_chunk()
+    
+    def _flush_chunk(self):
+        if not self._frames:
+            return
+        meta = json.dumps(self._frames).encode('utf-8')
+        blob = zlib.compress(b''.join(self._parts), self.compress_level)
+        self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, len(meta), len(blob), self._raw_size))
+        self._file.write(meta)
+        self._file.write(blob)
+        self._file.flush()
+        
+        # 청크마다 첫 프레임은 차분 없이 저장 (청크 단위 복원)
+        self._frames = []
+        self._parts = []
+        self._raw_size = 0
+        self._previous = None
+    
+    def close(self):
+        """남은 프레임 기록 후 파일 닫기"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush_chunk()
+            self._file.close()
+            self._file = None
+        self.logger.info(f"프레임 기록 완료: {self.frame_count}장 -> {self.file_path}")
+
+class FrameRecording:
+    """FrameRecorder로 기록한 파일 읽기
+    
+    파일을 mmap으로 열고 청크 머리말만 훑어 색인을 만든다. 압축 데이터는 필요한
+    청크만 mmap 조각에서 바로 풀고, 마지막으로 푼 청크 하나만 메모리에 둔다.
+    끝이 잘린 청크(기록 중 비정상 종료)는 무시한다.
+    """
+    
+    def __init__(self, file_path):
+        self.file_path = Path(file_path)
+        self.logger = logging.getLogger(__name__)
+        self._file = open(self.file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"빈 기록 파일입니다: {self.file_path}")
+        if self._mmap[:len(FILE_MAGIC)] != FILE_MAGIC:
+            self.close()
+            raise ValueError(f"프레임 기록 파일이 아닙니다: {self.file_path}")
+        
+        # 청크별 (압축 데이터 위치, 압축 길이, 메타데이터), 프레임별 (청크 번호, 청크 안 순서)
+        self._chunks: List[Tuple[int, int, List[dict]]] = []
+        self._index: List[Tuple[int, int]] = []
+        self._scan()
+        
+        self._cached_chunk: Optional[int] = None
+        self._cached_frames: List[np.ndarray] = []
+    
+    def _scan(self):
+        position = len(FILE_MAGIC)
+        size = len(self._mmap)
+        while position + CHUNK_HEADER.size <= size:
+            magic, meta_len, blob_len, _ = CHUNK_HEADER.unpack_from(self._mmap, position)
+            body = position + CHUNK_HEADER.size
+            if magic != CHUNK_MAGIC or body + meta_len + blob_len > size:
+                self.logger.warning(f"기록 파일 끝이 잘려 있어 {position}바이트 이후를 무시합니다.")
+                break
+            
+            frames = json.loads(bytes(self._mmap[body:body + meta_len]))
+            chunk_id = len(self._chunks)
+            self._chunks.append((body + meta_len, blob_len, frames))
+            self._index.extend((chunk_id, order) for order in range(len(frames)))
+            position = body + meta_len + blob_len
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    @property
+    def duration(self) -> float:
+        """첫 프레임부터 마지막 프레임까지 기록 시간(초)"""
+        if not self._index:
+            return 0.0
+        return self.meta(len(self) - 1)['time'] - self.meta(0)['time']
+    
+    def meta(self, index: int) -> dict:
+        """프레임 메타데이터 (time, area, shape)"""
+        chunk_id, order = self._index[index]
+        return self._chunks[chunk_id][2][order]
+    
+    def _decode_chunk(self, chunk_id: int) -> List[np.ndarray]:
+        if self._cached_chunk == chunk_id:
+            return self._cached_frames
+        
+        offset, blob_len, frames = self._chunks[chunk_id]
+        raw = zlib.decompress(self._mmap[offset:offset + blob_len])
+        images = []
+        previous = None
+        for frame in frames:
+            shape = tuple(frame['shape'])
+            count = int(np.prod(shape))
+            image = np.frombuffer(raw, dtype=np.uint8, count=count, offset=frame['offset']).reshape(shape)
+            if frame['delta']:
+                image = np.bitwise_xor(image, previous)
+            images.append(image)
+            previous = image
+        
+        self._cached_chunk = chunk_id
+        self._cached_frames = images
+        return images
+    
+    def frame(self, index: int) -> Tuple[float, Tuple[int, int, int, int], np.ndarray]:
+        """프레임 (시각, 캡처 좌표, 이미지), 이미지는 읽기 전용"""
+        chunk_id, order = self._index[index]
+        meta = self._chunks[chunk_id][2][order]
+        return meta['time'], tuple(meta['area']), self._decode_chunk(chunk_id)[order]
+    
+    def __iter__(self) -> Iterator[Tuple[float, Tuple[int, int, int, int], np.ndarray]]:
+        for index in range(len(self)):
+            yield self.frame(index)
+    
+    def close(self):
+        self._cached_frames = []
+        self._mmap.close()
+        self._file.close()
+
+class RecordingFrameSource(FrameSource):
+    """다른 프레임 공급원의 캡처를 그대로 돌려주면서 파일에 기록"""
+    
+    def __init__(self, source: FrameSource, file_path, **recorder_options):
+        self.source = source
+        self.name = source.name
+        self.recorder = FrameRecorder(file_path, **recorder_options)
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        image = self.source.capture(area)
+        if image is not None:
+            self.recorder.write(area, image)
+        return image
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        return self.source.screen_bounds()
+    
+    def close(self):
+        self.recorder.close()
+        self.source.close()
+
+class ReplayFrameSource(FrameSource):
+    """기록 파일을 캡처 호출 순서대로 재생하는 프레임 공급원
+    
+    모니터링은 기록할 때와 같은 순서로 캡처를 호출하므로 (기준점 설정, 주기별
+    일괄 캡처) 호출마다 다음 프레임을 돌려주면 같은 화면 흐름이 재현된다.
+    요청 좌표가 기록 좌표 안에 있으면 그 부분을 잘라서 돌려준다.
+    기록 좌표가 요청 좌표를 포함하지 않는 프레임(창 이동 추적을 켜고 기록할 때
+    생기는 템플릿 캡처 등)은 건너뛰고 포함하는 다음 프레임을 돌려준다.
+    """
+    
+    name = "recording"
+    
+    def __init__(self, file_path, loop: bool = False):
+        self.recording = FrameRecording(file_path)
+        if not len(self.recording):
+            raise ValueError(f"기록된 프레임이 없습니다: {file_path}")
+        self.loop = loop
+        self.logger = logging.getLogger(__name__)
+        self.position = 0
+        self.timestamp = self.recording.meta(0)['time']
+        # 요청 좌표를 포함하지 않아 건너뛴 프레임 수
+        self.skipped = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def finished(self) -> bool:
+        return not self.loop and self.position >= len(self.recording)
+    
+    @staticmethod
+    def _contains(recorded_area, area) -> bool:
+        return (recorded_area[0] <= area[0] and recorded_area[1] <= area[1]
+                and area[2] <= recorded_area[2] and area[3] <= recorded_area[3])
+    
+    def capture(self, area: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        with self._lock:
+            # 반복 재생이어도 한 바퀴 안에 맞는 프레임이 없으면 포기
+            for _ in range(len(self.recording)):
+                if self.position >= len(self.recording):
+                    if not self.loop:
+                        return None
+                    self.position = 0
+                index = self.position
+                self.position += 1
+                if self._contains(self.recording.meta(index)['area'], area):
+                    break
+                if not self.skipped:
+                    self.logger.warning(f"기록 좌표가 요청 영역 {tuple(area)}을 포함하지 않는 프레임을 건너뜁니다 "
+                                        f"(창 이동 추적을 켜고 기록한 파일일 수 있음).")
+                self.skipped += 1
+            else:
+                return None
+            timestamp, recorded_area, image = self.recording.frame(index)
+            self.timestamp = timestamp
+        
+        if tuple(area) == recorded_area:
+            return image
+        x1, y1 = recorded_area[0], recorded_area[1]
+        return crop_frame(image, (area[0] - x1, area[1] - y1, area[2] - x1, area[3] - y1), self.logger)
+    
+    def screen_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """다음 프레임의 기록 좌표 (화면 전체를 기록하지 않았으면 그 범위만 찾음)"""
+        index = self.position if self.position < len(self.recording) else len(self.recording) - 1
+        return tuple(self.recording.meta(index)['area'])
+    
+    def close(self):
+        self.recording.close()
\ No newline at end of file
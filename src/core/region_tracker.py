@@ -0,0 +1,262 @@
+import re
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import cv2
+import numpy as np
+
+Area = Tuple[int, int, int, int]
+
+@dataclass
+class RegionAnchor:
+    """영역 하나의 기준 템플릿과 찾은 위치"""
+    area: Area  # 선택한 영역 (원래 좌표)
+    template: np.ndarray  # 영역에 여백을 붙인 회색조 이미지 (마지막으로 확인한 화면)
+    original: np.ndarray  # 처음 저장한 템플릿 (창을 최소화했다 다른 곳에 띄운 경우 대비)
+    band: np.ndarray  # 템플릿 중 여백 부분 (영역 안은 메일이 바뀌므로 비교하지 않음)
+    margin: Tuple[int, int]  # 영역 왼쪽/위쪽 여백 (화면 가장자리에서는 줄어듦)
+    offset: Tuple[int, int] = (0, 0)
+    misses: int = 0
+    # 찾지 못했을 때 처음 템플릿으로 다시 찾아 볼 간격과 남은 주기 (0이면 찾은 상태)
+    retry_interval: int = 0
+    retry_after: int = 0
+    
+    def rect(self) -> Area:
+        """현재 위치 기준 템플릿 좌표"""
+        x1 = self.area[0] - self.margin[0] + self.offset[0]
+        y1 = self.area[1] - self.margin[1] + self.offset[1]
+        height, width = self.template.shape
+        return (x1, y1, x1 + width, y1 + height)
+
+class RegionTracker:
+    """창 이동에 맞춰 감시 영역 위치를 따라가는 추적기
+    
+    영역마다 주변 여백을 포함한 작은 템플릿을 만들어 두고, 매 주기 영역과 함께
+    캡처한 템플릿 범위의 여백 부분만 비교한다(작은 영역의 평균 차이라 비용이
+    거의 없음). 여백이 LOST_FRAMES번 연속 맞지 않으면 화면 전체를 캡처해
+    축소 이미지에서 후보 위치를 고르고 원본 해상도에서 다듬어 다시 찾는다.
+    찾은 이동량은 캐시해 두고 이후 캡처 좌표에 더한다.
+    
+    어디에서도 찾지 못하면 창은 그대로이고 주변 화면(옆 줄 메일 등)이 바뀐
+    것으로 보고 현재 위치에서 템플릿을 다시 만든다. 창을 닫았거나 최소화한
+    경우일 수도 있으므로 그 뒤로는 처음 템플릿으로 가끔(간격을 두 배씩 늘리며)
+    다시 찾아 본다.
+    """
+    
+    # 영역 주변에 붙일 여백(픽셀)
+    MARGIN = 24
+    # 조잡 탐색 축소 배율
+    SCALE = 4
+    # 여백 평균 밝기 차이가 이보다 크면 어긋난 것으로 봄 (0~255)
+    VERIFY_MAX_DIFF = 12.0
+    # 연속으로 이만큼 어긋나면 다시 찾음
+    LOST_FRAMES = 2
+    # 다시 찾은 위치의 여백 평균 제곱 차이 허용값
+    RELOCATE_MAX_MSE = 300.0
+    # 조잡 탐색에서 원본 해상도로 다듬어 볼 후보 수
+    CANDIDATES = 5
+    # 여백의 밝기 표준편차가 이보다 작으면 특징이 없어 추적하지 않음
+    MIN_TEXTURE = 4.0
+    # 찾지 못한 뒤 처음 템플릿으로 다시 찾기까지의 최소/최대 주기 수
+    RETRY_FRAMES = 4
+    MAX_RETRY_FRAMES = 64
+    
+    def __init__(self, name: str, anchor_dir: Path):
+        self.name = name
+        self.anchor_dir = Path(anchor_dir)
+        self.logger = logging.getLogger(__name__)
+        self.anchors: Dict[str, RegionAnchor] = {}
+        self.relocations = 0
+        # 마지막으로 찾은 창 이동량 (템플릿이 없는 영역도 같은 창에 있으므로 함께 옮김)
+        self.window_offset: Tuple[int, int] = (0, 0)
+        # 주변에 특징이 없어 추적하지 않는 영역 (영역을 다시 선택하면 다시 시도)
+        self._untracked: Dict[str, Area] = {}
+        self._lock = threading.Lock()
+    
+    def _anchor_path(self, region: str, area: Area) -> Path:
+        safe_name = re.sub(r'[^0-9A-Za-z가-힣_-]+', '_', self.name) or "watch"
+        return self.anchor_dir / f"{safe_name}_{region}_{'_'.join(map(str, area))}.png"
+    
+    def offset(self, region: str) -> Tuple[int, int]:
+        anchor = self.anchors.get(region)
+        return anchor.offset if anchor is not None else self.window_offset
+    
+    def is_detached(self, region: str) -> bool:
+        """영역을 찾지 못해 현재 위치로 대신 감시 중인지 여부"""
+        anchor = self.anchors.get(region)
+        return anchor is not None and anchor.retry_interval > 0
+    
+    def shift(self, areas: Dict[str, Area]) -> Dict[str, Area]:
+        """캐시한 이동량을 더한 캡처 좌표"""
+        shifted = {}
+        for region, (x1, y1, x2, y2) in areas.items():
+            dx, dy = self.offset(region)
+            shifted[region] = (x1 + dx, y1 + dy, x2 + dx, y2 + dy)
+        return shifted
+    
+    def anchor_areas(self) -> Dict[str, Area]:
+        """영역과 함께 캡처할 템플릿 범위 ({'title_anchor': 좌표, ...})"""
+        return {f"{region}_anchor": anchor.rect() for region, anchor in self.anchors.items()}
+    
+    def sync(self, areas: Dict[str, Area], capture: Callable[[Area], Optional[np.ndarray]]):
+        """설정의 영역에 맞춰 템플릿 준비
+        
+        영역 좌표별로 저장한 템플릿이 있으면 불러오고(재시작해도 처음 화면과 비교),
+        없으면 지금 화면으로 만든다. 영역을 다시 선택하면 새 템플릿을 만든다.
+        """
+        with self._lock:
+            for region in list(self.anchors):
+                if self.anchors[region].area != areas.get(region):
+                    del self.anchors[region]
+            
+            for region, area in areas.items():
+                if region in self.anchors or self._untracked.get(region) == area:
+                    continue
+                anchor = self._load_anchor(region, area) or self._create_anchor(region, area, capture)
+                if anchor is not None:
+                    self.anchors[region] = anchor
+    
+    def _make_anchor(self, area: Area, template: np.ndarray, margin: Tuple[int, int]) -> Optional[RegionAnchor]:
+        width, height = area[2] - area[0], area[3] - area[1]
+        band = np.ones(template.shape, bool)
+        band[margin[1]:margin[1] + height, margin[0]:margin[0] + width] = False
+        if not band.any() or template[band].std() < self.MIN_TEXTURE:
+            return None
+        return RegionAnchor(area, template, template, band, margin)
+    
+    def _load_anchor(self, region: str, area: Area) -> Optional[RegionAnchor]:
+        file_path = self._anchor_path(region, area)
+        if not file_path.exists():
+            return None
+        template = cv2.imread(str(file_path), cv2.IMREAD_GRAYSCALE)
+        if template is None:
+            return None
+        # 화면 왼쪽/위쪽 가장자리에서 잘린 여백은 파일 크기로 복원
+        width, height = area[2] - area[0], area[3] - area[1]
+        margin = (template.shape[1] - width - self.MARGIN, template.shape[0] - height - self.MARGIN)
+        if min(margin) < 0:
+            return None
+        return self._make_anchor(area, template, margin)
+    
+    def _create_anchor(self, region: str, area: Area,
+                       capture: Callable[[Area], Optional[np.ndarray]]) -> Optional[RegionAnchor]:
+        margin = (min(self.MARGIN, area[0]), min(self.MARGIN, area[1]))
+        rect = (area[0] - margin[0], area[1] - margin[1], area[2] + self.MARGIN, area[3] + self.MARGIN)
+        image = capture(rect)
+        if image is None or image.shape[:2] != (rect[3] - rect[1], rect[2] - rect[0]):
+            return None
+        
+        anchor = self._make_anchor(area, cv2.cvtColor(image, cv2.COLOR_RGB2GRAY), margin)
+        if anchor is None:
+            self.logger.info(f"[{self.name}] {region} 영역 주변에 특징이 없어 위치 추적을 하지 않습니다.")
+            self._untracked[region] = area
+            return None
+        
+        self.anchor_dir.mkdir(parents=True, exist_ok=True)
+        cv2.imwrite(str(self._anchor_path(region, area)), anchor.template)
+        return anchor
+    
+    def verify(self, frame: Dict[str, np.ndarray]) -> Tuple[bool, List[str]]:
+        """프레임과 함께 캡처한 템플릿 범위 비교 (모두 맞는지, 다시 찾아야 할 영역 목록)"""
+        matched = True
+        lost = []
+        with self._lock:
+            for region, anchor in self.anchors.items():
+                image = frame.get(f"{region}_anchor")
+                if image is not None and image.shape[:2] == anchor.template.shape and \
+                        cv2.absdiff(cv2.cvtColor(image, cv2.COLOR_RGB2GRAY), anchor.template)[anchor.band].mean() \
+                        <= self.VERIFY_MAX_DIFF:
+                    anchor.misses = 0
+                else:
+                    matched = False
+                    anchor.misses += 1
+                
+                if anchor.retry_after:
+                    anchor.retry_after -= 1
+                if anchor.misses >= self.LOST_FRAMES or (anchor.retry_interval and not anchor.retry_after):
+                    lost.append(region)
+        return matched, lost
+    
+    def relocate(self, screen: np.ndarray, origin: Tuple[int, int],
+                 regions: List[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+        """화면 전체 이미지에서 영역 위치 다시 찾기 ({영역: 새 이동량, 찾지 못하면 None})
+        
+        마지막 템플릿으로 못 찾으면 처음 저장한 템플릿으로도 찾아 본다.
+        찾지 못한 영역은 현재 위치의 화면으로 템플릿을 갱신하고, 이미 찾지 못한
+        상태였던 영역은 갱신한 템플릿이 제자리에서 맞을 것이므로 처음 템플릿으로만 찾는다.
+        """
+        gray = cv2.cvtColor(screen, cv2.COLOR_RGB2GRAY)
+        small = cv2.resize(gray, (gray.shape[1] // self.SCALE, gray.shape[0] // self.SCALE),
+                           interpolation=cv2.INTER_AREA)
+        
+        results = {}
+        with self._lock:
+            for region in regions:
+                anchor = self.anchors.get(region)
+                if anchor is None:
+                    continue
+                anchor.misses = 0
+                height, width = anchor.template.shape
+                
+                position = None
+                if not anchor.retry_interval:
+                    position = self._search(gray, small, anchor, anchor.template)
+                if position is None and anchor.original is not anchor.template:
+                    position = self._search(gray, small, anchor, anchor.original)
+                
+                if position is None:
+                    x1, y1 = anchor.rect()[0] - origin[0], anchor.rect()[1] - origin[1]
+                    if 0 <= x1 <= gray.shape[1] - width and 0 <= y1 <= gray.shape[0] - height:
+                        anchor.template = gray[y1:y1 + height, x1:x1 + width].copy()
+                    anchor.retry_interval = min(max(anchor.retry_interval * 2, self.RETRY_FRAMES), self.MAX_RETRY_FRAMES)
+                    anchor.retry_after = anchor.retry_interval
+                    results[region] = None
+                    continue
+                
+                x1, y1 = position
+                anchor.template = gray[y1:y1 + height, x1:x1 + width].copy()
+                anchor.offset = (origin[0] + x1 + anchor.margin[0] - anchor.area[0],
+                                 origin[1] + y1 + anchor.margin[1] - anchor.area[1])
+                anchor.retry_interval = anchor.retry_after = 0
+                self.window_offset = anchor.offset
+                self.relocations += 1
+                results[region] = anchor.offset
+        return results
+    
+    def _search(self, gray: np.ndarray, small: np.ndarray, anchor: RegionAnchor,
+                template: np.ndarray) -> Optional[Tuple[int, int]]:
+        """템플릿 여백이 가장 잘 맞는 왼쪽 위 위치 (화면 이미지 좌표, 없으면 None)"""
+        height, width = template.shape
+        small_size = (max(width // self.SCALE, 1), max(height // self.SCALE, 1))
+        if small_size[1] > small.shape[0] or small_size[0] > small.shape[1]:
+            return None
+        
+        mask = anchor.band.astype(np.uint8)
+        small_template = cv2.resize(template, small_size, interpolation=cv2.INTER_AREA)
+        small_mask = cv2.resize(mask, small_size, interpolation=cv2.INTER_NEAREST)
+        
+        # 조잡 탐색: 차이가 작은 후보 몇 곳 (이미 고른 후보 주변은 제외)
+        scores = cv2.matchTemplate(small, small_template, cv2.TM_SQDIFF, mask=small_mask)
+        candidates = []
+        for _ in range(min(self.CANDIDATES, scores.size)):
+            _, _, (x, y), _ = cv2.minMaxLoc(scores)
+            candidates.append((x, y))
+            scores[max(y - 2, 0):y + 3, max(x - 2, 0):x + 3] = np.inf
+        
+        # 정밀 탐색: 후보 주변만 원본 해상도에서 비교
+        best_position, best_error = None, np.inf
+        for x, y in candidates:
+            x1 = max(x * self.SCALE - self.SCALE, 0)
+            y1 = max(y * self.SCALE - self.SCALE, 0)
+            window = gray[y1:y * self.SCALE + self.SCALE + height, x1:x * self.SCALE + self.SCALE + width]
+            if window.shape[0] < height or window.shape[1] < width:
+                continue
+            error, _, location, _ = cv2.minMaxLoc(cv2.matchTemplate(window, template, cv2.TM_SQDIFF, mask=mask))
+            if error < best_error:
+                best_position, best_error = (x1 + location[0], y1 + location[1]), error
+        
+        if best_position is None or best_error / anchor.band.sum() > self.RELOCATE_MAX_MSE:
+            return None
+        return best_position
\ No newline at end of file
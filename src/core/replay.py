@@ -0,0 +1,136 @@
+import copy
+import dataclasses
+import time
+import asyncio
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .ocr_engine import OCREngine
+from .monitor_service import MonitorService
+from .recording import ReplayFrameSource
+from .seen_store import SeenStore
+from .watch import Watch
+from ..models.settings import AppSettings
+
+class ReplayScheduler:
+    """기록 재생용 스케줄러 (AdaptiveScheduler와 같은 인터페이스)
+    
+    마감 시각을 기다리지 않고 바로 다음 주기를 시작하므로 CPU가 허락하는
+    만큼 빠르게 재생된다. 기록된 프레임을 다 쓰면 루프를 끝낸다.
+    """
+    
+    def __init__(self, frame_source: ReplayFrameSource):
+        self.frame_source = frame_source
+        self.base_interval = 0.0
+        self.min_interval = 0.0
+        self.max_interval = 0.0
+        self.backoff = 1.0
+        self.adaptive = False
+        self.current_interval = 0.0
+        
+        self.ticks = 0
+        self.changes = 0
+    
+    def start(self):
+        self.ticks = 0
+        self.changes = 0
+    
+    async def wait(self, stop_event: asyncio.Event) -> bool:
+        """다음 주기 시작 (기록이 끝났거나 중지 요청 시 False)"""
+        # 중지 요청과 다른 작업이 끼어들 수 있도록 한 번은 양보
+        await asyncio.sleep(0)
+        if stop_event.is_set() or self.frame_source.finished:
+            return False
+        
+        self.ticks += 1
+        return True
+    
+    def tick_done(self, changed: bool = False):
+        if changed:
+            self.changes += 1
+    
+    def stats(self) -> Dict[str, float]:
+        return {'ticks': self.ticks, 'overruns': 0, 'interval': 0.0}
+
+class ReplayMonitorService(MonitorService):
+    """기록한 프레임을 실제 모니터링과 같은 경로(변화 감지 -> OCR -> 필터 -> 중복 확인)로 재생
+    
+    새로고침은 하지 않고, 단계 파이프라인은 밀린 프레임을 버려 결과가 실행마다
+    달라질 수 있으므로 끈다. 기록에는 감시 영역 주변만 있으므로 창 이동 추적도 끄고,
+    추적을 켜고 기록한 파일의 템플릿/화면 전체 캡처 중 영역을 포함하지 않는 프레임은
+    ReplayFrameSource가 건너뛴다.
+    확인한 메일 기록은 메모리에만 두므로 실제 기록 파일에 영향을 주지 않고,
+    TTL 판단과 필터의 시간 규칙은 기록된 프레임 시각을 따른다.
+    """
+    
+    def __init__(self, settings: AppSettings, ocr_engine: OCREngine):
+        if not isinstance(ocr_engine.frame_source, ReplayFrameSource):
+            raise ValueError("재생에는 기록 파일 프레임 공급원이 필요합니다.")
+        
+        settings = copy.deepcopy(settings)
+        settings.monitor_settings.pipeline_enabled = False
+        settings.monitor_settings.refresh_enabled = False
+        settings.monitor_settings.region_tracking = False
+        
+        self.frame_source: ReplayFrameSource = ocr_engine.frame_source
+        super().__init__(settings, ocr_engine, SeenStore(clock=lambda: self.frame_source.timestamp))
+        
+        # (기록 시각, 제목, 시간, 감시 대상 이름)
+        self.alerts: List[Tuple[float, str, str, str]] = []
+    
+    def _create_scheduler(self) -> ReplayScheduler:
+        return ReplayScheduler(self.frame_source)
+    
+    def _sync_scheduler(self, scheduler: ReplayScheduler):
+        """재생 중에는 간격 설정을 쓰지 않음"""
+    
+    def _rule_time(self) -> datetime:
+        """시간 규칙은 기록된 프레임 시각으로 평가"""
+        return datetime.fromtimestamp(self.frame_source.timestamp)
+    
+    def _notify(self, watch: Watch, title_text: str, time_text: str):
+        self.alerts.append((self.frame_source.timestamp, title_text, time_text, watch.name))
+        super()._notify(watch, title_text, time_text)
+    
+    async def run(self) -> Dict[str, float]:
+        """기록 끝까지 재생하고 요약 반환"""
+        started = time.perf_counter()
+        await self.start()
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            await self.stop()
+        elapsed = time.perf_counter() - started
+        
+        recorded = self.frame_source.recording.duration
+        return {
+            'frames': len(self.frame_source.recording),
+            'ticks': self.scheduler.ticks,
+            'changes': self.scheduler.changes,
+            'alerts': len(self.alerts),
+            'skipped': self.frame_source.skipped,
+            'elapsed': elapsed,
+            'recorded': recorded,
+            'speedup': recorded / elapsed if elapsed > 0 else 0.0
+        }
+
+def replay_recording(settings: AppSettings, file_path: Path) -> Tuple[Dict[str, float], List[Tuple[float, str, str, str]]]:
+    """기록 파일을 끝까지 재생하고 (요약, 알림 목록) 반환"""
+    # 재생한 프레임을 다시 기록하거나 링 버퍼를 덮어쓰지 않고, 디스크에 남은 학습 순서에
+    # 결과가 좌우되거나 재생 결과로 실제 학습 순서를 덮어쓰지 않도록 학습 순서도 끔
+    ocr_settings = dataclasses.replace(settings.ocr_settings, capture_record="", capture_ring_mb=0,
+                                       adaptive_order=False)
+    ocr_engine = OCREngine(ocr_settings, ReplayFrameSource(file_path))
+    service = ReplayMonitorService(settings, ocr_engine)
+    try:
+        summary = asyncio.run(service.run())
+    finally:
+        ocr_engine.shutdown()
+    
+    logging.getLogger(__name__).info(
+        f"재생 완료: 프레임 {summary['frames']}장(건너뜀 {summary['skipped']}장) / 주기 {summary['ticks']}회 / 알림 {summary['alerts']}건, "
+        f"{summary['elapsed']:.2f}초 (기록 {summary['recorded']:.1f}초, {summary['speedup']:.1f}배속)"
+    )
+    return summary, service.alerts
\ No newline at end of file
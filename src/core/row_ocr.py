@@ -0,0 +1,73 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .change_detector import mask_to_bands, to_gray
+
+def split_rows(image: np.ndarray, ink_threshold: int = 40, min_gap: int = 3,
+               padding: int = 3) -> List[Tuple[int, int]]:
+    """가로 투영으로 글자 줄 범위 분리
+    
+    배경(중앙값)과 ink_threshold 이상 차이 나는 픽셀이 있는 행을 글자 행으로 보고,
+    min_gap보다 짧은 빈 행으로 떨어진 글자 행들은 한 줄로 합친다.
+    """
+    gray = to_gray(image)
+    if gray.size == 0:
+        return []
+    
+    background = int(np.median(gray))
+    ink = np.abs(gray.astype(np.int16) - background) > ink_threshold
+    bands = mask_to_bands(ink.any(axis=1))
+    
+    # 가까운 줄 병합 (한글 받침, 밑줄 등으로 끊긴 줄)
+    merged: List[Tuple[int, int]] = []
+    for y0, y1 in bands:
+        if merged and y0 - merged[-1][1] < min_gap:
+            merged[-1] = (merged[-1][0], y1)
+        else:
+            merged.append((y0, y1))
+    
+    height = gray.shape[0]
+    return [(max(y0 - padding, 0), min(y1 + padding, height)) for y0, y1 in merged]
+
+def overlaps(row: Tuple[int, int], bands: List[Tuple[int, int]]) -> bool:
+    """행 범위가 띠 목록 중 하나와 겹치는지 확인"""
+    return any(row[0] < band[1] and band[0] < row[1] for band in bands)
+
+class DirtyRowOCR:
+    """여러 줄 영역의 바뀐 줄만 OCR
+    
+    영역을 글자 줄 단위로 나누고, 변화 감지기가 보고한 띠와 겹치는 줄만
+    OCR한다. 나머지 줄은 직전 결과를 재사용하므로 OCR 비용이 영역 높이가
+    아니라 새로 바뀐 줄 수에 비례한다.
+    """
+    
+    def __init__(self, ocr_engine, region: str):
+        self.ocr_engine = ocr_engine
+        self.region = region
+        self.logger = logging.getLogger(__name__)
+        self._row_texts: Dict[Tuple[int, int], str] = {}
+    
+    def extract(self, image: np.ndarray, dirty_bands: Optional[List[Tuple[int, int]]] = None) -> str:
+        """줄별 OCR 결과를 합친 텍스트 (dirty_bands가 None이면 전체 OCR)"""
+        rows = split_rows(image)
+        if not rows:
+            self._row_texts = {}
+            return ""
+        
+        row_texts = {}
+        ocr_count = 0
+        for row in rows:
+            previous_text = self._row_texts.get(row)
+            if dirty_bands is None or previous_text is None or overlaps(row, dirty_bands):
+                row_texts[row] = self.ocr_engine.extract_text(image[row[0]:row[1]], region=self.region)
+                ocr_count += 1
+            else:
+                row_texts[row] = previous_text
+        
+        self.logger.debug(f"[{self.region}] 줄 OCR: {ocr_count}/{len(rows)}줄")
+        self._row_texts = row_texts
+        return " ".join(text for text in row_texts.values() if text)
+    
+    def reset(self):
+        """이전 줄 결과 초기화"""
+        self._row_texts = {}
\ No newline at end of file
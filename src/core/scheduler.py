@@ -0,0 +1,94 @@
+import time
+import asyncio
+import statistics
+from collections import deque
+from typing import Callable, Dict, Optional
+
+class AdaptiveScheduler:
+    """고정 마감 시각 기반 적응형 폴링 스케줄러
+    
+    매 주기는 이전 마감 시각에 간격을 더한 시각에 시작하므로 작업 시간만큼
+    대기 시간이 줄어든다. adaptive가 켜져 있으면 변화 감지 직후에는 최소
+    간격으로 당기고, 화면이 조용하면 backoff 배율로 최대 간격까지 늘린다.
+    깨어난 시각이 마감보다 늦은 정도(지각)를 기록한다.
+    """
+    
+    def __init__(self, interval: float, min_interval: float = 1.0, max_interval: float = 30.0,
+                 backoff: float = 1.5, adaptive: bool = False,
+                 clock: Callable[[], float] = time.monotonic, history: int = 1000):
+        self.base_interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.adaptive = adaptive
+        self.clock = clock
+        
+        self.current_interval = interval
+        self.next_deadline: Optional[float] = None
+        
+        self.ticks = 0
+        self.overruns = 0
+        self._lateness = deque(maxlen=history)
+        self._max_lateness = 0.0
+    
+    def start(self):
+        """첫 주기를 즉시 시작하도록 초기화"""
+        self.current_interval = self._clamp(self.base_interval)
+        self.next_deadline = self.clock()
+    
+    def _clamp(self, interval: float) -> float:
+        """최소/최대 간격 범위로 제한"""
+        return min(max(interval, self.min_interval), self.max_interval)
+    
+    async def wait(self, stop_event: asyncio.Event) -> bool:
+        """다음 마감 시각까지 대기 (중지 요청 시 False)"""
+        if self.next_deadline is None:
+            self.start()
+        
+        remaining = self.next_deadline - self.clock()
+        if remaining > 0:
+            try:
+                await asyncio.wait_for(stop_event.wait(), remaining)
+                return False
+            except asyncio.TimeoutError:
+                pass
+        if stop_event.is_set():
+            return False
+        
+        lateness = max(self.clock() - self.next_deadline, 0.0)
+        self._lateness.append(lateness)
+        self._max_lateness = max(self._max_lateness, lateness)
+        self.ticks += 1
+        return True
+    
+    def tick_done(self, changed: bool = False):
+        """주기 작업 완료 후 다음 마감 시각 계산"""
+        if not self.adaptive:
+            self.current_interval = self.base_interval
+        elif changed:
+            self.current_interval = self._clamp(self.min_interval)
+        else:
+            self.current_interval = self._clamp(self.current_interval * self.backoff)
+        
+        self.next_deadline += self.current_interval
+        
+        # 작업이 간격보다 오래 걸렸으면 밀린 주기는 건너뜀
+        now = self.clock()
+        if self.next_deadline < now:
+            self.overruns += 1
+            self.next_deadline = now
+    
+    def stats(self) -> Dict[str, float]:
+        """지각 통계 (밀리초)"""
+        samples = sorted(self._lateness)
+        if not samples:
+            return {'ticks': self.ticks, 'overruns': self.overruns, 'interval': self.current_interval}
+        
+        return {
+            'ticks': self.ticks,
+            'overruns': self.overruns,
+            'interval': self.current_interval,
+            'mean_lateness_ms': statistics.mean(samples) * 1000,
+            'p95_lateness_ms': samples[max(int(len(samples) * 0.95) - 1, 0)] * 1000,
+            'max_lateness_ms': self._max_lateness * 1000
+        }
\ No newline at end of file
@@ -0,0 +1,183 @@
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+class SeenStore:
+    """확인한 메일 (제목, 시간) 지문 저장소
+    
+    감시 대상별로 정규화한 (제목, 시간)의 해시를 메모리 사전에 보관해 O(1)로
+    조회하고, 처음 보거나 만료된 항목을 추가할 때만 파일 끝에 한 줄씩 기록한다.
+    이미 있는 항목은 기록 시각이 ttl의 절반을 넘겼을 때만 다시 기록한다.
+    시작할 때 파일을 다시 읽어 재시작 후에도 이미 알린 메일을 다시 알리지 않는다.
+    
+    사전은 마지막으로 본 순서를 유지하므로 오래된 항목부터 시간(ttl) 기준과
+    개수(max_entries) 기준으로 제거한다. 제거되거나 갱신된 줄이 쌓여 파일이
+    살아 있는 항목의 COMPACT_RATIO배를 넘으면 살아 있는 항목만 새 파일에 쓰고
+    교체한다.
+    """
+    
+    COMPACT_RATIO = 2
+    COMPACT_MIN_LINES = 1000
+    
+    def __init__(self, file_path: Optional[Path] = None, max_entries: int = 5000,
+                 ttl: float = 7 * 24 * 3600, clock: Callable[[], float] = time.time):
+        self.file_path = Path(file_path) if file_path else None
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        
+        # (감시 대상, 지문) -> 마지막으로 본 시각
+        self._entries: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._log_lines = 0
+        self._file = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def fingerprint(title: str, time_text: str) -> str:
+        """OCR 공백/대소문자 차이를 무시한 (제목, 시간) 지문"""
+        normalized = re.sub(r'\s+', '', title.lower()) + '\0' + re.sub(r'\s+', '', time_text)
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=12).hexdigest()
+    
+    def configure(self, max_entries: int, ttl: float):
+        """보관 한도 변경 (줄어들면 바로 제거)"""
+        with self._lock:
+            self.max_entries = max_entries
+            self.ttl = ttl
+            self._evict()
+    
+    def load(self):
+        """파일에서 항목 복원 (깨진 줄은 건너뜀)"""
+        if self.file_path is None or not self.file_path.exists():
+            return
+        
+        with self._lock:
+            self._entries.clear()
+            self._log_lines = 0
+            try:
+                with open(self.file_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        self._log_lines += 1
+                        try:
+                            record = json.loads(line)
+                            key = (record['watch'], record['key'])
+                            seen_at = float(record['seen_at'])
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                        self._entries.pop(key, None)
+                        self._entries[key] = seen_at
+            except OSError as e:
+                self.logger.warning(f"확인한 메일 기록 로드 실패: {e}")
+                return
+            
+            self._evict()
+            if self._needs_compaction():
+                self._compact()
+    
+    def contains(self, watch: str, title: str, time_text: str) -> bool:
+        """이미 확인한 메일인지 확인"""
+        key = (watch, self.fingerprint(title, time_text))
+        with self._lock:
+            seen_at = self._entries.get(key)
+            if seen_at is None:
+                return False
+            if self.ttl and self.clock() - seen_at > self.ttl:
+                del self._entries[key]
+                return False
+            return True
+    
+    def add(self, watch: str, title: str, time_text: str) -> bool:
+        """확인한 메일 기록 (처음 본 메일이면 True, 제목이나 시간이 비어 있으면 기록하지 않고 False)"""
+        if not title.strip() or not time_text.strip():
+            return False
+        
+        key = (watch, self.fingerprint(title, time_text))
+        now = self.clock()
+        with self._lock:
+            seen_at = self._entries.get(key)
+            is_new = seen_at is None or bool(self.ttl and now - seen_at > self.ttl)
+            if not is_new and not (self.ttl and now - seen_at > self.ttl / 2):
+                # 매 주기 같은 메일이 보이므로 순서만 갱신하고 파일에는 쓰지 않음
+                self._entries.move_to_end(key)
+                return False
+            
+            self._entries.pop(key, None)
+            self._entries[key] = now
+            self._append(key, now)
+            self._evict()
+            if self._needs_compaction():
+                self._compact()
+        return is_new
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def compact(self):
+        """살아 있는 항목만 남기도록 파일 다시 쓰기"""
+        with self._lock:
+            self._evict()
+            self._compact()
+    
+    def close(self):
+        """기록 파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+    
+    def _evict(self):
+        """오래된 항목부터 시간/개수 한도를 넘는 항목 제거"""
+        if self.ttl:
+            expire_before = self.clock() - self.ttl
+            while self._entries:
+                key, seen_at = next(iter(self._entries.items()))
+                if seen_at >= expire_before:
+                    break
+                del self._entries[key]
+        
+        while len(self._entries) > max(self.max_entries, 0):
+            self._entries.popitem(last=False)
+    
+    def _append(self, key: Tuple[str, str], seen_at: float):
+        if self.file_path is None:
+            return
+        try:
+            if self._file is None:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.file_path, 'a', encoding='utf-8')
+            self._file.write(self._record(key, seen_at))
+            self._file.flush()
+            self._log_lines += 1
+        except OSError as e:
+            self.logger.warning(f"확인한 메일 기록 실패: {e}")
+    
+    def _record(self, key: Tuple[str, str], seen_at: float) -> str:
+        return json.dumps({'watch': key[0], 'key': key[1], 'seen_at': round(seen_at, 3)},
+                          ensure_ascii=False) + '\n'
+    
+    def _needs_compaction(self) -> bool:
+        return self._log_lines > max(self.COMPACT_MIN_LINES, len(self._entries) * self.COMPACT_RATIO)
+    
+    def _compact(self):
+        if self.file_path is None:
+            return
+        
+        temp_path = self.file_path.with_name(self.file_path.name + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for key, seen_at in self._entries.items():
+                    f.write(self._record(key, seen_at))
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            os.replace(temp_path, self.file_path)
+            self._log_lines = len(self._entries)
+        except OSError as e:
+            self.logger.warning(f"확인한 메일 기록 정리 실패: {e}")
\ No newline at end of file
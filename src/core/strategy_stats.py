@@ -0,0 +1,57 @@
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+class StrategyStats:
+    """영역별 OCR 방식 승리 통계
+    
+    최근 결과에 더 큰 비중을 두도록 기록할 때마다 기존 점수를 감쇠시키고,
+    점수가 높은 방식부터 시도하도록 순서를 제공한다.
+    """
+    
+    def __init__(self, decay: float = 0.95):
+        self.decay = decay
+        self.logger = logging.getLogger(__name__)
+        self._scores: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+    
+    def record_win(self, region: str, method_name: str):
+        """승리한 방식 기록"""
+        with self._lock:
+            scores = self._scores.setdefault(region, {})
+            for name in scores:
+                scores[name] *= self.decay
+            scores[method_name] = scores.get(method_name, 0.0) + 1.0
+    
+    def order(self, region: str, method_names: List[str]) -> List[str]:
+        """점수 높은 순서의 방식 목록 (동점은 기본 순서 유지)"""
+        with self._lock:
+            scores = dict(self._scores.get(region, {}))
+        return sorted(method_names, key=lambda name: -scores.get(name, 0.0))
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """영역별 점수 사본"""
+        with self._lock:
+            return {region: dict(scores) for region, scores in self._scores.items()}
+    
+    def save(self, file_path: Path):
+        """통계 저장"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+    
+    def load(self, file_path: Path):
+        """통계 로드"""
+        if not file_path.exists():
+            return
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self._scores = {
+                    region: {name: float(score) for name, score in scores.items()}
+                    for region, scores in data.items()
+                }
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"OCR 방식 통계 로드 실패: {e}")
\ No newline at end of file
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from .change_detector import ChangeDetector, create_change_detector
+from .filter_rules import FilterRules, compile_filter
+from .region_tracker import RegionTracker
+from .row_ocr import DirtyRowOCR
+from .seen_store import SeenStore
+from ..models.settings import WatchSettings
+
+class Watch:
+    """감시 대상 하나의 실행 상태
+    
+    변화 감지기, 직전 이미지, 기준점 시간을 감시 대상마다 따로 보관한다.
+    확인한 메일은 공용 SeenStore에 감시 대상 이름으로 구분해 기록한다.
+    스레드나 OCR 엔진은 갖지 않으며 MonitorService의 공용 스케줄러와
+    OCR 워커 풀이 모든 감시 대상을 처리한다.
+    """
+    
+    def __init__(self, name: str, settings: WatchSettings, ocr_engine, seen_store: SeenStore):
+        self.name = name
+        self.settings = settings
+        self.change_detector: ChangeDetector = self.create_change_detector()
+        self.title_row_ocr = DirtyRowOCR(ocr_engine, 'title')
+        
+        self.previous_title_image = None
+        self.previous_time_image = None
+        self.previous_list_image = None
+        # 화면 표시용 마지막 기준점 시간 (중복 판별은 seen_store가 담당)
+        self.baseline_time = None
+        self.seen_store = seen_store
+        
+        self._matcher: Optional[FilterRules] = None
+        self._matcher_signature: Optional[Tuple] = None
+        # 창 이동 추적기 (region_tracking 설정이 켜져 있을 때만 MonitorService가 설정)
+        self.tracker: Optional[RegionTracker] = None
+    
+    def create_change_detector(self) -> ChangeDetector:
+        """설정에 맞는 변화 감지기 생성"""
+        return create_change_detector(self.settings.change_detector, self.change_threshold())
+    
+    def change_threshold(self) -> Optional[float]:
+        """변화 감지 임계값 (None이면 감지기 기본값)"""
+        if self.settings.change_detector == 'template':
+            return self.settings.similarity_threshold
+        return self.settings.change_threshold or None
+    
+    def update(self, settings: WatchSettings):
+        """모니터링 중 바뀐 설정 반영 (감지기 종류가 바뀌면 새로 생성)"""
+        self.settings = settings
+        if self.change_detector.name != settings.change_detector:
+            self.change_detector = self.create_change_detector()
+            return
+        
+        # 0으로 되돌리면 감지기 기본값으로 복원
+        threshold = self.change_threshold()
+        self.change_detector.threshold = self.change_detector.default_threshold if threshold is None else threshold
+    
+    def keyword_matcher(self) -> FilterRules:
+        """필터 키워드/규칙 매처 (키워드나 규칙, 옵션이 바뀌었을 때만 다시 컴파일)"""
+        signature = FilterRules.signature(self.settings.filter_settings)
+        if signature != self._matcher_signature:
+            self._matcher = compile_filter(self.settings.filter_settings)
+            self._matcher_signature = signature
+        return self._matcher
+    
+    def match_keywords(self, text: str, now: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """본문에서 일치한 키워드/규칙과 편집 거리 목록 (오타 허용이 꺼져 있으면 거리 0)
+        
+        now는 시간 규칙을 평가할 시각이다 (None이면 현재 시각).
+        """
+        return self.keyword_matcher().find_with_scores(text, now)
+    
+    def selected_areas(self) -> Dict[str, Tuple[int, int, int, int]]:
+        """설정에서 선택한 영역 (목록 모드면 'list', 아니면 'title'/'time')"""
+        if self.settings.list_mode:
+            return {'list': self.settings.list_area.to_tuple()}
+        return {
+            'title': self.settings.title_area.to_tuple(),
+            'time': self.settings.time_area.to_tuple()
+        }
+    
+    def areas(self) -> Dict[str, Tuple[int, int, int, int]]:
+        """캡처할 영역 (창 이동 추적 중이면 찾은 위치로 옮긴 좌표)"""
+        areas = self.selected_areas()
+        return self.tracker.shift(areas) if self.tracker is not None else areas
+    
+    def anchor_areas(self) -> Dict[str, Tuple[int, int, int, int]]:
+        """영역과 함께 캡처할 창 이동 추적용 템플릿 범위"""
+        return self.tracker.anchor_areas() if self.tracker is not None else {}
+    
+    def is_seen(self, title: str, time_text: str) -> bool:
+        """이미 확인한 메일인지 확인"""
+        return self.seen_store.contains(self.name, title, time_text)
+    
+    def remember(self, title: str, time_text: str) -> bool:
+        """확인한 메일 기록 (처음 본 메일이면 True)"""
+        return self.seen_store.add(self.name, title, time_text)
+    
+    def is_new_row(self, row) -> bool:
+        """아직 확인하지 않은 목록 줄인지 확인"""
+        return not self.is_seen(row.title, row.time)
+    
+    def remember_row(self, row):
+        """확인한 목록 줄 기록"""
+        self.remember(row.title, row.time)
\ No newline at end of file
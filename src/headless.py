@@ -0,0 +1,102 @@
+import asyncio
+import signal
+import logging
+from pathlib import Path
+from typing import Optional
+
+from .config import Config
+from .models.settings import AppSettings
+from .core.frame_source import FrameSource
+from .core.ocr_engine import OCREngine
+from .core.monitor_service import MonitorService
+from .services.notification_service import NotificationService
+
+class HeadlessApp:
+    """화면 없이 모니터링만 실행하는 백그라운드 서비스
+    
+    EmailMonitorApp과 같은 설정 파일과 서비스를 쓰지만 tkinter를 전혀 불러오지
+    않는다. 로그는 logging으로만 남기고, SIGINT/SIGTERM을 받으면 모니터링을
+    멈추고 종료한다.
+    """
+    
+    def __init__(self, settings_file: Path = Config.SETTINGS_FILE, frame_source: Optional[FrameSource] = None,
+                 record_file: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        
+        # 설정 로드 (헤드리스는 설정을 저장하지 않으므로 기록 경로는 이번 실행에만 적용)
+        self.settings = AppSettings.load(Path(settings_file))
+        if record_file:
+            self.settings.ocr_settings.capture_record = record_file
+        
+        # 핵심 서비스 초기화
+        self.ocr_engine = OCREngine(self.settings.ocr_settings, frame_source)
+        self.monitor_service = MonitorService(self.settings, self.ocr_engine)
+        self.notification_service = NotificationService(self.settings.slack_settings)
+        
+        # MonitorService가 로그를 직접 남기므로 로그 콜백은 두지 않음
+        self.monitor_service.set_callbacks(on_detection=self.on_detection, on_log=None)
+        
+        self.total_detections = 0
+        self._stop_event: Optional[asyncio.Event] = None
+    
+    def on_detection(self, title_text: str, time_text: str, watch_name: str = ""):
+        """감지 콜백"""
+        self.total_detections += 1
+        self.notification_service.send_slack_notification(title_text, time_text, watch_name)
+    
+    def validate(self) -> bool:
+        """모니터링을 시작할 수 있는 설정인지 확인"""
+        watches = self.settings.active_watches()
+        if not watches:
+            if self.settings.monitor_settings.list_mode:
+                self.logger.error("목록 전체 모드에서는 목록 영역을 설정해주세요.")
+            else:
+                self.logger.error("제목 영역과 시간 영역을 모두 설정해주세요.")
+            return False
+        
+        if not any(watch.filter_settings.keywords or watch.filter_settings.rules for watch in watches):
+            self.logger.error("최소 하나의 키워드나 규칙을 입력해주세요.")
+            return False
+        return True
+    
+    def request_stop(self):
+        """종료 요청 (시그널 처리기나 다른 스레드에서 호출 가능)"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    async def run(self, duration: Optional[float] = None):
+        """모니터링 실행 (종료 요청이 오거나 duration초가 지나면 중지)"""
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._install_signal_handlers(loop)
+        
+        await self.monitor_service.start()
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await self.monitor_service.stop()
+            self.monitor_service.seen_store.close()
+            self.ocr_engine.shutdown()
+            self.logger.info(f"헤드리스 모니터링 종료 (알림 {self.total_detections}건)")
+    
+    def request_frame_dump(self):
+        """최근 화면 저장 요청 (SIGUSR1)"""
+        loop = asyncio.get_running_loop()
+        loop.run_in_executor(None, self.monitor_service.dump_recent_frames)
+    
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop):
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows 이벤트 루프는 add_signal_handler를 지원하지 않음
+                signal.signal(sig, lambda *_: loop.call_soon_threadsafe(self.request_stop))
+        
+        # 최근 화면 저장 (kill -USR1 <pid>, Windows에는 없음)
+        if hasattr(signal, 'SIGUSR1'):
+            try:
+                loop.add_signal_handler(signal.SIGUSR1, self.request_frame_dump)
+            except (NotImplementedError, RuntimeError):
+                pass
\ No newline at end of file
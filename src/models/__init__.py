@@ -1,13 +1,15 @@
-"""
-데이터 모델 패키지
-"""
-
-from .settings import AppSettings, AreaSettings, FilterSettings, SlackSettings, MonitorSettings
-
-__all__ = [
-'AppSettings',
-'AreaSettings',
-'FilterSettings',
-'SlackSettings',
-'MonitorSettings'
+"""
+데이터 모델 패키지
+"""
+
+from .settings import AppSettings, AreaSettings, FilterSettings, SlackSettings, MonitorSettings, OCRSettings, WatchSettings
+
+__all__ = [
+'AppSettings',
+'AreaSettings',
+'FilterSettings',
+'SlackSettings',
+'MonitorSettings',
+'OCRSettings',
+'WatchSettings'
 ]
\ No newline at end of file
@@ -1,108 +1,325 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
-import json
-from pathlib import Path
-
-@dataclass
-class AreaSettings:
-    """영역 설정"""
-    x1: int = 0
-    y1: int = 0
-    x2: int = 0
-    y2: int = 0
-    
-    def to_tuple(self) -> Tuple[int, int, int, int]:
-        return (self.x1, self.y1, self.x2, self.y2)
-    
-    @classmethod
-    def from_tuple(cls, coords: Tuple[int, int, int, int]) -> 'AreaSettings':
-        return cls(*coords)
-
-@dataclass
-class FilterSettings:
-    """필터링 설정"""
-    keywords: List[str] = field(default_factory=list)
-    exact_match: bool = False
-    case_sensitive: bool = False
-
-@dataclass
-class SlackSettings:
-    """슬랙 설정"""
-    webhook_url: str = ""
-    channel: str = ""
-
-@dataclass
-class MonitorSettings:
-    """모니터링 설정"""
-    interval: int = 5
-    similarity_threshold: float = 0.95
-    refresh_enabled: bool = False
-    refresh_interval: int = 5
-
-@dataclass
-class AppSettings:
-    """전체 애플리케이션 설정"""
-    title_area: Optional[AreaSettings] = None
-    time_area: Optional[AreaSettings] = None
-    filter_settings: FilterSettings = field(default_factory=FilterSettings)
-    slack_settings: SlackSettings = field(default_factory=SlackSettings)
-    monitor_settings: MonitorSettings = field(default_factory=MonitorSettings)
-    area_visualization: bool = False
-    
-    def save(self, file_path: Path):
-        """설정 저장"""
-        data = {
-            'title_area': self.title_area.to_tuple() if self.title_area else None,
-            'time_area': self.time_area.to_tuple() if self.time_area else None,
-            'keywords': self.filter_settings.keywords,
-            'exact_match': self.filter_settings.exact_match,
-            'case_sensitive': self.filter_settings.case_sensitive,
-            'webhook_url': self.slack_settings.webhook_url,
-            'channel': self.slack_settings.channel,
-            'monitor_interval': self.monitor_settings.interval,
-            'similarity_threshold': self.monitor_settings.similarity_threshold,
-            'refresh_enabled': self.monitor_settings.refresh_enabled,
-            'refresh_interval': self.monitor_settings.refresh_interval,
-            'area_visualization': self.area_visualization
-        }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    @classmethod
-    def load(cls, file_path: Path) -> 'AppSettings':
-        """설정 로드"""
-        if not file_path.exists():
-            return cls()
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        settings = cls()
-        
-        if data.get('title_area'):
-            settings.title_area = AreaSettings.from_tuple(data['title_area'])
-        if data.get('time_area'):
-            settings.time_area = AreaSettings.from_tuple(data['time_area'])
-        
-        settings.filter_settings = FilterSettings(
-            keywords=data.get('keywords', []),
-            exact_match=data.get('exact_match', False),
-            case_sensitive=data.get('case_sensitive', False)
-        )
-        
-        settings.slack_settings = SlackSettings(
-            webhook_url=data.get('webhook_url', ''),
-            channel=data.get('channel', '')
-        )
-        
-        settings.monitor_settings = MonitorSettings(
-            interval=data.get('monitor_interval', 5),
-            similarity_threshold=data.get('similarity_threshold', 0.95),
-            refresh_enabled=data.get('refresh_enabled', False),
-            refresh_interval=data.get('refresh_interval', 5)
-        )
-        
-        settings.area_visualization = data.get('area_visualization', False)
-        
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import json
+from pathlib import Path
+
+@dataclass
+class AreaSettings:
+    """영역 설정"""
+    x1: int = 0
+    y1: int = 0
+    x2: int = 0
+    y2: int = 0
+    
+    def to_tuple(self) -> Tuple[int, int, int, int]:
+        return (self.x1, self.y1, self.x2, self.y2)
+    
+    @classmethod
+    def from_tuple(cls, coords: Tuple[int, int, int, int]) -> 'AreaSettings':
+        return cls(*coords)
+
+@dataclass
+class FilterSettings:
+    """필터링 설정"""
+    keywords: List[str] = field(default_factory=list)
+    exact_match: bool = False
+    case_sensitive: bool = False
+    fuzzy_match: bool = False
+    fuzzy_max_distance: int = 1
+    # 불리언 필터 규칙 (예: "(긴급 OR urgent) AND NOT 광고")
+    rules: List[str] = field(default_factory=list)
+
+@dataclass
+class SlackSettings:
+    """슬랙 설정"""
+    webhook_url: str = ""
+    channel: str = ""
+
+@dataclass
+class MonitorSettings:
+    """모니터링 설정"""
+    interval: int = 5
+    similarity_threshold: float = 0.95
+    refresh_enabled: bool = False
+    refresh_interval: int = 5
+    change_detector: str = "template"  # template, mad, rows, dhash
+    change_threshold: float = 0.0  # 0이면 감지기 기본값 (template은 similarity_threshold 사용)
+    dirty_row_ocr: bool = False  # 제목 영역이 여러 줄일 때 바뀐 줄만 OCR
+    list_mode: bool = False  # 목록 영역 전체를 한 번에 OCR해 새 줄마다 알림
+    adaptive_polling: bool = False  # 변화 직후엔 빠르게, 조용하면 점점 느리게 확인
+    min_interval: float = 1.0  # 적응형 폴링 최소 간격(초)
+    max_interval: float = 30.0  # 적응형 폴링 최대 간격(초)
+    backoff_factor: float = 1.5  # 변화가 없을 때 간격을 늘리는 배율
+    pipeline_enabled: bool = False  # 캡처/감지/OCR/알림을 단계별 워커로 분리
+    pipeline_queue_size: int = 2  # 단계 사이 프레임 큐 크기 (넘치면 오래된 프레임 버림)
+    seen_max_entries: int = 5000  # 중복 알림 방지용으로 기억할 최대 메일 수
+    seen_ttl_hours: float = 168.0  # 확인한 메일을 기억할 시간 (0이면 시간 제한 없음)
+    ring_dump_on_alert: bool = True  # 알림을 보내면 링 버퍼의 앞뒤 화면을 파일로 저장
+    ring_dump_before: float = 60.0  # 저장할 감지 전 시간(초)
+    ring_dump_after: float = 10.0  # 저장할 감지 후 시간(초)
+    region_tracking: bool = False  # 메일 창이 움직이면 감시 영역 위치를 다시 찾아 따라감
+
+@dataclass
+class WatchSettings:
+    """감시 대상 설정 (메일함/폴더/모니터 하나)
+    
+    영역, 필터, 변화 감지 설정을 감시 대상마다 따로 둔다. 기존 단일 영역
+    설정은 AppSettings.default_watch()로 '기본' 감시 대상이 된다.
+    """
+    name: str = ""
+    title_area: Optional[AreaSettings] = None
+    time_area: Optional[AreaSettings] = None
+    list_area: Optional[AreaSettings] = None
+    filter_settings: FilterSettings = field(default_factory=FilterSettings)
+    list_mode: bool = False
+    change_detector: str = "template"
+    similarity_threshold: float = 0.95
+    change_threshold: float = 0.0
+    dirty_row_ocr: bool = False
+    enabled: bool = True
+    
+    def is_configured(self) -> bool:
+        """감시에 필요한 영역이 모두 지정됐는지 확인"""
+        if self.list_mode:
+            return self.list_area is not None
+        return self.title_area is not None and self.time_area is not None
+    
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'title_area': self.title_area.to_tuple() if self.title_area else None,
+            'time_area': self.time_area.to_tuple() if self.time_area else None,
+            'list_area': self.list_area.to_tuple() if self.list_area else None,
+            'keywords': self.filter_settings.keywords,
+            'exact_match': self.filter_settings.exact_match,
+            'case_sensitive': self.filter_settings.case_sensitive,
+            'fuzzy_match': self.filter_settings.fuzzy_match,
+            'fuzzy_max_distance': self.filter_settings.fuzzy_max_distance,
+            'filter_rules': self.filter_settings.rules,
+            'list_mode': self.list_mode,
+            'change_detector': self.change_detector,
+            'similarity_threshold': self.similarity_threshold,
+            'change_threshold': self.change_threshold,
+            'dirty_row_ocr': self.dirty_row_ocr,
+            'enabled': self.enabled
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'WatchSettings':
+        return cls(
+            name=data.get('name', ''),
+            title_area=AreaSettings.from_tuple(data['title_area']) if data.get('title_area') else None,
+            time_area=AreaSettings.from_tuple(data['time_area']) if data.get('time_area') else None,
+            list_area=AreaSettings.from_tuple(data['list_area']) if data.get('list_area') else None,
+            filter_settings=FilterSettings(
+                keywords=data.get('keywords', []),
+                exact_match=data.get('exact_match', False),
+                case_sensitive=data.get('case_sensitive', False),
+                fuzzy_match=data.get('fuzzy_match', False),
+                fuzzy_max_distance=data.get('fuzzy_max_distance', 1),
+                rules=data.get('filter_rules', [])
+            ),
+            list_mode=data.get('list_mode', False),
+            change_detector=data.get('change_detector', 'template'),
+            similarity_threshold=data.get('similarity_threshold', 0.95),
+            change_threshold=data.get('change_threshold', 0.0),
+            dirty_row_ocr=data.get('dirty_row_ocr', False),
+            enabled=data.get('enabled', True)
+        )
+
+@dataclass
+class OCRSettings:
+    """OCR 엔진 설정"""
+    parallel: bool = True
+    max_workers: int = 0  # 0이면 CPU 코어 수
+    timeout: float = 10.0  # 호출당 마감 시간(초)
+    backend: str = "auto"  # auto, tesserocr, pytesseract
+    cache_size: int = 256  # 0이면 캐시 사용 안 함
+    cache_mode: str = "exact"  # exact, perceptual
+    cache_max_distance: int = 0  # perceptual 모드의 허용 해밍 거리
+    confidence_threshold: float = 80.0  # 이 신뢰도 이상이면 나머지 방식 생략 (0이면 항상 전체 실행)
+    adaptive_order: bool = True  # 영역별로 자주 이긴 방식부터 시도
+    preprocess_profiles: Dict[str, dict] = field(default_factory=dict)  # 영역별 전처리 설정 (title, time, default)
+    time_glyph_match: bool = True  # 시간 영역을 학습한 글자 모양으로 먼저 읽기 (확신이 없으면 tesseract)
+    time_glyph_min_reads: int = 3  # 글자 모양 인식을 시작하기 전 tesseract로 학습할 횟수
+    capture_backend: str = "imagegrab"  # auto, imagegrab, mss, x11shm, file, video, recording
+    capture_source: str = ""  # file/video/recording 백엔드의 이미지/폴더/동영상/기록 파일 경로
+    capture_loop: bool = False  # file/video/recording 백엔드의 반복 재생
+    capture_record: str = ""  # 캡처한 프레임을 기록할 파일 경로 (비어 있으면 기록 안 함)
+    capture_ring_mb: int = 0  # 최근 캡처 프레임을 보관할 링 버퍼 크기(MB), 0이면 사용 안 함
+
+@dataclass
+class AppSettings:
+    """전체 애플리케이션 설정"""
+    title_area: Optional[AreaSettings] = None
+    time_area: Optional[AreaSettings] = None
+    list_area: Optional[AreaSettings] = None
+    filter_settings: FilterSettings = field(default_factory=FilterSettings)
+    slack_settings: SlackSettings = field(default_factory=SlackSettings)
+    monitor_settings: MonitorSettings = field(default_factory=MonitorSettings)
+    ocr_settings: OCRSettings = field(default_factory=OCRSettings)
+    watches: List[WatchSettings] = field(default_factory=list)
+    area_visualization: bool = False
+    
+    # 기존 단일 영역 설정을 감시 대상으로 볼 때의 이름
+    DEFAULT_WATCH_NAME = "기본"
+    
+    def default_watch(self) -> WatchSettings:
+        """기존 단일 영역 설정을 감시 대상으로 변환 (필터는 같은 객체를 공유)"""
+        monitor_settings = self.monitor_settings
+        return WatchSettings(
+            name=self.DEFAULT_WATCH_NAME,
+            title_area=self.title_area,
+            time_area=self.time_area,
+            list_area=self.list_area,
+            filter_settings=self.filter_settings,
+            list_mode=monitor_settings.list_mode,
+            change_detector=monitor_settings.change_detector,
+            similarity_threshold=monitor_settings.similarity_threshold,
+            change_threshold=monitor_settings.change_threshold,
+            dirty_row_ocr=monitor_settings.dirty_row_ocr
+        )
+    
+    def active_watches(self) -> List[WatchSettings]:
+        """영역이 지정된 활성 감시 대상 목록 (기본 감시 대상이 먼저)"""
+        watches = [self.default_watch()] + [watch for watch in self.watches if watch.enabled]
+        return [watch for watch in watches if watch.is_configured()]
+    
+    def save(self, file_path: Path):
+        """설정 저장"""
+        data = {
+            'title_area': self.title_area.to_tuple() if self.title_area else None,
+            'time_area': self.time_area.to_tuple() if self.time_area else None,
+            'list_area': self.list_area.to_tuple() if self.list_area else None,
+            'keywords': self.filter_settings.keywords,
+            'exact_match': self.filter_settings.exact_match,
+            'case_sensitive': self.filter_settings.case_sensitive,
+            'fuzzy_match': self.filter_settings.fuzzy_match,
+            'fuzzy_max_distance': self.filter_settings.fuzzy_max_distance,
+            'filter_rules': self.filter_settings.rules,
+            'webhook_url': self.slack_settings.webhook_url,
+            'channel': self.slack_settings.channel,
+            'monitor_interval': self.monitor_settings.interval,
+            'similarity_threshold': self.monitor_settings.similarity_threshold,
+            'refresh_enabled': self.monitor_settings.refresh_enabled,
+            'refresh_interval': self.monitor_settings.refresh_interval,
+            'change_detector': self.monitor_settings.change_detector,
+            'change_threshold': self.monitor_settings.change_threshold,
+            'dirty_row_ocr': self.monitor_settings.dirty_row_ocr,
+            'list_mode': self.monitor_settings.list_mode,
+            'adaptive_polling': self.monitor_settings.adaptive_polling,
+            'min_interval': self.monitor_settings.min_interval,
+            'max_interval': self.monitor_settings.max_interval,
+            'backoff_factor': self.monitor_settings.backoff_factor,
+            'pipeline_enabled': self.monitor_settings.pipeline_enabled,
+            'pipeline_queue_size': self.monitor_settings.pipeline_queue_size,
+            'seen_max_entries': self.monitor_settings.seen_max_entries,
+            'seen_ttl_hours': self.monitor_settings.seen_ttl_hours,
+            'ring_dump_on_alert': self.monitor_settings.ring_dump_on_alert,
+            'ring_dump_before': self.monitor_settings.ring_dump_before,
+            'ring_dump_after': self.monitor_settings.ring_dump_after,
+            'region_tracking': self.monitor_settings.region_tracking,
+            'ocr_parallel': self.ocr_settings.parallel,
+            'ocr_max_workers': self.ocr_settings.max_workers,
+            'ocr_timeout': self.ocr_settings.timeout,
+            'ocr_backend': self.ocr_settings.backend,
+            'ocr_cache_size': self.ocr_settings.cache_size,
+            'ocr_cache_mode': self.ocr_settings.cache_mode,
+            'ocr_cache_max_distance': self.ocr_settings.cache_max_distance,
+            'ocr_confidence_threshold': self.ocr_settings.confidence_threshold,
+            'ocr_adaptive_order': self.ocr_settings.adaptive_order,
+            'ocr_preprocess_profiles': self.ocr_settings.preprocess_profiles,
+            'ocr_time_glyph_match': self.ocr_settings.time_glyph_match,
+            'ocr_time_glyph_min_reads': self.ocr_settings.time_glyph_min_reads,
+            'capture_backend': self.ocr_settings.capture_backend,
+            'capture_source': self.ocr_settings.capture_source,
+            'capture_loop': self.ocr_settings.capture_loop,
+            'capture_record': self.ocr_settings.capture_record,
+            'capture_ring_mb': self.ocr_settings.capture_ring_mb,
+            'watches': [watch.to_dict() for watch in self.watches],
+            'area_visualization': self.area_visualization
+        }
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    
+    @classmethod
+    def load(cls, file_path: Path) -> 'AppSettings':
+        """설정 로드"""
+        if not file_path.exists():
+            return cls()
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        settings = cls()
+        
+        if data.get('title_area'):
+            settings.title_area = AreaSettings.from_tuple(data['title_area'])
+        if data.get('time_area'):
+            settings.time_area = AreaSettings.from_tuple(data['time_area'])
+        if data.get('list_area'):
+            settings.list_area = AreaSettings.from_tuple(data['list_area'])
+        
+        settings.filter_settings = FilterSettings(
+            keywords=data.get('keywords', []),
+            exact_match=data.get('exact_match', False),
+            case_sensitive=data.get('case_sensitive', False),
+            fuzzy_match=data.get('fuzzy_match', False),
+            fuzzy_max_distance=data.get('fuzzy_max_distance', 1),
+            rules=data.get('filter_rules', [])
+        )
+        
+        settings.slack_settings = SlackSettings(
+            webhook_url=data.get('webhook_url', ''),
+            channel=data.get('channel', '')
+        )
+        
+        settings.monitor_settings = MonitorSettings(
+            interval=data.get('monitor_interval', 5),
+            similarity_threshold=data.get('similarity_threshold', 0.95),
+            refresh_enabled=data.get('refresh_enabled', False),
+            refresh_interval=data.get('refresh_interval', 5),
+            change_detector=data.get('change_detector', 'template'),
+            change_threshold=data.get('change_threshold', 0.0),
+            dirty_row_ocr=data.get('dirty_row_ocr', False),
+            list_mode=data.get('list_mode', False),
+            adaptive_polling=data.get('adaptive_polling', False),
+            min_interval=data.get('min_interval', 1.0),
+            max_interval=data.get('max_interval', 30.0),
+            backoff_factor=data.get('backoff_factor', 1.5),
+            pipeline_enabled=data.get('pipeline_enabled', False),
+            pipeline_queue_size=data.get('pipeline_queue_size', 2),
+            seen_max_entries=data.get('seen_max_entries', 5000),
+            seen_ttl_hours=data.get('seen_ttl_hours', 168.0),
+            ring_dump_on_alert=data.get('ring_dump_on_alert', True),
+            ring_dump_before=data.get('ring_dump_before', 60.0),
+            ring_dump_after=data.get('ring_dump_after', 10.0),
+            region_tracking=data.get('region_tracking', False)
+        )
+        
+        settings.ocr_settings = OCRSettings(
+            parallel=data.get('ocr_parallel', True),
+            max_workers=data.get('ocr_max_workers', 0),
+            timeout=data.get('ocr_timeout', 10.0),
+            backend=data.get('ocr_backend', 'auto'),
+            cache_size=data.get('ocr_cache_size', 256),
+            cache_mode=data.get('ocr_cache_mode', 'exact'),
+            cache_max_distance=data.get('ocr_cache_max_distance', 0),
+            confidence_threshold=data.get('ocr_confidence_threshold', 80.0),
+            adaptive_order=data.get('ocr_adaptive_order', True),
+            preprocess_profiles=data.get('ocr_preprocess_profiles', {}),
+            time_glyph_match=data.get('ocr_time_glyph_match', True),
+            time_glyph_min_reads=data.get('ocr_time_glyph_min_reads', 3),
+            capture_backend=data.get('capture_backend', 'imagegrab'),
+            capture_source=data.get('capture_source', ''),
+            capture_loop=data.get('capture_loop', False),
+            capture_record=data.get('capture_record', ''),
+            capture_ring_mb=data.get('capture_ring_mb', 0)
+        )
+        
+        settings.watches = [WatchSettings.from_dict(watch) for watch in data.get('watches', [])]
+        
+        settings.area_visualization = data.get('area_visualization', False)
+        
         return settings
\ No newline at end of file
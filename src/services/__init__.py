@@ -1,9 +1,9 @@
-"""
-서비스 패키지
-"""
-
-from .notification_service import NotificationService
-
-__all__ = [
-'NotificationService'
+"""
+서비스 패키지
+"""
+
+from .notification_service import NotificationService
+
+__all__ = [
+'NotificationService'
 ]
\ No newline at end of file
@@ -1,9 +1,9 @@
-"""
-UI 패키지
-"""
-
-from .main_window import MainWindow
-
-__all__ = [
-'MainWindow'
-]
+"""
+UI 패키지
+"""
+
+from .main_window import MainWindow
+
+__all__ = [
+'MainWindow'
+]
@@ -1,21 +1,21 @@
-"""
-UI 컴포넌트 패키지
-"""
-
-from .area_selector import AreaSelector
-from .filter_panel import FilterPanel
-from .slack_panel import SlackPanel
-from .monitor_panel import MonitorPanel
-from .control_panel import ControlPanel
-from .status_panel import StatusPanel
-from .log_panel import LogPanel
-
-__all__ = [
-'AreaSelector',
-'FilterPanel',
-'SlackPanel',
-'MonitorPanel',
-'ControlPanel',
-'StatusPanel',
-'LogPanel'
+"""
+UI 컴포넌트 패키지
+"""
+
+from .area_selector import AreaSelector
+from .filter_panel import FilterPanel
+from .slack_panel import SlackPanel
+from .monitor_panel import MonitorPanel
+from .control_panel import ControlPanel
+from .status_panel import StatusPanel
+from .log_panel import LogPanel
+
+__all__ = [
+'AreaSelector',
+'FilterPanel',
+'SlackPanel',
+'MonitorPanel',
+'ControlPanel',
+'StatusPanel',
+'LogPanel'
 ]
\ No newline at end of file
@@ -1,17 +1,19 @@
-"""
-유틸리티 패키지
-"""
-
-from .tesseract_checker import check_tesseract_installation
-
-__all__ = [
-'check_tesseract_installation'
-]
-"""
-pillow
-opencv-python
-pytesseract
-pyautogui
-requests
-numpy
+"""
+유틸리티 패키지
+"""
+
+from .tesseract_checker import check_tesseract_installation, find_tesseract, probe_tesseract
+
+__all__ = [
+'check_tesseract_installation',
+'find_tesseract',
+'probe_tesseract'
+]
+"""
+pillow
+opencv-python
+pytesseract
+pyautogui
+requests
+numpy
 """
\ No newline at end of file
@@ -1,37 +1,112 @@
-import os
-import pytesseract
-import logging
-from ..config import Config
-
-def check_tesseract_installation() -> bool:
-    """Tesseract 설치 확인"""
-    logger = logging.getLogger(__name__)
-    
-    # Tesseract 경로 찾기
-    tesseract_found = False
-    for path in Config.TESSERACT_PATHS:
-        if os.path.exists(path):
-            pytesseract.pytesseract.tesseract_cmd = path
-            tesseract_found = True
-            logger.info(f"✅ Tesseract 경로: {path}")
-            break
-    
-    if not tesseract_found:
-        logger.error("❌ Tesseract을 찾을 수 없습니다!")
-        return False
-    
-    # 한글 언어팩 확인
-    try:
-        languages = pytesseract.get_languages()
-        logger.info(f"설치된 언어팩: {languages}")
-        
-        if 'kor' in languages:
-            logger.info("✅ 한글 언어팩이 설치되어 있습니다.")
-            return True
-        else:
-            logger.error("❌ 한글 언어팩이 설치되어 있지 않습니다.")
-            return False
-            
-    except Exception as e:
-        logger.error(f"Tesseract 확인 중 오류: {e}")
+import os
+import re
+import json
+import logging
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from ..config import Config
+
+def find_tesseract() -> Optional[str]:
+    """설치된 Tesseract 실행 파일 경로 (없으면 None)"""
+    for path in Config.TESSERACT_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+def _probe_signature(path: str, tessdata_dir: Optional[str] = None) -> Dict:
+    """실행 파일과 tessdata 폴더 수정 시각 (언어팩을 설치하면 tessdata 시각이 바뀜)
+    
+    tessdata_dir은 tesseract가 보고한 언어팩 폴더이며, 없으면 실행 파일 옆의 tessdata를 본다.
+    TESSDATA_PREFIX가 바뀌면 tesseract가 다른 폴더를 읽으므로 값도 함께 비교한다.
+    """
+    stat = os.stat(path)
+    tessdata = tessdata_dir or os.path.join(os.path.dirname(path), "tessdata")
+    return {
+        'path': os.path.abspath(path),
+        'mtime': stat.st_mtime,
+        'size': stat.st_size,
+        'tessdata_prefix': os.environ.get('TESSDATA_PREFIX'),
+        'tessdata_dir': tessdata_dir,
+        'tessdata_mtime': os.stat(tessdata).st_mtime if os.path.isdir(tessdata) else None,
+    }
+
+def _list_languages(path: str) -> Tuple[Optional[str], List[str]]:
+    """tesseract --list-langs 결과 (언어팩 폴더, 언어 목록)
+    
+    첫 줄은 'List of available languages in "<폴더>" (N):' 형식이며,
+    폴더를 표시하지 않는 이전 버전이면 폴더는 None이다.
+    """
+    output = subprocess.run([path, '--list-langs'], capture_output=True, text=True,
+                            encoding='utf-8', errors='replace', timeout=30)
+    lines = (output.stdout or output.stderr).splitlines()
+    if not lines:
+        raise RuntimeError(f"tesseract --list-langs 출력이 없습니다 (종료 코드 {output.returncode})")
+    
+    match = re.search(r'"(.+)"', lines[0])
+    tessdata_dir = os.path.normpath(match.group(1)) if match else None
+    return tessdata_dir, [line.strip() for line in lines[1:] if line.strip()]
+
+def probe_tesseract(path: str, cache_file: Optional[Path] = None) -> Dict:
+    """Tesseract 버전과 언어팩 목록 ({'path', 'version', 'languages', ...})
+    
+    tesseract를 실행해 확인하는 데 시작할 때마다 수백 ms가 걸리므로 결과를
+    cache_file에 저장해 두고, 실행 파일 경로/크기/수정 시각과 TESSDATA_PREFIX,
+    tesseract가 보고한 언어팩 폴더의 수정 시각이 같으면 다시 실행하지 않는다.
+    한글 언어팩이 없다고 저장된 결과는 다시 확인한다.
+    """
+    cache_file = Path(cache_file or Config.TESSERACT_PROBE_FILE)
+    
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        signature = _probe_signature(path, cached.get('tessdata_dir'))
+        if all(cached.get(key) == value for key, value in signature.items()) and 'kor' in cached.get('languages', []):
+            return cached
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    import pytesseract
+    pytesseract.pytesseract.tesseract_cmd = path
+    tessdata_dir, languages = _list_languages(path)
+    result = dict(_probe_signature(path, tessdata_dir),
+                  version=str(pytesseract.get_tesseract_version()),
+                  languages=languages)
+    
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Tesseract 확인 결과 저장 실패: {e}")
+    return result
+
+def check_tesseract_installation() -> bool:
+    """Tesseract 설치 확인"""
+    logger = logging.getLogger(__name__)
+    
+    # Tesseract 경로 찾기
+    path = find_tesseract()
+    if path is None:
+        logger.error("❌ Tesseract을 찾을 수 없습니다!")
+        return False
+    
+    import pytesseract
+    pytesseract.pytesseract.tesseract_cmd = path
+    logger.info(f"✅ Tesseract 경로: {path}")
+    
+    # 한글 언어팩 확인
+    try:
+        probe = probe_tesseract(path)
+        languages = probe['languages']
+        logger.info(f"Tesseract {probe['version']}, 설치된 언어팩: {languages}")
+        
+        if 'kor' in languages:
+            logger.info("✅ 한글 언어팩이 설치되어 있습니다.")
+            return True
+        else:
+            logger.error("❌ 한글 언어팩이 설치되어 있지 않습니다.")
+            return False
+    
+    except Exception as e:
+        logger.error(f"Tesseract 확인 중 오류: {e}")
         return False
\ No newline at end of file